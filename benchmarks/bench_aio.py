@@ -0,0 +1,95 @@
+"""
+Benchmark: bumping 1,000 independent projects from an asyncio service.
+
+Compares calling the blocking ChroniqProject API straight from a coroutine
+(which stalls the event loop for every file operation) with chroniq.aio,
+which offloads the I/O to a bounded executor. A heartbeat task measures how
+much of the run the event loop spent unable to service other work.
+
+Usage:
+    python benchmarks/bench_aio.py                     # 1,000 projects
+    python benchmarks/bench_aio.py --projects 200 --workers 16
+"""
+
+import argparse
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from chroniq.aio import AsyncChroniq, default_workers  # noqa: E402
+from chroniq.project import ChroniqProject  # noqa: E402
+
+
+def make_projects(root: Path, count: int) -> list:
+    roots = []
+    for i in range(count):
+        project = root / f"repo{i:04d}"
+        project.mkdir(parents=True)
+        (project / "version.txt").write_text("1.0.0", encoding="utf-8")
+        (project / "CHANGELOG.md").write_text("# Changelog\n", encoding="utf-8")
+        roots.append(project)
+    return roots
+
+
+async def heartbeat(stop: asyncio.Event, interval: float = 0.005) -> list:
+    """Tick every `interval` and return how late each tick was (time the loop couldn't run)."""
+    loop = asyncio.get_running_loop()
+    lags = []
+    while not stop.is_set():
+        before = loop.time()
+        await asyncio.sleep(interval)
+        lags.append(max(loop.time() - before - interval, 0.0))
+    return lags
+
+
+async def run_blocking(roots) -> float:
+    for root in roots:
+        ChroniqProject(root).bump("patch", message="Release")
+        await asyncio.sleep(0)
+
+
+async def run_async(roots, workers: int) -> None:
+    async with AsyncChroniq(max_workers=workers) as chroniq:
+        results = await chroniq.bump_many(roots, "patch", message="Release")
+    failures = [r for r in results if isinstance(r, Exception)]
+    if failures:
+        raise failures[0]
+
+
+async def measure(work) -> tuple:
+    stop = asyncio.Event()
+    beat = asyncio.create_task(heartbeat(stop))
+    start = time.perf_counter()
+    await work
+    elapsed = time.perf_counter() - start
+    stop.set()
+    lags = sorted(await beat)
+    p99 = lags[int(len(lags) * 0.99)] if lags else 0.0
+    return elapsed, sum(lags) / elapsed, p99
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--projects", type=int, default=1000, help="Number of independent projects")
+    parser.add_argument("--workers", type=int, default=default_workers(), help="Executor threads for chroniq.aio")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        roots = make_projects(Path(tmpdir), args.projects)
+
+        for label, work in (
+            ("blocking in coroutine", lambda: run_blocking(roots)),
+            (f"chroniq.aio ({args.workers} workers)", lambda: run_async(roots, args.workers)),
+        ):
+            elapsed, blocked, p99 = asyncio.run(measure(work()))
+            print(f"{label:<28} {elapsed:>7.2f} s  {args.projects / elapsed:>6.0f} bumps/s  "
+                  f"loop blocked {blocked:>4.0%}  p99 tick lag {p99 * 1000:>6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
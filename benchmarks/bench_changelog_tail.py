@@ -0,0 +1,89 @@
+"""
+Benchmark: reading the tail of a huge CHANGELOG.md.
+
+Compares the old `readlines()` + filter approach with the block-wise reverse
+reader behind `chroniq log` and `get_recent_entries`.
+
+Usage:
+    python benchmarks/bench_changelog_tail.py            # 200 MB synthetic changelog
+    python benchmarks/bench_changelog_tail.py --size-mb 50
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from chroniq.changelog import tail_lines, tail_sections  # noqa: E402
+
+
+def write_synthetic_changelog(path: Path, size_mb: int) -> int:
+    """Write a changelog of roughly `size_mb` megabytes and return its section count."""
+    target = size_mb * 1024 * 1024
+    header = "# Changelog\n\nAll notable changes to this project will be documented here.\n"
+    written = 0
+    sections = 0
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(header)
+        while written < target:
+            block = []
+            for _ in range(1000):
+                major, rest = divmod(sections, 10_000)
+                minor, patch = divmod(rest, 100)
+                block.append(
+                    f"\n\n## [{major}.{minor}.{patch}] - 2025-04-19\n"
+                    f"- Added feature number {sections}\n"
+                    f"- Fixed bug number {sections}\n"
+                    f"- Changed internal detail number {sections}\n"
+                )
+                sections += 1
+            chunk = "".join(block)
+            f.write(chunk)
+            written += len(chunk)
+    return sections
+
+
+def old_tail(path: Path, limit: int):
+    """The pre-reverse-reader implementation, for comparison."""
+    with open(path, "r", encoding="utf-8") as f:
+        lines = f.readlines()
+    entries = [line.strip() for line in lines if line.strip()]
+    return entries[-limit:] if limit <= len(entries) else entries
+
+
+def measure(label, fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {elapsed * 1000:>10.2f} ms   peak {peak / 1024 / 1024:>9.2f} MiB")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=200, help="Size of the synthetic changelog")
+    parser.add_argument("--lines", type=int, default=20, help="Lines to tail")
+    parser.add_argument("--sections", type=int, default=5, help="Sections to tail")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "CHANGELOG.md"
+        print(f"Writing ~{args.size_mb} MB synthetic changelog...")
+        count = write_synthetic_changelog(path, args.size_mb)
+        print(f"{path.stat().st_size / 1024 / 1024:.1f} MiB, {count} sections\n")
+
+        old = measure(f"readlines() last {args.lines}", old_tail, path, args.lines)
+        new = measure(f"tail_lines() last {args.lines}", tail_lines, path, args.lines)
+        assert old == new, "reverse reader disagrees with readlines()"
+        measure(f"tail_sections() last {args.sections}", tail_sections, path, args.sections)
+
+
+if __name__ == "__main__":
+    main()
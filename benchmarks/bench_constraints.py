@@ -0,0 +1,78 @@
+"""
+Benchmark: answering version-range queries over a large version history.
+
+Compares testing every version against the compiled constraint (a linear
+scan) with bisecting a VersionIndex sorted once by precedence.
+
+Usage:
+    python benchmarks/bench_constraints.py                   # 100,000 versions, 200 queries
+    python benchmarks/bench_constraints.py --count 1000000 --queries 50
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from chroniq.constraints import VersionIndex, compile_constraint  # noqa: E402
+from chroniq.core import Version  # noqa: E402
+
+
+def make_versions(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    versions = set()
+    while len(versions) < count:
+        version = f"{rng.randint(0, 60)}.{rng.randint(0, 60)}.{rng.randint(0, 60)}"
+        if rng.random() < 0.1:
+            version += f"-{rng.choice(['alpha', 'beta', 'rc'])}.{rng.randint(1, 9)}"
+        versions.add(version)
+    return [Version.parse(v) for v in versions]
+
+
+def make_queries(count: int, seed: int) -> list:
+    rng = random.Random(seed + 1)
+    shapes = [
+        lambda: f"^{rng.randint(0, 60)}.{rng.randint(0, 60)}",
+        lambda: f"~{rng.randint(0, 60)}.{rng.randint(0, 60)}.{rng.randint(0, 60)}",
+        lambda: f">={rng.randint(0, 59)}.0.0,<{rng.randint(1, 60)}.0.0-0",
+    ]
+    return [compile_constraint(rng.choice(shapes)()) for _ in range(count)]
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000, help="number of distinct versions")
+    parser.add_argument("--queries", type=int, default=200, help="number of range queries")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    versions = make_versions(args.count, args.seed)
+    queries = make_queries(args.queries, args.seed)
+
+    build = timed(lambda: VersionIndex(versions))
+    index = VersionIndex(versions)
+
+    linear_hits = []
+    linear = timed(lambda: linear_hits.extend(len(q.filter(versions)) for q in queries))
+    indexed_hits = []
+    indexed = timed(lambda: indexed_hits.extend(len(index.match(q)) for q in queries))
+    assert linear_hits == indexed_hits, "linear scan and index disagree"
+
+    print(f"{args.count:,} versions, {args.queries} queries, {sum(indexed_hits):,} matches")
+    print(f"  build index (once)  {build * 1000:9.1f} ms")
+    print(f"  linear scan         {linear / args.queries * 1000:9.3f} ms/query")
+    print(f"  bisect index        {indexed / args.queries * 1000:9.3f} ms/query  ({linear / indexed:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
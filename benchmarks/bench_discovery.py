@@ -0,0 +1,62 @@
+"""
+Benchmark: finding every package in a large monorepo.
+
+Compares `Path.rglob("version.txt")` with the scandir discovery engine,
+cold (no cache) and warm (cached directory mtimes).
+
+Usage:
+    python benchmarks/bench_discovery.py                 # 400 packages, deep node_modules
+    python benchmarks/bench_discovery.py --packages 2000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from chroniq import discovery  # noqa: E402
+from chroniq.discovery import DEFAULT_IGNORE, WorkspaceScanner  # noqa: E402
+
+
+def make_tree(root: Path, packages: int, noise: int) -> None:
+    """Create packages, each with source dirs and an ignored node_modules tree."""
+    for i in range(packages):
+        package = root / "packages" / f"pkg{i:04d}"
+        (package / "src" / "lib").mkdir(parents=True)
+        (package / "version.txt").write_text("1.0.0", encoding="utf-8")
+        for j in range(noise):
+            (package / "node_modules" / f"dep{j}" / "dist").mkdir(parents=True)
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:<28} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--packages", type=int, default=400, help="Number of packages")
+    parser.add_argument("--noise", type=int, default=20, help="node_modules entries per package")
+    args = parser.parse_args()
+
+    # Directories were just created; trust their mtimes for the warm run
+    discovery.MTIME_GRACE_NS = -10**18
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        make_tree(root, args.packages, args.noise)
+
+        timed("Path.rglob('version.txt')", lambda: [p.parent for p in root.rglob("version.txt")])
+        cold = timed("scandir (cold)", lambda: WorkspaceScanner(root, DEFAULT_IGNORE).discover())
+        warm = timed("scandir (warm cache)", lambda: WorkspaceScanner(root, DEFAULT_IGNORE).discover())
+        assert cold == warm
+        print(f"\n{len(warm)} packages found")
+
+
+if __name__ == "__main__":
+    main()
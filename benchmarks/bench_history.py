@@ -0,0 +1,64 @@
+"""
+Benchmark: version history lookups with a large number of recorded bumps.
+
+Measures `version --at` (mmap + bisect), `history` (tail read) and the
+record size on disk.
+
+Usage:
+    python benchmarks/bench_history.py              # 100k recorded bumps
+    python benchmarks/bench_history.py --bumps 1000000
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from chroniq.history import HISTORY_MAGIC, HistoryRecord, VersionHistory, pack_record  # noqa: E402
+
+
+def write_synthetic_history(path: Path, bumps: int) -> None:
+    """Write `bumps` records one minute apart."""
+    start = 1_600_000_000
+    with open(path, "wb") as f:
+        f.write(HISTORY_MAGIC)
+        for i in range(bumps):
+            major, rest = divmod(i, 10_000)
+            minor, patch = divmod(rest, 100)
+            f.write(pack_record(HistoryRecord(start + 60 * i, f"{major}.{minor}.{patch}", f"{major}.{minor}.{patch + 1}", i * 80)))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bumps", type=int, default=100_000, help="Number of recorded bumps")
+    parser.add_argument("--lookups", type=int, default=10_000, help="Number of version_at lookups")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "history.bin"
+        write_synthetic_history(path, args.bumps)
+        history = VersionHistory(path)
+        print(f"{args.bumps} bumps, {path.stat().st_size / 1024 / 1024:.1f} MiB on disk\n")
+
+        moments = [random.randint(1_600_000_000, 1_600_000_000 + 60 * args.bumps) for _ in range(args.lookups)]
+        start = time.perf_counter()
+        for moment in moments:
+            history.version_at(moment)
+        per_lookup = (time.perf_counter() - start) / args.lookups
+        print(f"{'version_at()':<20} {per_lookup * 1e6:>10.1f} us per lookup")
+
+        start = time.perf_counter()
+        history.tail(20)
+        print(f"{'tail(20)':<20} {(time.perf_counter() - start) * 1e6:>10.1f} us")
+
+        start = time.perf_counter()
+        history.last()
+        print(f"{'last()':<20} {(time.perf_counter() - start) * 1e6:>10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
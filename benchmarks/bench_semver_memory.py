@@ -0,0 +1,78 @@
+"""
+Benchmark: memory held by a workspace's worth of parsed release history.
+
+Parses the same list of version strings three ways and reports, with
+tracemalloc, how much memory the resulting objects keep alive:
+
+- SemVer.from_string   mutable objects with a per-instance __dict__
+- Version.from_string  immutable __slots__ objects, one per string
+- Version.parse        the same, interned through the LRU table
+
+Usage:
+    python benchmarks/bench_semver_memory.py                     # 500,000 versions
+    python benchmarks/bench_semver_memory.py --count 1000000 --distinct 2000
+"""
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from chroniq.core import SemVer, Version, clear_intern_table, intern_stats  # noqa: E402
+
+
+def make_history(count: int, distinct: int) -> list:
+    """Version strings as a workspace history would repeat them (a few hot versions, a long tail)."""
+    rng = random.Random(42)
+    pool = []
+    while len(pool) < distinct:
+        version = f"{rng.randrange(5)}.{rng.randrange(20)}.{rng.randrange(30)}"
+        pool.append(version if rng.random() < 0.8 else f"{version}-rc.{rng.randrange(1, 5)}")
+    weights = [1 / (i + 1) for i in range(len(pool))]
+    return rng.choices(pool, weights=weights, k=count)
+
+
+def measure(parse, strings) -> tuple:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    objects = [parse(s) for s in strings]
+    elapsed = time.perf_counter() - start
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    unique = len({id(o) for o in objects})
+    del objects
+    return held, elapsed, unique
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=500_000, help="Version strings in the history")
+    parser.add_argument("--distinct", type=int, default=1_000, help="Distinct versions among them")
+    args = parser.parse_args()
+
+    strings = make_history(args.count, args.distinct)
+    baseline = None
+    for label, parse in (
+        ("SemVer.from_string", SemVer.from_string),
+        ("Version.from_string", Version.from_string),
+        ("Version.parse (interned)", Version.parse),
+    ):
+        clear_intern_table()
+        held, elapsed, unique = measure(parse, strings)
+        baseline = baseline or held
+        print(f"{label:<26} {held / 2**20:>8.1f} MiB  {held / args.count:>6.0f} B/version  "
+              f"{unique:>8,} objects  {baseline / held:>5.1f}x smaller  ({elapsed:.2f} s)")
+
+    hits, misses, maxsize, size = intern_stats()
+    print(f"intern table: {hits:,} hits, {misses:,} misses, {size:,}/{maxsize:,} entries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark: parsing version strings in bulk.
+
+Compares the original SemVer.from_string (pattern string handed to
+re.fullmatch plus a strip() on every call) with the precompiled fast path
+and with SemVer.parse_many.
+
+Usage:
+    python benchmarks/bench_semver_parse.py                  # 20,000 strings, best of 20
+    python benchmarks/bench_semver_parse.py --count 100000 --invalid 0.1
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from chroniq.core import SemVer  # noqa: E402
+
+
+def legacy_from_string(version_str: str) -> SemVer:
+    """SemVer.from_string as it was before the fast path."""
+    if not isinstance(version_str, str) or version_str.strip() != version_str:
+        raise ValueError(f"Invalid version format (whitespace): '{version_str}'")
+
+    pattern = r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-([0-9A-Za-z\-.]+))?$"
+    match = re.fullmatch(pattern, version_str)
+    if not match:
+        raise ValueError(f"Invalid version format: '{version_str}'")
+
+    major, minor, patch, prerelease = match.groups()
+    return SemVer(int(major), int(minor), int(patch), prerelease or "")
+
+
+def make_strings(count: int, invalid: float) -> list:
+    rng = random.Random(42)
+    labels = ["", "", "", "alpha.1", "beta.3", "rc.2"]
+    values = []
+    for _ in range(count):
+        if rng.random() < invalid:
+            values.append(rng.choice(["v1.2.3", "1.2", " 1.0.0", "01.2.3", "release"]))
+            continue
+        version = f"{rng.randrange(10)}.{rng.randrange(50)}.{rng.randrange(200)}"
+        label = rng.choice(labels)
+        values.append(f"{version}-{label}" if label else version)
+    return values
+
+
+def one_by_one(parse, values) -> None:
+    for value in values:
+        try:
+            parse(value)
+        except ValueError:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=20_000, help="Number of version strings")
+    parser.add_argument("--invalid", type=float, default=0.02, help="Fraction of invalid strings")
+    parser.add_argument("--repeat", type=int, default=20, help="Best of this many runs")
+    args = parser.parse_args()
+
+    values = make_strings(args.count, args.invalid)
+    runs = (
+        ("legacy from_string", lambda: one_by_one(legacy_from_string, values)),
+        ("from_string (compiled)", lambda: one_by_one(SemVer.from_string, values)),
+        ("parse_many", lambda: SemVer.parse_many(values)),
+    )
+    for label, run in runs:
+        best = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        print(f"{label:<24} {args.count / best:>12,.0f} parses/s")
+
+
+if __name__ == "__main__":
+    main()
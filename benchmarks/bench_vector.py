@@ -0,0 +1,93 @@
+"""
+Benchmark: bulk sort, max, range filter and latest-per-major over many versions.
+
+Compares one Version object at a time (sorted()/max() on sort keys, a
+compiled constraint tested per version) with chroniq.vector.VersionArray,
+using NumPy when it is installed and its pure-Python fallback otherwise.
+
+Usage:
+    python benchmarks/bench_vector.py                        # 300,000 versions, best of 5
+    python benchmarks/bench_vector.py --count 1000000 --python-only
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from chroniq.constraints import compile_constraint  # noqa: E402
+from chroniq.core import SemVer, Version  # noqa: E402
+from chroniq.vector import HAVE_NUMPY, VersionArray  # noqa: E402
+
+RANGE = ">=10.0.0,<20.0.0-0"
+
+
+def make_versions(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    labels = ["alpha.1", "alpha.2", "beta.1", "rc.1", "rc.2"]
+    versions = []
+    for _ in range(count):
+        version = f"{rng.randint(0, 40)}.{rng.randint(0, 99)}.{rng.randint(0, 999)}"
+        if rng.random() < 0.15:
+            version += f"-{rng.choice(labels)}"
+        versions.append(version)
+    return versions
+
+
+def best_of(repeat: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def scalar_ops(objects: list, constraint) -> None:
+    SemVer.sort(objects)
+    max(objects, key=lambda v: v.sort_key)
+    [v for v in objects if constraint.matches(v)]
+    latest = {}
+    for version in SemVer.sort(objects):
+        latest[version.major] = version
+
+
+def vector_ops(array: VersionArray) -> None:
+    array.sort()
+    array.max()
+    array.filter(RANGE)
+    array.latest_per_major()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=300_000, help="number of versions")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (best is kept)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--python-only", action="store_true", help="skip the NumPy backend")
+    args = parser.parse_args()
+
+    versions = make_versions(args.count, args.seed)
+    constraint = compile_constraint(RANGE)
+    objects = [Version.from_string(v) for v in versions]
+
+    print(f"{args.count:,} versions; sort + max + filter '{RANGE}' + latest per major")
+    scalar = best_of(args.repeat, lambda: scalar_ops(objects, constraint))
+    print(f"  Version objects       {scalar * 1000:9.1f} ms")
+
+    backends = [False] if args.python_only or not HAVE_NUMPY else [False, True]
+    for use_numpy in backends:
+        name = "numpy" if use_numpy else "python"
+        build = best_of(1, lambda: VersionArray(versions, use_numpy=use_numpy))
+        # A fresh array per run, so the cached sort order isn't reused between runs
+        arrays = [VersionArray(versions, use_numpy=use_numpy) for _ in range(args.repeat)]
+        ops = min(best_of(1, lambda a=a: vector_ops(a)) for a in arrays)
+        print(f"  VersionArray[{name:6}]  {ops * 1000:9.1f} ms  ({scalar / ops:.1f}x; packing {build * 1000:.0f} ms once)")
+
+
+if __name__ == "__main__":
+    main()
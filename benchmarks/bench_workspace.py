@@ -0,0 +1,62 @@
+"""
+Benchmark: bumping every package of a large monorepo.
+
+Compares one `chroniq bump` process per package (the shell-loop approach)
+with a single `chroniq bump --workspace` run.
+
+Usage:
+    python benchmarks/bench_workspace.py                  # 400 packages
+    python benchmarks/bench_workspace.py --packages 100 --sample 10
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from chroniq.discovery import discover_packages  # noqa: E402
+from chroniq.workspace import bump_workspace  # noqa: E402
+
+
+def make_workspace(root: Path, count: int) -> None:
+    for i in range(count):
+        package = root / "packages" / f"pkg{i:04d}"
+        package.mkdir(parents=True)
+        (package / "version.txt").write_text("1.0.0", encoding="utf-8")
+        (package / "CHANGELOG.md").write_text("# Changelog\n", encoding="utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--packages", type=int, default=400, help="Number of packages in the workspace")
+    parser.add_argument("--sample", type=int, default=20, help="Packages to time with one process each")
+    parser.add_argument("--jobs", type=int, default=None, help="Worker threads for the workspace run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        make_workspace(root, args.packages)
+        packages = discover_packages(root)
+        env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+
+        start = time.perf_counter()
+        for package in packages[:args.sample]:
+            subprocess.run(
+                [sys.executable, "-m", "chroniq.cli", "bump", "patch"],
+                cwd=package, input="n\n", capture_output=True, text=True, env=env, check=True,
+            )
+        per_process = (time.perf_counter() - start) / args.sample
+        print(f"{'one process each':<22} {per_process * len(packages):>8.2f} s  (extrapolated from {args.sample})")
+
+        report = bump_workspace(root, packages, level="patch", message="Workspace release", jobs=args.jobs)
+        print(f"{'bump --workspace':<22} {report.wall_time:>8.2f} s  ({report.succeeded} ok, {report.failed} failed)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# chroniq/aio.py
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+from chroniq.project import ChroniqProject
+
+
+def default_workers() -> int:
+    """Default executor size: I/O-bound work, so a few threads per core."""
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
+class AsyncChroniq:
+    """
+    asyncio front end to ChroniqProject for services handling many repositories.
+
+    Blocking file I/O runs on a bounded thread pool, so the event loop never
+    waits on disk. Calls for the same project are serialised by a per-project
+    asyncio.Lock (bumps read, then write), while different projects proceed
+    concurrently up to `max_workers` at a time. ChroniqProject instances are
+    kept per root, so config, version and changelog index stay warm.
+
+        async with AsyncChroniq() as chroniq:
+            await asyncio.gather(*(chroniq.bump(repo, "patch", message="Release") for repo in repos))
+    """
+
+    def __init__(self, max_workers: int = None):
+        self.max_workers = max_workers or default_workers()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="chroniq-aio")
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._projects: Dict[str, ChroniqProject] = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    def close(self) -> None:
+        """Shut the executor down once in-flight calls have finished."""
+        self._executor.shutdown(wait=True)
+
+    def _key(self, root) -> str:
+        return os.path.abspath(root)
+
+    def _lock(self, root) -> asyncio.Lock:
+        key = self._key(root)
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        return lock
+
+    def _project(self, root) -> ChroniqProject:
+        # Only ever called on an executor thread while the project's lock is held
+        key = self._key(root)
+        project = self._projects.get(key)
+        if project is None:
+            project = self._projects[key] = ChroniqProject(Path(root))
+        return project
+
+    async def _call(self, root, fn, *args):
+        """Run `fn(project, *args)` on the executor while holding the project's lock."""
+        def run():
+            return fn(self._project(root), *args)
+
+        async with self._lock(root):
+            return await asyncio.get_running_loop().run_in_executor(self._executor, run)
+
+    # 📦 Versions
+
+    async def load(self, root) -> str:
+        """Return the project's current version."""
+        return await self._call(root, lambda project: project.version)
+
+    async def save(self, root, version: str) -> None:
+        """
+        Set the project's version (see ChroniqProject.set_version). An
+        invalid version raises InvalidVersionError before anything runs.
+        """
+        from chroniq.core import Version
+
+        version = str(Version.parse(str(version)))
+        await self._call(root, ChroniqProject.set_version, version)
+
+    async def bump(self, root, level: str = None, pre: str = None, message="") -> str:
+        """Bump the project's version (see ChroniqProject.bump) and return the new one."""
+        return await self._call(root, ChroniqProject.bump, level, pre, message)
+
+    # 📝 Changelog and maintenance
+
+    async def add_entry(self, root, message, version: str = None):
+        """Append a changelog section (one bullet per message) for `version` or the current version."""
+        messages = [message] if isinstance(message, str) else list(message)
+        return await self._call(root, ChroniqProject.add_entries, messages, version)
+
+    async def audit(self, root, strict: bool = False):
+        """Return the project's AuditReport."""
+        return await self._call(root, ChroniqProject.audit, strict)
+
+    async def rollback(self, root, steps: int = 1, changelog: bool = True) -> List[str]:
+        """Undo the last `steps` bumps; returns the removed changelog headings."""
+        return await self._call(root, ChroniqProject.rollback, steps, changelog)
+
+    async def history(self, root, limit: int = None):
+        """Return recorded bumps, most recent first."""
+        return await self._call(root, ChroniqProject.history, limit)
+
+    async def bump_many(self, roots: Iterable, level: str = None, pre: str = None, message="") -> list:
+        """
+        Bump many projects concurrently.
+
+        Returns one entry per root, in order: the new version, or the exception
+        that project raised (one failure doesn't cancel the others).
+        """
+        return await asyncio.gather(
+            *(self.bump(root, level, pre, message) for root in roots),
+            return_exceptions=True,
+        )
@@ -1,89 +1,115 @@
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
-from chroniq.core import SemVer
+from typing import List, Optional
+from chroniq.core import SemVer, Version
 from chroniq.config import load_config
-from chroniq.utils import emoji
-import os
-import re
+from chroniq.changelog_index import ChangelogIndex
 
-console = Console()
+# How much of a changelog without any sections is searched for "# Changelog"
+PREAMBLE_LIMIT = 64 * 1024
 
-def run_audit(strict=False, config_path: Path = None):
-    """
-    Run a diagnostic scan on versioning setup, changelog state, and config health.
-    
-    Parameters:
-        strict (bool): If True, enables additional changelog format validations.
-        config_path (Path): Optional override path for config file
+
+@dataclass
+class AuditReport:
+    """Findings of an audit. Rendering is left to chroniq.presentation.render_audit."""
+    profile: str
+    strict: bool = False
+    version: Optional[str] = None
+    changelog_found: bool = False
+    current_in_changelog: bool = False
+    highest_in_changelog: Optional[str] = None
+    sections: int = 0
+    dated_sections: int = 0
+    log_dir: str = "logs"
+    log_dir_found: bool = False
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def to_dict(self) -> dict:
+        return {**asdict(self), "ok": self.ok}
+
+
+def collect_audit(root: Path, config, profile: str, strict: bool = False) -> AuditReport:
     """
-    console.print(f"\n{emoji('🕵️‍♂️', '[audit]')} [bold cyan]Chroniq Hyper Audit[/bold cyan]\n{'='*30}")
+    Run the same checks as `chroniq audit` and return them as an AuditReport.
 
-    # 🧩 Load project configuration using Chroniq's config loader
-    config, active_profile = load_config(path=config_path)
-    console.print(f"{emoji('⚙️', '[config]')} Using profile: [bold]{active_profile}[/bold]")
+    Paths from the config are resolved against `root`. Nothing is printed and
+    nothing is written apart from the changelog index sidecar.
+    """
+    root = Path(root)
+    report = AuditReport(profile=profile, strict=bool(strict or config.get("strict", False)))
+    version_path = root / config.get("version_file", "version.txt")
+    changelog_path = root / config.get("changelog_file", "CHANGELOG.md")
+    log_dir = root / config.get("log_dir", "logs")
 
-    # 📁 Resolve paths from config or use defaults
-    version_path = Path(config.get("version_file", "version.txt"))
-    changelog_path = Path(config.get("changelog_file", "CHANGELOG.md"))
-    log_dir = Path(config.get("log_dir", "logs"))
+    report.log_dir = str(config.get("log_dir", "logs"))
+    report.log_dir_found = log_dir.exists()
 
     # 🧪 Version file existence + format validation
     if not version_path.exists():
-        console.print(f"{emoji('⚠️', '[warn]')} [yellow]Missing version file:[/yellow] {version_path}")
+        report.warnings.append(f"Missing version file: {version_path}")
     else:
         try:
-            version = SemVer.load(version_path)
-            console.print(f"{emoji('📦', '[ver]')} Version file found: [bold green]{version}[/bold green]")
+            report.version = str(SemVer.read(version_path))
         except Exception as e:
-            console.print(f"{emoji('❌', '[error]')} [red]Invalid version format:[/red] {e}")
+            report.errors.append(f"Invalid version format: {e}")
 
     # 📄 Ensure the changelog file exists
     if not changelog_path.exists():
-        console.print(f"{emoji('⚠️', '[warn]')} [yellow]Missing changelog file:[/yellow] {changelog_path}")
-        return
+        report.warnings.append(f"Missing changelog file: {changelog_path}")
+        return report
 
+    # 🧭 Section lookups go through the persistent changelog index, so a
+    # changelog with thousands of releases isn't rescanned on every audit
     try:
-        with open(changelog_path, encoding="utf-8") as f:
-            content = f.read()
+        index = ChangelogIndex.load(changelog_path)
+        with open(changelog_path, "rb") as f:
+            preamble = f.read(index.entries[0].offset if index.entries else PREAMBLE_LIMIT)
     except Exception as e:
-        console.print(f"{emoji('❌', '[error]')} [red]Failed to read changelog file:[/red] {e}")
-        return
+        report.errors.append(f"Failed to read changelog file: {e}")
+        return report
 
-    if "# Changelog" not in content:
-        console.print(f"{emoji('❌', '[error]')} [red]CHANGELOG.md missing top-level heading[/red]")
+    report.changelog_found = True
+    report.sections = len(index.entries)
+    report.dated_sections = sum(1 for entry in index.entries if entry.date)
 
-    try:
-        current_version = SemVer.load(version_path)
-        if str(current_version) not in content:
-            console.print(f"{emoji('⚠️', '[warn]')} [yellow]Current version {current_version} not found in changelog[/yellow]")
-        else:
-            console.print(f"{emoji('🧾', '[log]')} CHANGELOG contains current version.")
-    except Exception as e:
-        console.print(f"{emoji('❌', '[error]')} [red]Error parsing version:[/red] {e}")
-
-    # 🔍 Extra validation when strict mode is on (from CLI or config)
-    strict_enabled = strict or config.get("strict", False)
-    if strict_enabled:
-        console.print(f"{emoji('🔍', '[strict]')} [bold]Strict mode enabled[/bold]")
-        headings = re.findall(r"^## \[(.*?)\] - (\d{4}-\d{2}-\d{2})", content, flags=re.MULTILINE)
-        if not headings:
-            console.print(f"{emoji('❗', '[warn]')} [yellow]No properly formatted changelog headings found.[/yellow]")
-        else:
-            console.print(f"{emoji('✅', '[ok]')} Found {len(headings)} valid changelog headings.")
-
-    # 📁 Ensure logs folder exists
-    if not log_dir.exists():
-        console.print(f"{emoji('📂', '[logdir]')} [yellow]Log directory not found:[/yellow] {log_dir}")
-    else:
-        console.print(f"{emoji('📂', '[logdir]')} Log directory OK: {log_dir}")
+    if b"# Changelog" not in preamble:
+        report.errors.append("CHANGELOG.md missing top-level heading")
+    if report.version:
+        report.current_in_changelog = index.has_version(report.version)
+        if not report.current_in_changelog:
+            report.warnings.append(f"Current version {report.version} not found in changelog")
+
+    # 🔢 Compare by SemVer precedence, not text (1.10.0 > 1.9.0, 2.0.0 > 2.0.0-rc.1)
+    highest = index.highest()
+    if highest is not None:
+        report.highest_in_changelog = highest.version
+        if report.version and Version.parse(highest.version) > Version.parse(report.version):
+            report.warnings.append(
+                f"Changelog has a section for {highest.version}, newer than the current version {report.version}")
+    if report.strict and not report.dated_sections:
+        report.warnings.append("No properly formatted changelog headings found.")
+    if not index.entries:
+        report.warnings.append("No version sections detected in changelog. Consider using changelog headings.")
+    return report
 
-    # 💡 Tip if not in strict mode
-    if not strict_enabled:
-        console.print(f"{emoji('💡', '[tip]')} [dim]Tip: Enable --strict or set `strict = true` in .chroniq.toml for deeper audits.[/dim]")
 
-    # 📉 Check for any version headings at all
-    if "## [" not in content:
-        console.print(f"{emoji('📉', '[warn]')} [yellow]No version sections detected in changelog. Consider using changelog headings.[/yellow]")
+def run_audit(strict=False, config_path: Path = None):
+    """
+    Run a diagnostic scan on versioning setup, changelog state, and config health.
+
+    Parameters:
+        strict (bool): If True, enables additional changelog format validations.
+        config_path (Path): Optional override path for config file
+    """
+    from chroniq.presentation import render_audit
 
-    console.print(f"\n{emoji('✅', '[done]')} [green]Audit complete.[/green]\n")
+    # 🧩 Load project configuration using Chroniq's config loader
+    config, active_profile = load_config(path=config_path)
+    report = collect_audit(Path("."), config, active_profile, strict=strict)
+    render_audit(report)
+    return report
@@ -0,0 +1,119 @@
+# chroniq/batch.py
+
+import json
+import shlex
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List
+from chroniq.errors import ChroniqError
+
+# Commands that can't be nested inside a batch
+BATCH_FORBIDDEN = ("run", "serve")
+
+
+class BatchError(ChroniqError):
+    """Raised when a batch line can't be turned into a command."""
+
+
+@dataclass
+class BatchCommand:
+    """One command of a batch: CLI arguments plus optional text for its prompts."""
+    argv: List[str]
+    input: str = ""
+    line: int = 0
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one batch command, emitted as one NDJSON object."""
+    index: int
+    argv: List[str]
+    exit_code: int
+    output: str = ""
+    stderr: str = ""
+    error: str = None
+
+    @property
+    def ok(self) -> bool:
+        return self.exit_code == 0
+
+    def to_dict(self) -> dict:
+        data = {
+            "index": self.index, "argv": self.argv, "ok": self.ok, "exit_code": self.exit_code,
+            "output": self.output, "stderr": self.stderr,
+        }
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+def parse_line(line: str, number: int = 0):
+    """
+    Turn one batch line into a BatchCommand (None for blanks and # comments).
+
+    A line is either a JSON object, `{"argv": ["bump", "minor"], "input": "y\\n"}`
+    or `{"cmd": "bump minor"}`, or a plain shell-style command line such as
+    `bump minor -m "New API"`. A leading `chroniq` word is ignored.
+    """
+    text = line.strip()
+    if not text or text.startswith("#"):
+        return None
+
+    stdin = ""
+    if text.startswith("{"):
+        try:
+            payload = json.loads(text)
+        except ValueError as e:
+            raise BatchError(f"line {number}: invalid JSON ({e})")
+        if not isinstance(payload, dict):
+            raise BatchError(f"line {number}: expected a JSON object")
+        argv = payload.get("argv")
+        if argv is None and "cmd" in payload:
+            argv = shlex.split(str(payload["cmd"]))
+        if not isinstance(argv, list) or not argv:
+            raise BatchError(f"line {number}: needs a non-empty 'argv' list or 'cmd' string")
+        argv = [str(arg) for arg in argv]
+        stdin = str(payload.get("input", ""))
+    else:
+        try:
+            argv = shlex.split(text, comments=True)
+        except ValueError as e:
+            raise BatchError(f"line {number}: {e}")
+
+    if argv and argv[0] == "chroniq":
+        argv = argv[1:]
+    if not argv:
+        return None
+    if argv[0] in BATCH_FORBIDDEN:
+        raise BatchError(f"line {number}: '{argv[0]}' can't run inside a batch")
+    return BatchCommand(argv=argv, input=stdin, line=number)
+
+
+def run_batch(lines: Iterable[str], keep_going: bool = False) -> Iterator[BatchResult]:
+    """
+    Execute batch lines one at a time, yielding a result as each finishes.
+
+    Lines are read lazily, so a command stream piped from another process is
+    executed as it arrives. Every command runs in this process against the
+    same warm configs and changelog indexes. Stops after the first failing
+    command unless `keep_going` is set.
+    """
+    import os
+    from chroniq.daemon import execute
+
+    index = 0
+    for number, line in enumerate(lines, start=1):
+        try:
+            command = parse_line(line, number)
+        except BatchError as e:
+            result = BatchResult(index=index, argv=[], exit_code=2, error=str(e))
+        else:
+            if command is None:
+                continue
+            response = execute(command.argv, os.getcwd(), command.input)
+            result = BatchResult(index=index, argv=command.argv, exit_code=response["exit_code"],
+                                 output=response["output"], stderr=response["stderr"])
+
+        yield result
+        index += 1
+        if not result.ok and not keep_going:
+            return
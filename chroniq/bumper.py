@@ -0,0 +1,66 @@
+# chroniq/bumper.py
+
+from pathlib import Path
+
+from chroniq.core import PROMOTION_CHAIN, SemVer, Version
+
+# Levels accepted by `chroniq bump`
+BUMP_LEVELS = ("patch", "minor", "major", "pre", "promote")
+
+
+def promotion_chain(config) -> tuple:
+    """The configured `prerelease_chain` (a list, or a comma-separated string), else alpha → beta → rc."""
+    chain = (config or {}).get("prerelease_chain") or PROMOTION_CHAIN
+    if isinstance(chain, str):
+        chain = [label.strip() for label in chain.split(",") if label.strip()]
+    return tuple(chain)
+
+
+def apply_bump(version: SemVer, level: str, pre: str = None, chain=PROMOTION_CHAIN) -> SemVer:
+    """
+    Apply a bump level to `version` in place and return it.
+
+    The bump rules live in Version.bump; this copies its result back into
+    the mutable SemVer that the CLI and workspace bumps work on.
+
+    Raises HistoryError if the result is too long for the history journal,
+    before anything is prompted for or written.
+    """
+    from chroniq.history import check_version_fits
+
+    bumped = Version.from_semver(version).bump(level, pre, chain)
+    check_version_fits(bumped)
+
+    version.major, version.minor, version.patch = bumped.major, bumped.minor, bumped.patch
+    version.prerelease, version.build = bumped.prerelease, bumped.build
+    return version
+
+
+def commit_bump(root: Path, previous: str, version: str, message: str = "") -> int:
+    """
+    Write a bump for the project in `root` as a single transaction.
+
+    version.txt, the changelog section (when `message` is non-empty) and the
+    history record are published together. Returns the changelog offset stored
+    in the history record (-1 without a changelog entry).
+    """
+    from chroniq import changelog
+    from chroniq.core import VERSION_FILE
+    from chroniq.history import HISTORY_PATH, VersionHistory
+    from chroniq.transaction import Transaction
+
+    root = Path(root)
+    txn = Transaction(root)
+    txn.write_text(root / VERSION_FILE, str(version))
+
+    changelog_offset = -1
+    if message:
+        # The module-level CHANGELOG_FILE is only used for the current project
+        path = changelog.CHANGELOG_FILE if root == Path(".") else root / changelog.CHANGELOG_FILE.name
+        changelog_offset = changelog.stage_entry(txn, str(version), message, path) - len(changelog.SECTION_SEPARATOR)
+
+    history = VersionHistory(root / HISTORY_PATH)
+    history.ensure()
+    txn.append_bytes(history.path, history.new_record(previous, str(version), changelog_offset))
+    txn.commit()
+    return changelog_offset
@@ -1,29 +1,207 @@
 # chroniq/changelog.py
 
+import os
+import re
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import List
-from rich import print
-from chroniq.utils import emoji  # 👈 fallback-safe emoji rendering
+from typing import Iterator, List, Optional
+from chroniq.errors import ChangelogError
 
 # Default changelog path
 CHANGELOG_FILE = Path("CHANGELOG.md")
 
+# Written at the top of every new changelog
+CHANGELOG_HEADER = "# Changelog\n\nAll notable changes to this project will be documented here.\n"
 
-def ensure_changelog_exists() -> None:
+# Matches `## [version] - YYYY-MM-DD` (the date is optional)
+HEADING_RE = re.compile(rb"^## \[(.*?)\](?: - (\d{4}-\d{2}-\d{2}))?")
+
+
+@dataclass
+class Section:
+    """
+    One `## [version] - date` block of a changelog.
+
+    - lines: the non-empty body lines (stripped), heading excluded
+    - start/end: byte span from the heading up to the next heading (or EOF)
+    - digest: content hash, only filled in when requested from the parser
+    """
+    version: str
+    date: Optional[str]
+    heading: str
+    lines: List[str] = field(default_factory=list)
+    start: int = 0
+    end: int = 0
+    digest: Optional[str] = None
+
+    @property
+    def bullets(self) -> List[str]:
+        """Return the text of the `- ` / `* ` bullet lines."""
+        return [line[2:].strip() for line in self.lines if line.startswith(("- ", "* "))]
+
+    @property
+    def span(self) -> tuple:
+        return (self.start, self.end)
+
+
+def _new_section(match, heading: bytes, start: int) -> Section:
+    return Section(
+        version=match.group(1).decode("utf-8", "replace"),
+        date=match.group(2).decode("ascii") if match.group(2) else None,
+        heading=heading.decode("utf-8", "replace").strip(),
+        start=start,
+    )
+
+
+def iter_sections(f, with_digest: bool = False) -> Iterator[Section]:
+    """
+    Parse a changelog from a *binary* file handle, yielding one Section at a time.
+
+    Runs in a single forward pass holding only the current section in memory,
+    so arbitrarily large changelogs are never materialized. Text before the
+    first heading (the preamble) is skipped. With `with_digest=True`, each
+    section also gets the content hash used by the changelog index.
+
+    Example:
+        with open("CHANGELOG.md", "rb") as f:
+            for section in iter_sections(f):
+                print(section.version, section.bullets)
+    """
+    offset = 0
+    current = None
+    hasher = None
+    pending = []  # whitespace held back until more content follows
+
+    def finish(end):
+        current.end = end
+        if hasher is not None:
+            current.digest = hasher.hexdigest()
+        return current
+
+    for raw in f:
+        match = HEADING_RE.match(raw)
+        if match:
+            if current is not None:
+                yield finish(offset)
+            current = _new_section(match, raw, offset)
+            if with_digest:
+                from chroniq.changelog_index import new_digest
+                hasher = new_digest()
+                pending = []
+        elif current is not None:
+            text = raw.decode("utf-8", "replace").strip()
+            if text:
+                current.lines.append(text)
+
+        if hasher is not None:
+            # Hash up to the last non-blank byte, so trailing blank lines
+            # (e.g. the separator before the next section) don't count
+            content = raw.rstrip()
+            if content:
+                for held in pending:
+                    hasher.update(held)
+                pending = [raw[len(content):]]
+                hasher.update(content)
+            else:
+                pending.append(raw)
+
+        offset += len(raw)
+
+    if current is not None:
+        yield finish(offset)
+
+
+def iter_changelog(path: Path = None, with_digest: bool = False) -> Iterator[Section]:
+    """
+    Open a changelog (default: CHANGELOG_FILE) and stream its sections.
+    """
+    with open(path or CHANGELOG_FILE, "rb") as f:
+        yield from iter_sections(f, with_digest=with_digest)
+
+
+def remove_span(path: Path, start: int, end: int) -> None:
+    """
+    Delete bytes [start, end) from a file without loading it into memory.
+
+    The remaining prefix and suffix are streamed into a temp file that then
+    atomically replaces the original.
+    """
+    import shutil
+    from chroniq.utils import atomic_writer
+
+    with open(path, "rb") as src, atomic_writer(path) as dst:
+        remaining = start
+        while remaining > 0:
+            chunk = src.read(min(TAIL_BLOCK_SIZE, remaining))
+            if not chunk:
+                break
+            dst.write(chunk)
+            remaining -= len(chunk)
+        src.seek(end)
+        shutil.copyfileobj(src, dst, TAIL_BLOCK_SIZE)
+
+
+def create_changelog(path: Path = None) -> bool:
+    """
+    Create the changelog with its default header if it doesn't exist yet.
+
+    Returns True if the file was created. Raises ChangelogError on failure.
+    """
+    path = Path(path or CHANGELOG_FILE)
+    if path.exists():
+        return False
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(CHANGELOG_HEADER)
+    except OSError as e:
+        raise ChangelogError(str(e)) from e
+    return True
+
+
+def ensure_changelog_exists(path: Path = None) -> None:
     """
     Ensure that the changelog file exists.
 
     If the file does not exist, it is created with a default header to help
-    guide users in documenting project changes over time.
+    guide users in documenting project changes over time. Interactive wrapper
+    around create_changelog().
     """
-    if not CHANGELOG_FILE.exists():
-        try:
-            with open(CHANGELOG_FILE, 'w', encoding='utf-8') as f:
-                f.write("# Changelog\n\nAll notable changes to this project will be documented here.\n")
-            print(f"{emoji('📄', '[file]')} [cyan]CHANGELOG.md created successfully.[/cyan]")
-        except Exception as e:
-            print(f"{emoji('❌', '[error]')} [red]Failed to create CHANGELOG.md:[/red] {e}")
+    from chroniq.presentation import notify
+
+    try:
+        if create_changelog(path):
+            notify("file", "CHANGELOG.md created successfully.")
+    except ChangelogError as e:
+        notify("error", "Failed to create CHANGELOG.md:", e)
+
+
+def append_entry(version: str, message, path: Path = None) -> int:
+    """
+    Append a changelog section for `version` without printing anything.
+
+    `message` is one entry or a list of entries. Returns the byte offset of
+    the new section. Raises ChangelogError if there is nothing to write or the
+    append fails.
+    """
+    path = Path(path or CHANGELOG_FILE)
+    messages = [message] if isinstance(message, str) else list(message)
+    if not any(m.strip() for m in messages):
+        raise ChangelogError("Changelog message is empty")
+
+    section, timestamp = _format_section(version, [m for m in messages if m.strip()])
+    index = _load_index(path)
+
+    try:
+        # Binary append keeps the recorded byte offsets exact on every platform
+        with open(path, 'ab') as f:
+            truncate_at = f.seek(0, os.SEEK_END)
+            f.write(SECTION_SEPARATOR + section)
+    except OSError as e:
+        raise ChangelogError(str(e)) from e
+
+    _record_append(path, index, version, truncate_at, section, timestamp)
+    return truncate_at + len(SECTION_SEPARATOR)
 
 
 def add_entry(version: str, message: str) -> None:
@@ -34,26 +212,405 @@ def add_entry(version: str, message: str) -> None:
     - version (str): The version identifier (e.g., "1.2.0")
     - message (str): The user-provided description of the changes made
 
-    This function appends a markdown-formatted entry to the changelog.
+    This function appends a markdown-formatted entry to the changelog and
+    reports the outcome; use append_entry() for the silent, raising version.
 
     Example:
         add_entry("0.3.1", "Fixed voice fallback timeout crash.")
     """
+    from chroniq.presentation import notify
+
     if not message.strip():
-        print(f"{emoji('⚠️', '[skip]')} [yellow]Skipped changelog update: message was empty.[/yellow]")
+        notify("skip", "Skipped changelog update: message was empty.")
         return
 
     ensure_changelog_exists()
+    try:
+        append_entry(version, message)
+    except ChangelogError as e:
+        notify("error", "Failed to write to changelog:", e)
+        return
+    notify("write", "Changelog updated with version:", version)
+
+
+def stage_entry(txn, version: str, message, path: Path = None) -> int:
+    """
+    Stage a changelog section as part of a Transaction instead of writing it now.
+    `message` may be a list to write several bullets under one heading.
+
+    Returns the byte offset the section will start at. The append record and
+    section index are updated only once the transaction has committed.
+    """
+    path = Path(path or CHANGELOG_FILE)
+    if not path.exists():
+        # Created outside the transaction: an empty changelog is harmless
+        path.write_text(CHANGELOG_HEADER, encoding="utf-8")
+    section, timestamp = _format_section(version, message)
+    index = _load_index(path)
+    truncate_at = txn.append_bytes(path, SECTION_SEPARATOR + section)
+
+    txn.on_commit(lambda: _record_append(path, index, version, truncate_at, section, timestamp))
+    return truncate_at + len(SECTION_SEPARATOR)
+
+
+# Blank line written in front of every appended section
+SECTION_SEPARATOR = b"\n\n"
+
+
+def _format_section(version: str, message):
+    """
+    Return the encoded `## [version] - date` section and its date.
+
+    `message` is one entry or a list of entries, each written as a bullet.
+    """
     timestamp = datetime.now().strftime("%Y-%m-%d")
-    entry_header = f"\n\n## [{version}] - {timestamp}\n"
-    entry_body = f"- {message.strip()}"
+    messages = [message] if isinstance(message, str) else list(message)
+    bullets = "".join(f"- {m.strip()}\n" for m in messages)
+    return f"## [{version}] - {timestamp}\n{bullets}".encode("utf-8"), timestamp
+
+
+def _load_index(path: Path):
+    """
+    Bring the section index up to date *before* the file grows, so the
+    append can be recorded incrementally instead of rescanning.
+    """
+    from chroniq.changelog_index import ChangelogIndex
 
     try:
-        with open(CHANGELOG_FILE, 'a', encoding='utf-8') as f:
-            f.write(entry_header + entry_body + "\n")
-        print(f"{emoji('📝', '[write]')} [green]Changelog updated with version:[/green] {version}")
-    except Exception as e:
-        print(f"{emoji('❌', '[error]')} [red]Failed to write to changelog:[/red] {e}")
+        return ChangelogIndex.load(path)
+    except Exception:
+        return None
+
+
+def _record_append(path: Path, index, version: str, truncate_at: int, section: bytes, timestamp: str) -> None:
+    """Update the append record and the section index after a section was appended."""
+    offset = truncate_at + len(SECTION_SEPARATOR)
+
+    # 📌 Remember where this section starts so rollback can truncate it away
+    write_append_record(path, version, truncate_at, offset, section)
+
+    if index is not None:
+        index.record_append(version, offset, section, timestamp)
+        index.save()
+
+
+# 📌 The last section add_entry appended lives in <dir>/.chroniq/<name>.append.json
+APPEND_RECORD_DIR = Path(".chroniq")
+
+
+def append_record_path(changelog_path: Path) -> Path:
+    """Return where the last-append record for this changelog is stored."""
+    changelog_path = Path(os.path.abspath(changelog_path))
+    return changelog_path.parent / APPEND_RECORD_DIR / f"{changelog_path.name}.append.json"
+
+
+# Appended sections whose digests are kept for multi-step rollbacks
+APPEND_RECORD_KEEP = 64
+
+
+def write_append_record(changelog_path: Path, version: str, truncate_at: int, offset: int, data: bytes) -> bool:
+    """
+    Record the section add_entry just appended.
+
+    - truncate_at: file size before the append (separator included)
+    - offset/length: byte span of the section itself
+    - digest: content hash checked before the section is truncated away
+
+    The top-level fields describe the latest section; `sections` also keeps
+    the last APPEND_RECORD_KEEP appends, so a rollback of several bumps can
+    verify every section it cuts.
+    """
+    import json
+    from chroniq.changelog_index import section_digest
+    from chroniq.utils import atomic_write
+
+    entry = {
+        "version": version,
+        "truncate_at": truncate_at,
+        "offset": offset,
+        "length": len(data),
+        "digest": section_digest(data),
+    }
+    # Appends at or beyond this one were rolled back (or never published)
+    earlier = [e for e in _recorded_sections(read_append_record(changelog_path)) if e["truncate_at"] < truncate_at]
+    payload = {**entry, "sections": (earlier + [entry])[-APPEND_RECORD_KEEP:]}
+
+    try:
+        atomic_write(append_record_path(changelog_path), json.dumps(payload))
+        return True
+    except OSError:
+        return False
+
+
+def _recorded_sections(record: Optional[dict]) -> List[dict]:
+    """The appended sections an append record describes, oldest first."""
+    if record is None:
+        return []
+    sections = record.get("sections")
+    if not isinstance(sections, list):
+        # Records written before `sections` existed only describe the latest append
+        sections = [{key: record.get(key) for key in ("version", "truncate_at", "offset", "length", "digest")}]
+    return [e for e in sections if isinstance(e, dict) and isinstance(e.get("truncate_at"), int)]
+
+
+def _prune_append_record(changelog_path: Path, cut: int) -> None:
+    """Forget appended sections at or beyond `cut`; the latest survivor becomes the record."""
+    import json
+    from chroniq.utils import atomic_write
+
+    kept = [e for e in _recorded_sections(read_append_record(changelog_path)) if e["truncate_at"] < cut]
+    path = append_record_path(changelog_path)
+    if not kept:
+        path.unlink(missing_ok=True)
+        return
+
+    try:
+        atomic_write(path, json.dumps({**kept[-1], "sections": kept}))
+    except OSError:
+        path.unlink(missing_ok=True)
+
+
+def read_append_record(changelog_path: Path) -> Optional[dict]:
+    """Return the last-append record, or None if missing or unreadable."""
+    import json
+
+    try:
+        record = json.loads(append_record_path(changelog_path).read_text(encoding="utf-8"))
+        return record if isinstance(record, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def _truncate_recorded_section(path: Path, version: str, index) -> Optional[str]:
+    """
+    Truncate the file at the recorded append offset, if the record still holds.
+
+    The record must name `version`, the section must still run to EOF, and
+    its bytes must hash to the recorded digest; otherwise None is returned
+    and nothing is touched.
+    """
+    from chroniq.changelog_index import section_digest
+
+    record = read_append_record(path)
+    if record is None or record.get("version") != version:
+        return None
+
+    try:
+        truncate_at, offset, length = record["truncate_at"], record["offset"], record["length"]
+        with open(path, "r+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            # Allow trailing whitespace after the section (e.g. an editor's final newline)
+            if not (offset + length <= size <= offset + length + 64) or truncate_at > offset:
+                return None
+            f.seek(offset)
+            data = f.read(size - offset)
+            if section_digest(data) != record["digest"]:
+                return None
+            f.truncate(truncate_at)
+    except (OSError, KeyError, TypeError):
+        return None
+
+    _prune_append_record(path, truncate_at)
+    if index is not None:
+        index.record_truncate(truncate_at)
+        index.save()
+    return data.split(b"\n", 1)[0].decode("utf-8", "replace").strip()
+
+
+def remove_appended_sections(path: Path, appended) -> Optional[List[str]]:
+    """
+    Truncate away sections appended by recorded bumps.
+
+    `appended` holds (version, truncate_at) pairs as stored in the version
+    history. Before anything is cut, every pair must match a section in the
+    append record, and the bytes from its offset up to the next recorded
+    section (the last one: up to EOF, give or take trailing whitespace) must
+    hash to the recorded digest. Anything written after the bumps, or an
+    edited section, fails that check: None is returned and the file is left
+    alone. Returns the removed headings, newest first.
+    """
+    from chroniq.changelog_index import ChangelogIndex, section_digest
+
+    path = Path(path)
+    appended = sorted(appended, key=lambda pair: pair[1])
+    if not appended:
+        return []
+
+    recorded = {(e.get("version"), e["truncate_at"]): e for e in _recorded_sections(read_append_record(path))}
+    try:
+        index = ChangelogIndex.load(path)
+    except Exception:
+        index = None
+
+    cut = appended[0][1]
+    headings = []
+    try:
+        with open(path, "r+b") as f:
+            size = f.seek(0, os.SEEK_END)
+            for i, (version, truncate_at) in enumerate(appended):
+                entry = recorded.get((version, truncate_at))
+                if entry is None or entry["offset"] != truncate_at + len(SECTION_SEPARATOR):
+                    return None
+                offset, length = entry["offset"], entry["length"]
+                end = appended[i + 1][1] if i + 1 < len(appended) else size
+                # Same slack as _truncate_recorded_section: trailing whitespace only
+                if not (offset + length <= end <= offset + length + 64):
+                    return None
+                f.seek(offset)
+                data = f.read(end - offset)
+                if section_digest(data) != entry["digest"]:
+                    return None
+                headings.append(data.split(b"\n", 1)[0].decode("utf-8", "replace").strip())
+            f.truncate(cut)
+    except (OSError, KeyError, TypeError):
+        return None
+
+    _prune_append_record(path, cut)
+    if index is not None:
+        index.record_truncate(cut)
+        index.save()
+    return list(reversed(headings))
+
+
+def remove_version_section(path: Path, version: str) -> Optional[str]:
+    """
+    Remove the changelog section for `version`, returning its heading (or None).
+
+    The fast path truncates at the offset recorded by add_entry after checking
+    the section's content hash, so the cost is O(section) no matter how large
+    the changelog is. Sections written by hand (or edited since) fall back to
+    the section index and a streamed rewrite around the section's span.
+    """
+    from chroniq.changelog_index import ChangelogIndex
+
+    path = Path(path)
+    version = str(version)
+
+    try:
+        index = ChangelogIndex.load(path)
+    except Exception:
+        index = None
+
+    heading = _truncate_recorded_section(path, version, index)
+    if heading is not None:
+        return heading
+
+    if index is None:
+        index = ChangelogIndex.build(path)
+    entry = index.get(version)
+    if entry is None:
+        return None
+
+    with open(path, "rb") as f:
+        f.seek(entry.offset)
+        heading = f.readline().decode("utf-8", "replace").strip()
+        start = entry.offset
+        # A middle section carries the next separator in its span; the last
+        # one doesn't, so drop the separator in front of it instead
+        if entry is index.latest():
+            lead = min(entry.offset, 2)
+            f.seek(entry.offset - lead)
+            if f.read(lead) == b"\n" * lead:
+                start -= lead
+
+    remove_span(path, start, entry.offset + entry.length)
+    return heading
+
+
+# Block size used when reading the changelog backwards from its end
+TAIL_BLOCK_SIZE = 64 * 1024
+
+
+def read_lines_reversed(f, block_size: int = TAIL_BLOCK_SIZE) -> Iterator[bytes]:
+    """
+    Yield the lines of a binary file handle from last to first.
+
+    The file is read in fixed-size blocks seeking backwards from the end, so
+    a caller that stops early only pays for the blocks it actually consumed.
+    Lines are yielded without their trailing newline.
+    """
+    for _, line in _read_lines_reversed_with_offsets(f, block_size):
+        yield line
+
+
+def _read_lines_reversed_with_offsets(f, block_size: int = TAIL_BLOCK_SIZE) -> Iterator[tuple]:
+    """Like read_lines_reversed(), but yields (byte offset, line) pairs."""
+    pos = f.seek(0, os.SEEK_END)
+    partial = b""
+
+    while pos > 0:
+        size = min(block_size, pos)
+        pos -= size
+        f.seek(pos)
+        chunk = f.read(size) + partial
+        lines = chunk.split(b"\n")
+
+        # Walk backwards from the end of the chunk to recover each line's offset
+        cursor = pos + len(chunk)
+        for line in reversed(lines[1:]):
+            cursor -= len(line)
+            yield cursor, line
+            cursor -= 1  # the newline before it
+
+        # The first piece may continue in the previous block
+        partial = lines[0]
+
+    yield 0, partial
+
+
+def tail_lines(path: Path, limit: int) -> List[str]:
+    """
+    Return the last `limit` non-empty lines of a file (stripped, oldest first).
+
+    Memory and time scale with `limit`, not with the size of the file.
+    """
+    found = []
+    if limit <= 0:
+        return found
+
+    with open(path, "rb") as f:
+        for raw in read_lines_reversed(f):
+            line = raw.decode("utf-8", "replace").strip()
+            if line:
+                found.append(line)
+                if len(found) >= limit:
+                    break
+
+    found.reverse()
+    return found
+
+
+def tail_sections(path: Path, limit: int) -> List[Section]:
+    """
+    Return the last `limit` changelog sections as Section objects, oldest first.
+
+    Reading stops as soon as `limit` headings have been seen from the end.
+    """
+    sections = []
+    if limit <= 0:
+        return sections
+
+    body = []
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        for offset, raw in _read_lines_reversed_with_offsets(f):
+            match = HEADING_RE.match(raw)
+            if match:
+                section = _new_section(match, raw, offset)
+                section.lines = body[::-1]
+                section.end = end
+                sections.append(section)
+                if len(sections) >= limit:
+                    break
+                body, end = [], offset
+                continue
+
+            line = raw.decode("utf-8", "replace").strip()
+            if line:
+                body.append(line)
+
+    sections.reverse()
+    return sections
 
 
 def get_recent_entries(limit: int = 5) -> List[str]:
@@ -71,17 +628,16 @@ def get_recent_entries(limit: int = 5) -> List[str]:
         for line in entries:
             print(line)
     """
+    from chroniq.presentation import notify
+
     if not CHANGELOG_FILE.exists():
-        print(f"{emoji('❌', '[error]')} [red]No CHANGELOG.md found. Please run `chroniq init` first.[/red]")
+        notify("error", "No CHANGELOG.md found. Please run `chroniq init` first.")
         return []
 
     try:
-        with open(CHANGELOG_FILE, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        entries = [line.strip() for line in lines if line.strip()]
-        return entries[-limit:] if limit <= len(entries) else entries
+        return tail_lines(CHANGELOG_FILE, limit)
     except Exception as e:
-        print(f"{emoji('❌', '[error]')} [red]Error reading changelog:[/red] {e}")
+        notify("error", "Error reading changelog:", e)
         return []
 
 
@@ -0,0 +1,235 @@
+# chroniq/changelog_index.py
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+# 📦 The index lives next to the changelog: <dir>/.chroniq/cache/<name>.index.json
+INDEX_DIR = Path(".chroniq") / "cache"
+
+INDEX_FORMAT = 1
+
+# 🧠 Indexes already loaded in this process, keyed by absolute changelog path.
+# Long-lived processes (e.g. `chroniq serve`) skip re-reading the sidecar
+# while the changelog's (size, mtime_ns) stays the same.
+_loaded: Dict[str, "ChangelogIndex"] = {}
+
+
+class IndexEntry(NamedTuple):
+    """
+    Location of one `## [version]` section inside the changelog.
+
+    - offset/length: byte span from the heading up to the next heading (or EOF)
+    - date: the heading date, or None if the heading has no valid date
+    - digest: hash of the section up to its last non-blank line
+    """
+    version: str
+    offset: int
+    length: int
+    date: Optional[str]
+    digest: str
+
+
+def new_digest():
+    """Return a fresh hash object for section digests."""
+    return hashlib.blake2b(digest_size=16)
+
+
+def section_digest(data: bytes) -> str:
+    """
+    Hash a section's bytes, ignoring trailing blank lines.
+
+    Trailing whitespace is excluded so that appending the blank-line
+    separator before a new section doesn't change the previous digest.
+    """
+    digest = new_digest()
+    digest.update(data.rstrip())
+    return digest.hexdigest()
+
+
+def index_path(changelog_path: Path) -> Path:
+    """Return where the sidecar index for this changelog is stored."""
+    changelog_path = Path(os.path.abspath(changelog_path))
+    return changelog_path.parent / INDEX_DIR / f"{changelog_path.name}.index.json"
+
+
+def _stat_key(changelog_path: Path):
+    """Return (size, mtime_ns) for the changelog, or None if it doesn't exist."""
+    try:
+        st = os.stat(changelog_path)
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+
+def scan_sections(f) -> List[IndexEntry]:
+    """
+    Build index entries from a binary file handle in a single pass.
+
+    Uses the streaming changelog parser, so memory stays bounded to one
+    section regardless of file size.
+    """
+    from chroniq.changelog import iter_sections
+
+    return [
+        IndexEntry(section.version, section.start, section.end - section.start, section.date, section.digest)
+        for section in iter_sections(f, with_digest=True)
+    ]
+
+
+class ChangelogIndex:
+    """
+    Persistent version → section index for a changelog file.
+
+    Lookups ("is version X present", "section X", "latest section") are
+    dictionary/list operations; the changelog itself is only rescanned when
+    its size or mtime no longer matches the index.
+    """
+
+    def __init__(self, changelog_path: Path, entries: List[IndexEntry], stamp):
+        self.path = Path(changelog_path)
+        self.entries = entries
+        self.stamp = stamp
+        self._by_version: Dict[str, IndexEntry] = {e.version: e for e in entries}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, version):
+        return str(version) in self._by_version
+
+    @classmethod
+    def build(cls, changelog_path: Path) -> "ChangelogIndex":
+        """Scan the changelog from scratch (O(file))."""
+        stamp = _stat_key(changelog_path)
+        if stamp is None:
+            return cls(changelog_path, [], None)
+        with open(changelog_path, "rb") as f:
+            entries = scan_sections(f)
+        return cls(changelog_path, entries, stamp)
+
+    @classmethod
+    def load(cls, changelog_path: Path) -> "ChangelogIndex":
+        """
+        Return a valid index for the changelog.
+
+        An index loaded earlier in this process is reused while the file's
+        size/mtime are unchanged. Otherwise the sidecar is used when its
+        recorded size/mtime match the file; if it's missing, stale or corrupt,
+        the changelog is rescanned and the sidecar rewritten.
+        """
+        stamp = _stat_key(changelog_path)
+        if stamp is None:
+            return cls(changelog_path, [], None)
+
+        key = os.path.abspath(changelog_path)
+        cached = _loaded.get(key)
+        if cached is not None and cached.stamp == stamp:
+            return cached
+
+        index = cls._load_sidecar(changelog_path, stamp)
+        _loaded[key] = index
+        return index
+
+    @classmethod
+    def _load_sidecar(cls, changelog_path: Path, stamp) -> "ChangelogIndex":
+        try:
+            payload = json.loads(index_path(changelog_path).read_text(encoding="utf-8"))
+            if payload["format"] == INDEX_FORMAT and tuple(payload["stamp"]) == stamp:
+                entries = [IndexEntry(*row) for row in payload["sections"]]
+                return cls(changelog_path, entries, stamp)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        index = cls.build(changelog_path)
+        index.save()
+        return index
+
+    def save(self) -> bool:
+        """Atomically write the sidecar. Returns False if it couldn't be written."""
+        if self.stamp is None:
+            return False
+
+        from chroniq.utils import atomic_write
+
+        payload = {
+            "format": INDEX_FORMAT,
+            "stamp": list(self.stamp),
+            "sections": [list(entry) for entry in self.entries],
+        }
+        try:
+            atomic_write(index_path(self.path), json.dumps(payload, separators=(",", ":")))
+            return True
+        except OSError:
+            return False
+
+    def has_version(self, version) -> bool:
+        """Return True if a `## [version]` heading exists."""
+        return str(version) in self._by_version
+
+    def get(self, version) -> Optional[IndexEntry]:
+        """Return the index entry for a version (the last one if duplicated)."""
+        return self._by_version.get(str(version))
+
+    def latest(self) -> Optional[IndexEntry]:
+        """Return the most recently appended section (the last one in the file)."""
+        return self.entries[-1] if self.entries else None
+
+    def highest(self) -> Optional[IndexEntry]:
+        """
+        Return the section with the greatest SemVer precedence.
+
+        Unlike latest(), this ignores file order; headings that aren't valid
+        versions are skipped.
+        """
+        from chroniq.core import Version
+
+        parsed = Version.parse_many(entry.version for entry in self.entries)
+        ranked = [(version, i) for i, version in enumerate(parsed) if isinstance(version, Version)]
+        if not ranked:
+            return None
+        return self.entries[max(ranked, key=lambda pair: pair[0].sort_key)[1]]
+
+    def read_section(self, version) -> Optional[str]:
+        """Read a single section's text by seeking straight to its offset."""
+        entry = self.get(version)
+        if entry is None:
+            return None
+        with open(self.path, "rb") as f:
+            f.seek(entry.offset)
+            return f.read(entry.length).decode("utf-8")
+
+    def record_append(self, version: str, offset: int, data: bytes, date: Optional[str]) -> None:
+        """
+        Update the index after a section was appended at `offset`.
+
+        The previous last section now extends up to the new heading; its
+        digest is unaffected because trailing blank lines aren't hashed.
+        """
+        if self.entries:
+            last = self.entries[-1]
+            self.entries[-1] = last._replace(length=offset - last.offset)
+            self._by_version[last.version] = self.entries[-1]
+
+        entry = IndexEntry(version, offset, len(data), date, section_digest(data))
+        self.entries.append(entry)
+        self._by_version[version] = entry
+        self.stamp = _stat_key(self.path)
+
+    def record_truncate(self, size: int) -> None:
+        """
+        Update the index after the changelog was truncated to `size` bytes.
+
+        Sections starting at or beyond the cut are dropped and the new last
+        section is clipped to end at EOF.
+        """
+        while self.entries and self.entries[-1].offset >= size:
+            self.entries.pop()
+        if self.entries and self.entries[-1].offset + self.entries[-1].length > size:
+            last = self.entries[-1]
+            self.entries[-1] = last._replace(length=size - last.offset)
+
+        self._by_version = {e.version: e for e in self.entries}
+        self.stamp = _stat_key(self.path)
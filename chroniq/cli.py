@@ -1,26 +1,43 @@
 import click
 import sys
-import tomli_w
-import tomllib
 
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
-from rich import print
 from chroniq.core import SemVer
-from chroniq.changelog import add_entry
-from chroniq.config import load_config, CONFIG_PATH, update_config_value, get_config_value
+from chroniq.changelog import tail_lines, tail_sections
+from chroniq.config import load_config, CONFIG_PATH, update_config_value, get_config_value, clear_config_cache
 from chroniq.utils import emoji
-from chroniq.logger import system_log, activity_log
-from chroniq.rollback import perform_rollback
 
-# Create a console with forced UTF-8 encoding for better emoji safety
-console = Console(file=sys.stdout)
+# 🐇 rich, tomli_w and the logging stack are imported inside the commands that
+# need them, so lightweight commands like `version` and `log` start fast.
 
 # Default file paths for version and changelog
 VERSION_FILE = Path("version.txt")
 CHANGELOG_FILE = Path("CHANGELOG.md")
 
+
+def get_console():
+    """
+    Return the Rich console used for command output.
+
+    Rich is only imported on first use. A console patched onto this module
+    (e.g. `patch("chroniq.cli.console", ...)` in tests) takes precedence.
+    """
+    patched = globals().get("console")
+    if patched is not None:
+        return patched
+
+    from rich.console import Console
+
+    # Bind to the *current* stdout so redirected streams are honoured
+    return Console(file=sys.stdout)
+
+
+def __getattr__(name):
+    # 💤 Lazily provide `chroniq.cli.console` for code that imports it directly
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # 🧱 Define the config command group
 @click.group()
 def config():
@@ -51,80 +68,199 @@ def main(ctx, config_path):
     # 💾 Save --config value into the context object
     ctx.obj["config_path"] = config_path or CONFIG_PATH
 
-    # 📝 Log and display initialization
-    system_log.info("Chroniq CLI initialized.")
-    console.print(f"[bold magenta]{emoji('🔮', '[start]')} Chroniq CLI initialized.[/bold magenta]")
+    # 🩹 Finish or undo a bump that was interrupted by a crash
+    from chroniq.transaction import recover
+    outcome = recover()
+    if outcome:
+        click.secho(f"{emoji('🩹', '[recover]')} Recovered an interrupted bump ({outcome}).", fg="yellow", err=True)
+
+    # 📝 Display initialization (plain click output keeps startup rich-free); on
+    # stderr, so --json and `run` output on stdout stays machine-readable
+    click.secho(f"{emoji('🔮', '[start]')} Chroniq CLI initialized.", fg="magenta", bold=True, err=True)
 
 @main.command()
 @click.argument("level", required=False)
+@click.argument("target", required=False)
 @click.option("--pre", default=None, help="Apply a prerelease label like alpha.1 or rc")
 @click.option("--silent", is_flag=True, help="Suppress output and interactive prompts.")
-def bump(level, pre, silent):
+@click.option("--workspace", is_flag=True, help="Bump every package in the workspace (or those given with --package).")
+@click.option("--package", "-p", "packages", multiple=True, type=click.Path(file_okay=False), help="Package directory to bump (repeatable, implies --workspace).")
+@click.option("--message", "-m", default="", help="Changelog entry for the bump (skips the prompt); added to each bumped package in workspace mode.")
+@click.option("--jobs", "-j", type=click.IntRange(min=1), default=None, help="Worker threads for workspace mode.")
+@click.option("--json", "as_json", is_flag=True, help="Print the workspace summary as JSON.")
+@click.option("--propagate", is_flag=True, help="Bump TARGET, then patch-bump every workspace package that depends on it.")
+def bump(level, target, pre, silent, workspace, packages, message, jobs, as_json, propagate):
     """
     Apply a version bump based on semantic versioning rules.
 
     Options:
         patch, minor, major
         pre            → Auto-increment prerelease (e.g., alpha.1 → alpha.2)
+        promote        → Next prerelease stage (alpha.3 → beta.1 → rc.1 → release)
         --pre alpha.1  → Explicitly set a prerelease label
+        -m "New API"   → Changelog entry, without asking for one
+        --workspace    → Bump many packages in one process, without prompts
+        core --propagate        → Bump package "core" and everything depending on it
+        minor core --propagate  → Same, with a minor bump for "core"
     """
+    if propagate:
+        from chroniq.bumper import BUMP_LEVELS
+
+        # `bump core --propagate` means "core" with the default level
+        if target is None and level and level.lower() not in BUMP_LEVELS:
+            level, target = None, level
+        _bump_propagate(level, target, pre, message, jobs, as_json)
+        return
+
+    if workspace or packages:
+        _bump_workspace(level, pre, packages, message, jobs, as_json)
+        return
+
+    if target:
+        get_console().print(f"{emoji('❌', '[error]')} [red]Unexpected package '{target}':[/red] use --propagate, or --package for workspace bumps.")
+        raise SystemExit(1)
+
+    from rich.panel import Panel
+    from chroniq.bumper import BUMP_LEVELS, apply_bump, commit_bump, promotion_chain
+    from chroniq.logger import system_log, activity_log
+
+    console = get_console()
     config, _ = load_config()
     silent_mode = silent or config.get("silent", False)
 
     # Use CLI arg, fallback to config value, then default to "patch"
     bump_level = (level or config.get("default_bump", "patch")).lower()
 
-    if bump_level not in ["patch", "minor", "major", "pre"]:
-        console.print(f"{emoji('❌', '[error]')} [red]Invalid bump level:[/red] '{bump_level}' — must be patch, minor, major, or pre.")
-        return
+    if bump_level not in BUMP_LEVELS:
+        console.print(f"{emoji('❌', '[error]')} [red]Invalid bump level:[/red] '{bump_level}' — must be patch, minor, major, pre, or promote.")
+        raise SystemExit(1)
 
     try:
         version = SemVer.load()
-        # 🧠 Save current version as backup before bumping
-        Path(".version.bak").write_text(str(version) + "\n", encoding="utf-8")
+        previous = str(version)
 
         if not silent_mode:
             console.print(Panel.fit(
                 f"{emoji('📦', '[version]')} Current version: [bold yellow]{version}[/bold yellow]",
                 title="Chroniq"))
 
-        # Handle the special 'pre' mode which auto-bumps or adds prerelease
-        if bump_level == "pre":
-            version.bump_prerelease(pre or "alpha")
-        else:
-            # Perform a normal version bump
-            if bump_level == "patch":
-                version.bump_patch()
-            elif bump_level == "minor":
-                version.bump_minor()
-            elif bump_level == "major":
-                version.bump_major()
-
-            # If a prerelease is passed with --pre, attach it after bumping
-            if pre:
-                version.prerelease = pre
-
-        # Save updated version to disk
-        version.save()
+        apply_bump(version, bump_level, pre, promotion_chain(config))
+
+        # ✅ Take the changelog entry up front (-m, or ask), so every file is written in one go
+        message = message.strip()
+        if not message and click.confirm("Would you like to add a changelog entry for this version?", default=True):
+            message = click.prompt(f"{emoji('🗘️', '[log]')} Describe the change", default="", show_default=False).strip()
+
+        # 🔒 Version, changelog and history record are published together or not at all
+        commit_bump(Path("."), previous, str(version), message)
+
         activity_log.info(f"Version bumped to {version}")  # ✅ Log version bump
+        if message:
+            activity_log.info(f"Changelog entry added for {version}")
 
         if not silent_mode:
             console.print(Panel.fit(
                 f"{emoji('✅', '[ok]')} New version: [bold green]{version}[/bold green]",
                 title="Version Updated"))
-
-        # ✅ Ask to add changelog entry
-        if click.confirm("Would you like to add a changelog entry for this version?", default=True):
-            message = click.prompt(f"{emoji('🗘️', '[log]')} Describe the change", default="", show_default=False)
-            if message.strip():
-                add_entry(str(version), message)
-                activity_log.info(f"Changelog entry added for {version}")
-
+            if message:
+                console.print(f"{emoji('📝', '[write]')} [green]Changelog updated with version:[/green] {version}")
 
     except Exception as e:
         console.print(f"{emoji('❌', '[error]')} [bold red]Failed to bump version:[/bold red] {e}")
         system_log.error(f"Version bump failed: {e}")
+        raise SystemExit(1)
+
+
+
+def _bump_workspace(level, pre, packages, message, jobs, as_json):
+    """Run a workspace bump and print one summary table or JSON document."""
+    from chroniq.bumper import BUMP_LEVELS
+    from chroniq.logger import activity_log
+    from chroniq.discovery import discover_packages
+    from chroniq.workspace import bump_workspace
+
+    console = get_console()
+    root = Path(".")
+
+    if level and level.lower() not in BUMP_LEVELS:
+        console.print(f"{emoji('❌', '[error]')} [red]Invalid bump level:[/red] '{level}' — must be patch, minor, major, pre, or promote.")
+        raise SystemExit(1)
+
+    selected = [Path(p) for p in packages] if packages else discover_packages(root)
+    report = bump_workspace(root, selected, level=level, pre=pre, message=message, jobs=jobs)
 
+    for result in report.results:
+        if result.ok:
+            activity_log.info(f"Workspace bump: {result.package} {result.old_version} → {result.new_version}")
+
+    _print_workspace_report(report, as_json, "Workspace bump")
+    if report.failed:
+        raise SystemExit(1)
+
+
+def _bump_propagate(level, target, pre, message, jobs, as_json):
+    """Bump one workspace package and propagate patch bumps to its dependents."""
+    from chroniq.bumper import BUMP_LEVELS
+    from chroniq.depgraph import GraphError, load_graph
+    from chroniq.discovery import discover_packages
+    from chroniq.logger import activity_log
+    from chroniq.workspace import propagate_bump
+
+    console = get_console()
+    root = Path(".")
+
+    if not target:
+        console.print(f"{emoji('❌', '[error]')} [red]--propagate needs a package:[/red] chroniq bump [level] <package> --propagate")
+        raise SystemExit(1)
+    if level and level.lower() not in BUMP_LEVELS:
+        console.print(f"{emoji('❌', '[error]')} [red]Invalid bump level:[/red] '{level}' — must be patch, minor, major, pre, or promote.")
+        raise SystemExit(1)
+
+    try:
+        graph = load_graph(root, discover_packages(root))
+        start = graph.resolve(target)
+        if start is None:
+            console.print(f"{emoji('❌', '[error]')} [red]Unknown workspace package:[/red] '{target}'")
+            raise SystemExit(1)
+        report = propagate_bump(root, graph, start, level=level, pre=pre, message=message, jobs=jobs)
+    except GraphError as e:
+        console.print(f"{emoji('❌', '[error]')} [red]{e}[/red]")
+        raise SystemExit(1)
+
+    for result in report.results:
+        if result.ok:
+            activity_log.info(f"Propagated bump: {result.package} {result.old_version} → {result.new_version}")
+
+    _print_workspace_report(report, as_json, f"Propagated bump from {start}")
+    if report.failed:
+        raise SystemExit(1)
+
+
+def _print_workspace_report(report, as_json, title):
+    """Print a WorkspaceReport as one rich table, or as a JSON document."""
+    import json
+    from rich.table import Table
+
+    if as_json:
+        click.echo(json.dumps(report.to_dict(), indent=2))
+        return
+
+    console = get_console()
+    table = Table(title=title)
+    table.add_column("Package", style="cyan")
+    table.add_column("Old", style="yellow")
+    table.add_column("New", style="green")
+    table.add_column("Status")
+    table.add_column("Time", justify="right", style="dim")
+    for result in report.results:
+        status = f"{emoji('✅', '[ok]')} ok" if result.ok else f"[red]{emoji('❌', '[error]')} {result.error}[/red]"
+        table.add_row(result.package, result.old_version or "-", result.new_version or "-", status, f"{result.seconds * 1000:.1f} ms")
+
+    console.print(table)
+    console.print(
+        f"{emoji('⏱️', '[time]')} {report.succeeded} bumped, {report.failed} failed "
+        f"in [bold]{report.wall_time:.3f}s[/bold]"
+    )
 
 
 @main.command()
@@ -135,6 +271,8 @@ def test(smoke):
 
     Use --smoke to run only smoke tests (init, bump, etc).
     """
+    console = get_console()
+
     try:
         import subprocess
 
@@ -158,6 +296,10 @@ def init():
     """
     Initialize Chroniq in your project folder by creating `version.txt` and `CHANGELOG.md`
     """
+    from chroniq.logger import activity_log
+
+    console = get_console()
+
     if VERSION_FILE.exists():
         console.print(f"{emoji('✅', '[ok]')} [green]version.txt already exists.[/green]")
     else:
@@ -175,42 +317,184 @@ def init():
 
 @main.command()
 @click.option('--lines', default=5, help='Number of recent changelog entries to display')
-def log(lines):
+@click.option('--sections', type=int, default=None, help='Show the last N version sections instead of lines')
+def log(lines, sections):
     """
     Show the latest changelog entries from the CHANGELOG.md file
+
+    The changelog is read backwards from its end, so only the requested
+    lines or sections are ever loaded.
     """
     if not CHANGELOG_FILE.exists():
-        console.print(f"{emoji('❌', '[error]')} [red]No CHANGELOG.md found. Please run `chroniq init` first.[/red]")
+        click.secho(f"{emoji('❌', '[error]')} No CHANGELOG.md found. Please run `chroniq init` first.", fg="red")
         return
 
-    with open(CHANGELOG_FILE, 'r', encoding="utf-8") as f:
-        content = f.readlines()
-
-    filtered = [line.strip() for line in content if line.strip()]
-    recent = filtered[-lines:] if lines <= len(filtered) else filtered
-
     def format_log_line(line):
         if line.startswith("Added"):
-            return f"[green]{line}[/green]"
+            return click.style(line, fg="green")
         elif line.startswith("Changed"):
-            return f"[yellow]{line}[/yellow]"
+            return click.style(line, fg="yellow")
         elif line.startswith("Fixed"):
-            return f"[red]{line}[/red]"
+            return click.style(line, fg="red")
         return line
 
-    formatted = "\n".join(format_log_line(line) for line in recent)
-    console.print(Panel.fit(formatted, title=f"{emoji('🗘️', '[log]')} Last {len(recent)} Changelog Lines"))
+    # 🐇 Plain click output: `log` is a hot path and never loads rich
+    if sections is not None:
+        recent_sections = tail_sections(CHANGELOG_FILE, sections)
+        click.secho(f"{emoji('🗘️', '[log]')} Last {len(recent_sections)} Changelog Sections", bold=True)
+        for section in recent_sections:
+            click.secho(section.heading, fg="cyan", bold=True)
+            click.echo("\n".join(format_log_line(line) for line in section.lines))
+        return
+
+    recent = tail_lines(CHANGELOG_FILE, lines)
+    click.secho(f"{emoji('🗘️', '[log]')} Last {len(recent)} Changelog Lines", bold=True)
+    click.echo("\n".join(format_log_line(line) for line in recent))
 
 @main.command()
-def version():
+@click.option("--at", "at", default=None, help="Show the version in effect at a date (YYYY-MM-DD) or ISO timestamp.")
+def version(at):
     """
     Show the current version of your project
     """
+    if at:
+        _print_version_at(at)
+        return
+
     try:
         version = SemVer.load()
-        console.print(f"{emoji('📌', '[ver]')} [bold cyan]Current project version:[/bold cyan] {version}")
+        click.echo(f"{emoji('📌', '[ver]')} {click.style('Current project version:', fg='cyan', bold=True)} {version}")
     except Exception as e:
-        console.print(f"{emoji('❌', '[error]')} [bold red]Failed to read version:[/bold red] {e}")
+        click.secho(f"{emoji('❌', '[error]')} Failed to read version: {e}", fg="red", bold=True)
+
+def _print_version_at(moment):
+    """Look up the version in effect at `moment` from the history journal."""
+    from chroniq.history import HistoryError, VersionHistory, parse_moment
+
+    try:
+        found = VersionHistory().version_at(parse_moment(moment))
+    except HistoryError as e:
+        click.secho(f"{emoji('❌', '[error]')} {e}", fg="red", bold=True)
+        return
+
+    if found is None:
+        click.secho(f"{emoji('⚠️', '[warn]')} No version history recorded yet.", fg="yellow")
+        return
+    click.echo(f"{emoji('📌', '[ver]')} {click.style(f'Version at {moment}:', fg='cyan', bold=True)} {found}")
+
+
+@main.command()
+@click.option("--limit", default=20, show_default=True, help="Number of most recent bumps to show.")
+def history(limit):
+    """
+    Show recorded version bumps, most recent first.
+    """
+    from datetime import datetime
+    from rich.table import Table
+    from chroniq.history import HistoryError, VersionHistory
+
+    console = get_console()
+    journal = VersionHistory()
+
+    try:
+        records = journal.tail(limit)
+    except HistoryError as e:
+        console.print(f"{emoji('❌', '[error]')} [red]{e}[/red]")
+        return
+
+    if not records:
+        console.print(f"{emoji('📭', '[empty]')} [yellow]No version history recorded yet.[/yellow]")
+        return
+
+    table = Table(title=f"Version history ({len(journal)} bumps)")
+    table.add_column("#", justify="right", style="dim")
+    table.add_column("When")
+    table.add_column("From", style="yellow")
+    table.add_column("To", style="green")
+    table.add_column("Changelog", justify="center")
+
+    first = len(journal) - len(records) + 1
+    for number, record in reversed(list(enumerate(records, start=first))):
+        when = datetime.fromtimestamp(record.timestamp).strftime("%Y-%m-%d %H:%M:%S")
+        entry = emoji("📝", "yes") if record.changelog_offset >= 0 else "-"
+        target = record.new_version
+        if _is_downgrade(record.old_version, record.new_version):
+            target = f"[red]{target} {emoji('⬇', '(down)')}[/red]"
+        table.add_row(str(number), when, record.old_version, target, entry)
+
+    console.print(table)
+
+@main.command("versions")
+@click.option("--match", "match", default=None, help="Only versions in a range, e.g. '^1.4', '~2.3.1' or '>=1.0.0,<2.0.0-0'.")
+@click.option("--latest", is_flag=True, help="Print only the highest matching version.")
+@click.option("--json", "as_json", is_flag=True, help="Print the versions as JSON.")
+def versions(match, latest, as_json):
+    """
+    List every version the project has been at, lowest first.
+
+    Versions come from the history journal, changelog headings and
+    version.txt. Ranges are compiled once and answered by bisecting a
+    sorted index.
+    """
+    import json
+    from chroniq.errors import ChroniqError
+    from chroniq.project import ChroniqProject
+
+    try:
+        found = ChroniqProject(Path(".")).versions(match)
+    except ChroniqError as e:
+        click.secho(f"{emoji('❌', '[error]')} {e}", fg="red", bold=True)
+        raise SystemExit(1)
+
+    if latest:
+        found = found[-1:]
+
+    if as_json:
+        click.echo(json.dumps({"match": match, "versions": found}, indent=2))
+        return
+    if not found:
+        click.secho(f"{emoji('📭', '[empty]')} No matching versions.", fg="yellow")
+        return
+    click.echo("\n".join(found))
+
+@main.command("next")
+@click.option("--count", "-n", default=1, show_default=True, type=click.IntRange(min=1), help="How many numbers to reserve.")
+@click.option("--pre", default=None, help="Number the prerelease with this label, e.g. nightly → 2.1.0-nightly.57.")
+@click.option("--build", default=None, help="Number the build metadata with this label (default: build → 2.1.0+build.912).")
+@click.option("--json", "as_json", is_flag=True, help="Print the reserved versions as JSON.")
+def next_versions(count, pre, build, as_json):
+    """
+    Reserve unique versions for parallel CI jobs, without changing version.txt.
+
+    A block of COUNT numbers is taken from a lock-protected counter in
+    .chroniq/counters.json, so concurrent calls never hand out the same one.
+    Jobs then use their versions without touching shared state again.
+    """
+    import json
+    from chroniq.core import Version
+    from chroniq.counter import reserve_versions
+    from chroniq.errors import ChroniqError
+
+    try:
+        base = Version.from_semver(SemVer.read())
+        versions = reserve_versions(Path("."), base, count, pre=pre, build=build)
+    except (ChroniqError, ValueError) as e:
+        click.secho(f"{emoji('❌', '[error]')} Failed to reserve versions: {e}", fg="red", bold=True)
+        raise SystemExit(1)
+
+    if as_json:
+        click.echo(json.dumps({"base": str(base), "versions": versions}, indent=2))
+        return
+    click.echo("\n".join(versions))
+
+def _is_downgrade(old: str, new: str) -> bool:
+    """True if `new` has lower SemVer precedence than `old` (e.g. a manual reset)."""
+    from chroniq.core import Version
+
+    old_version, new_version = Version.parse_many([old, new])
+    if not isinstance(old_version, Version) or not isinstance(new_version, Version):
+        return False
+    return new_version < old_version
 
 @main.command()
 def reset():
@@ -219,6 +503,10 @@ def reset():
     
     This is useful if you want to wipe versioning state and start over.
     """
+    from chroniq.logger import system_log, activity_log
+
+    console = get_console()
+
     try:
         # Attempt to remove version.txt
         VERSION_FILE.unlink(missing_ok=True)
@@ -239,6 +527,9 @@ def audit(strict):
     Use --strict to enable extra validations (e.g. changelog header format).
     """
     from chroniq.audit import run_audit
+    from chroniq.logger import system_log
+
+    console = get_console()
 
     try:
         config, _ = load_config()
@@ -264,7 +555,9 @@ def preview_changelog(message, date, style):
         chroniq changelog-preview --style compact --date 2025-04-15
     """
     from datetime import datetime
-    from chroniq.core import SemVer
+    from rich.panel import Panel
+
+    console = get_console()
 
     try:
         # ✅ Step 1: Load current version from version.txt
@@ -299,28 +592,37 @@ def preview_changelog(message, date, style):
 @main.command("rollback")
 @click.option("--version", "rollback_version", is_flag=True, help="Rollback only version.txt")
 @click.option("--yes", is_flag=True, help="Skip confirmation prompt")
-def rollback(rollback_version, yes):
+@click.option("--steps", default=1, show_default=True, type=click.IntRange(min=1), help="Number of bumps to undo")
+def rollback(rollback_version, yes, steps):
     """
-    Rollback the most recent version bump and optionally the latest changelog entry.
+    Rollback the most recent version bump(s) and optionally their changelog entries.
 
     By default, this will:
-    - Restore version.txt from .version.bak
-    - Remove the most recent changelog section (unless --version is passed)
+    - Restore version.txt to the version before the last `--steps` bumps
+    - Remove the changelog sections those bumps added (unless --version is passed)
 
     Examples:
         chroniq rollback
+        chroniq rollback --steps 3
         chroniq rollback --version
         chroniq rollback --yes
     """
-    perform_rollback(rollback_version=rollback_version, yes=yes)
+    from chroniq.rollback import perform_rollback
+
+    perform_rollback(rollback_version=rollback_version, yes=yes, steps=steps)
 
 @main.command("config-show")
-def config_show():
+@click.option("--cache-stats", is_flag=True, help="Also report config cache hits, misses and snapshots.")
+@click.pass_context
+def config_show(ctx, cache_stats):
     """
     Display the currently loaded Chroniq configuration, including active profile.
     """
+    console = get_console()
+    config_path = Path(ctx.obj.get("config_path", CONFIG_PATH))
+
     try:
-        config_data, active_profile = load_config()
+        config_data, active_profile = load_config(path=config_path)
 
         # Extract and show profile info
         console.print(f"{emoji('📂', '[profile]')} [bold]Active Profile:[/bold] {active_profile}")
@@ -335,10 +637,30 @@ def config_show():
             else:
                 console.print(f"{key} = {value}")
 
+        if cache_stats:
+            _print_cache_stats(console, config_path)
+
     except Exception as e:
         console.print(f"{emoji('❌', '[error]')} [red]Failed to load configuration:[/red] {e}")
 
 
+def _print_cache_stats(console, config_path):
+    """
+    Render config cache counters for this process and the snapshots kept for `config_path`.
+    """
+    from chroniq.config_snapshot import cache_stats, snapshot_path
+
+    console.print("\n[bold cyan]Config Cache:[/bold cyan]")
+    for key, value in cache_stats.items():
+        console.print(f"  [dim]{key}[/dim] = {value}")
+
+    cache_dir = snapshot_path(config_path).parent
+    snapshots = sorted(cache_dir.glob("config-*.bin")) if cache_dir.exists() else []
+    console.print(f"  [dim]snapshots[/dim] = {len(snapshots)} in {cache_dir}")
+    for snapshot in snapshots:
+        console.print(f"    {snapshot.name} ({snapshot.stat().st_size} bytes)")
+
+
 # 🧠 Define the `get` subcommand
 @config.command("get")
 @click.argument("key", required=True)
@@ -349,6 +671,9 @@ def config_get(key, profile, as_json, as_toml):
     """
     Get a configuration value by key with fallback awareness.
     """
+    from rich.panel import Panel
+
+    console = get_console()
     config_data, active_profile = load_config(profile)
     result = get_config_value(key, config_data, active_profile)
 
@@ -380,6 +705,7 @@ def config_list(profile, show_all, as_json, as_toml):
     """
     List current Chroniq configuration values with origin awareness.
     """
+    console = get_console()
     config_data, active_profile = load_config(profile)
     target_profile = profile or active_profile
 
@@ -453,10 +779,13 @@ def config_set(key, value, json_data, profile):
         chroniq config set --json '{"silent": false, "emoji_fallback": true}'
     """
     from chroniq.config import CONFIG_PATH
+    from chroniq.logger import system_log, activity_log
     import json
     import tomli_w
     import tomllib
 
+    console = get_console()
+
     try:
         # 🧱 Mixed-mode protection
         if json_data and (key or value):
@@ -507,6 +836,7 @@ def config_set(key, value, json_data, profile):
 
         with open(CONFIG_PATH, "wb") as f:
             f.write(tomli_w.dumps(config_dict).encode("utf-8"))
+        clear_config_cache(CONFIG_PATH)
 
         activity_log.info(f"Updated config via CLI set: {list(updates.keys())}")
 
@@ -530,7 +860,9 @@ def config_delete(ctx, keys, profile, yes):
     """
     import tomli_w
     import tomllib
-    from pathlib import Path
+    from chroniq.logger import system_log, activity_log
+
+    console = get_console()
     config_path = Path(ctx.obj.get("config_path", ".chroniq.toml"))
 
     try:
@@ -569,6 +901,7 @@ def config_delete(ctx, keys, profile, yes):
         if deleted:
             with open(config_path, "wb") as f:
                 f.write(tomli_w.dumps(config_dict).encode("utf-8"))
+            clear_config_cache(config_path)
             for key in deleted:
                 console.print(f"{emoji('🗑️')} Deleted [bold red]{key}[/bold red]")
             activity_log.info(f"Deleted config keys: {deleted}")
@@ -584,5 +917,119 @@ def config_delete(ctx, keys, profile, yes):
 
 main.add_command(config)
 
+
+# 🧱 Workspace (monorepo) commands
+@main.group("workspace")
+def workspace_group():
+    """Inspect the packages in a multi-package workspace."""
+    pass
+
+
+@workspace_group.command("list")
+@click.option("--refresh", is_flag=True, help="Ignore the discovery cache and rescan the whole tree.")
+@click.option("--json", "as_json", is_flag=True, help="Print the package list as JSON.")
+def workspace_list(refresh, as_json):
+    """
+    List every package (directory with version.txt or .chroniq.toml) below the current directory.
+
+    Discovery is cached in .chroniq/cache/workspace.json; later runs only
+    rescan directories whose mtime changed.
+    """
+    import json
+    from chroniq.discovery import WorkspaceScanner, workspace_ignore
+    from chroniq.workspace import package_name
+
+    root = Path(".")
+    scanner = WorkspaceScanner(root, workspace_ignore(root))
+    packages = scanner.discover(use_cache=not refresh)
+
+    rows = []
+    for package in packages:
+        try:
+            version = (package / VERSION_FILE).read_text(encoding="utf-8").strip()
+        except OSError:
+            version = None
+        rows.append({"package": package_name(root, package), "version": version})
+
+    if as_json:
+        click.echo(json.dumps({"packages": rows, **scanner.stats}, indent=2))
+        return
+
+    from rich.table import Table
+
+    console = get_console()
+    table = Table(title=f"Workspace packages ({len(rows)})")
+    table.add_column("Package", style="cyan")
+    table.add_column("Version", style="green")
+    for row in rows:
+        table.add_row(row["package"], row["version"] or "-")
+    console.print(table)
+    console.print(f"[dim]{scanner.stats['dirs']} directories, {scanner.stats['rescanned']} rescanned[/dim]")
+
+
+# 📜 Batch mode: many commands, one process
+@main.command("run")
+@click.argument("script", required=False, default="-", type=click.File("r", encoding="utf-8"))
+@click.option("--keep-going", is_flag=True, help="Run the remaining commands after one fails.")
+def run_script(script, keep_going):
+    """
+    Run a script of Chroniq commands in a single process.
+
+    SCRIPT (default: stdin) holds one command per line, either plain
+    (`bump minor -m "New API"`) or NDJSON (`{"argv": ["audit", "--strict"]}`).
+    One JSON result object is printed per command, as soon as it finishes.
+    Stops at the first failure unless --keep-going is given.
+    """
+    import json
+    from chroniq.batch import run_batch
+
+    failed = False
+    for result in run_batch(script, keep_going=keep_going):
+        click.echo(json.dumps(result.to_dict()))
+        sys.stdout.flush()
+        failed = failed or not result.ok
+
+    if failed:
+        raise SystemExit(1)
+
+
+# 🔌 Long-running daemon for the thin client
+@main.command("serve")
+@click.option("--socket", "socket_file", type=click.Path(dir_okay=False), help="Unix socket to listen on (default: $CHRONIQ_SOCKET or a per-user socket).")
+@click.option("--stop", is_flag=True, help="Ask a running daemon to shut down.")
+def serve(socket_file, stop):
+    """
+    Keep Chroniq loaded in a background process.
+
+    `chroniq-client` forwards bump/version/log/audit to the daemon, skipping
+    interpreter startup and reusing warm config and changelog caches.
+    """
+    import os
+    from chroniq.daemon import create_server, request, socket_path
+
+    path = Path(socket_file) if socket_file else socket_path()
+    if stop:
+        if request({"op": "shutdown"}, path=path, timeout=5) is None:
+            click.echo(f"No Chroniq daemon is listening on {path}")
+            raise SystemExit(1)
+        click.echo(f"Stopped Chroniq daemon on {path}")
+        return
+
+    try:
+        server = create_server(path)
+    except (RuntimeError, OSError) as e:
+        click.echo(f"Error: {e}")
+        raise SystemExit(1)
+
+    click.echo(f"Chroniq daemon listening on {path} (pid {os.getpid()})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        path.unlink(missing_ok=True)
+
+
 if __name__ == "__main__":
     main()
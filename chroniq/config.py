@@ -1,10 +1,8 @@
-import tomllib  # built-in TOML parser in Python 3.11+
-import json
-import tomli_w
+import os
 from pathlib import Path
-from rich import print
-from chroniq.utils import emoji
-from chroniq.logger import system_log, activity_log 
+
+# 🐇 tomllib, tomli_w and the logger are imported inside the functions that use
+# them, so importing this module (e.g. for CONFIG_PATH) stays cheap.
 
 
 # Default config file path (can later support multiple tiers)
@@ -19,30 +17,160 @@ def deep_merge(base, update):
             base[key] = value
     return base
 
+class FrozenConfig(dict):
+    """
+    Read-only dict returned by load_config().
+
+    Resolved configs are cached and shared between callers, so mutation is
+    blocked. Use thaw_config() to get a plain, mutable copy.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Chroniq config is read-only; use thaw_config() to get a mutable copy.")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        # dict.__init__ fills the mapping without going through __setitem__
+        return (type(self), (dict(self),))
+
+    def __deepcopy__(self, memo):
+        return thaw_config(self)
+
+
+def freeze_config(value):
+    """Recursively convert dicts/lists into FrozenConfig/tuples."""
+    if isinstance(value, dict):
+        return FrozenConfig({k: freeze_config(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze_config(v) for v in value)
+    return value
+
+
+def thaw_config(value):
+    """Recursively convert a frozen config back into plain dicts/lists."""
+    if isinstance(value, dict):
+        return {k: thaw_config(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw_config(v) for v in value]
+    return value
+
+
+# 🧠 In-process cache: (abs path, profile) → ((mtime_ns, size), (config, active_profile))
+_config_cache = {}
+
+
+def _stat_key(config_path: Path):
+    """Return (mtime_ns, size) for the config file, or None if it doesn't exist."""
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def clear_config_cache(path: Path = None) -> None:
+    """
+    Drop memoized configs.
+
+    Pass a path to forget that file, including its on-disk snapshots; with no
+    argument the whole in-process cache is cleared (useful for long-running
+    processes embedding Chroniq).
+    """
+    if path is None:
+        _config_cache.clear()
+        return
+
+    from chroniq.config_snapshot import clear_snapshots
+
+    target = os.path.abspath(path)
+    for cache_key in [k for k in _config_cache if k[0] == target]:
+        del _config_cache[cache_key]
+    clear_snapshots(path)
+
+
 def load_config(profile: str = None, path: Path = None):
     """
     Load the Chroniq configuration from .chroniq.toml.
+    Returns a tuple of (merged_config: FrozenConfig, active_profile: str)
+
+    Results are memoized per (path, mtime_ns, size, profile), so repeated calls
+    within one command only stat the file. Across invocations, an on-disk
+    snapshot (see chroniq.config_snapshot) skips the TOML parse when the file
+    is unchanged. The returned config is read-only.
+    """
+    config_path = Path(path or CONFIG_PATH)
+    cache_key = (os.path.abspath(config_path), profile)
+    stamp = _stat_key(config_path)
+
+    cached = _config_cache.get(cache_key)
+    if cached is not None and cached[0] == stamp:
+        from chroniq.config_snapshot import cache_stats
+        cache_stats["memory_hits"] += 1
+        return cached[1]
+
+    if stamp is None:
+        # 📭 No config file: defaults are cheap, nothing to snapshot
+        merged_config, active_profile, _ = _resolve_config(config_path, profile, raw=None)
+    else:
+        merged_config, active_profile = _load_via_snapshot(config_path, profile, stamp)
+
+    result = (freeze_config(merged_config), active_profile)
+    _config_cache[cache_key] = (stamp, result)
+    return result
+
+
+def _load_via_snapshot(config_path: Path, profile: str, stamp: tuple):
+    """
+    Serve a resolved config from its on-disk snapshot, or parse and snapshot it.
     Returns a tuple of (merged_config: dict, active_profile: str)
     """
+    from chroniq.config_snapshot import cache_stats, read_snapshot, write_snapshot
+
+    snapshot, raw = read_snapshot(config_path, profile, stamp)
+    if snapshot is not None:
+        cache_stats["snapshot_hits"] += 1
+        return snapshot
+
+    cache_stats["misses"] += 1
+    try:
+        if raw is None:
+            raw = config_path.read_bytes()
+    except OSError:
+        raw = None
+
+    merged_config, active_profile, parsed = _resolve_config(config_path, profile, raw=raw)
+
+    # 💾 Only snapshot configs that actually parsed
+    if parsed:
+        write_snapshot(config_path, profile, stamp, raw, merged_config, active_profile)
+
+    return merged_config, active_profile
+
+
+def _resolve_config(config_path: Path, profile: str = None, raw: bytes = None):
+    """
+    Parse .chroniq.toml bytes and merge them over DEFAULT_CONFIG and the active profile.
+    Returns a tuple of (merged_config: dict, active_profile: str, parsed: bool)
+    """
+    import tomllib  # built-in TOML parser in Python 3.11+
     from chroniq.logger import system_log
     from chroniq.defaults import DEFAULT_CONFIG
 
-    config_path = path or CONFIG_PATH
-
     # 🧱 Start with full default config
     merged_config = DEFAULT_CONFIG.copy()
 
     # 📭 If config file doesn't exist, just return the defaults
-    if not config_path.exists():
-        return merged_config, "default"
+    if raw is None:
+        return merged_config, "default", False
 
     try:
-        # 📖 Load the .toml file using Python's built-in TOML reader
-        with open(config_path, "rb") as f:
-            config_data = tomllib.load(f)
+        # 📖 Parse the .toml bytes using Python's built-in TOML reader
+        config_data = tomllib.loads(raw.decode("utf-8"))
     except Exception as e:
         system_log.error(f"Failed to load .chroniq.toml: {e}")
-        return merged_config, "default"
+        return merged_config, "default", False
 
     # 🧠 Determine the active profile (CLI override > config file > fallback to "default")
     active_profile = profile or config_data.get("active_profile", "default")
@@ -68,7 +196,7 @@ def load_config(profile: str = None, path: Path = None):
                 value = value.strip().lower() == "true"
             merged_config[key] = value
 
-    return merged_config, active_profile
+    return merged_config, active_profile, True
 
 
 def update_config_value(key, value, config_path=CONFIG_PATH):
@@ -76,7 +204,11 @@ def update_config_value(key, value, config_path=CONFIG_PATH):
     Update a value in the .chroniq.toml configuration file.
     Supports nested keys using dot notation (e.g., 'profile.dev.silent').
     """
+    import tomli_w
+    from chroniq.logger import system_log, activity_log
+
     existing, _ = load_config(path=config_path)
+    existing = thaw_config(existing)
 
     # 🔍 Traverse into nested dicts if using dot notation
     parts = key.split(".")
@@ -115,6 +247,7 @@ def update_config_value(key, value, config_path=CONFIG_PATH):
     try:
         with open(config_path, "wb") as f:
             f.write(tomli_w.dumps(existing).encode("utf-8"))
+        clear_config_cache(config_path)
         activity_log.info(f"Updated config key '{key}' to '{val}'")
         return True
     except Exception as e:
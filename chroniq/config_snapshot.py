@@ -0,0 +1,141 @@
+# chroniq/config_snapshot.py
+
+import hashlib
+import marshal
+import os
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+# 📦 Snapshots live next to the config file: <project>/.chroniq/cache/config-<profile>.bin
+SNAPSHOT_DIR = Path(".chroniq") / "cache"
+
+SNAPSHOT_FORMAT = 1
+
+# 📊 Per-process counters, reported by `chroniq config-show --cache-stats`
+cache_stats = {
+    "memory_hits": 0,    # served from the in-process cache
+    "snapshot_hits": 0,  # served from an on-disk snapshot (no TOML parse)
+    "misses": 0,         # parsed from .chroniq.toml
+    "stale": 0,          # snapshot existed but the source had changed
+    "corrupt": 0,        # snapshot existed but could not be read
+}
+
+
+@lru_cache(maxsize=1)
+def _fingerprint() -> str:
+    """
+    Identify everything besides the source file that a snapshot depends on.
+
+    marshal output is interpreter-specific and snapshots embed DEFAULT_CONFIG,
+    so either changing invalidates every snapshot.
+    """
+    from chroniq.defaults import DEFAULT_CONFIG
+
+    return f"{SNAPSHOT_FORMAT}:{sys.version_info[:2]}:{marshal.version}:{sorted(DEFAULT_CONFIG.items())!r}"
+
+
+def snapshot_path(config_path: Path, profile: str = None) -> Path:
+    """
+    Return where the snapshot for this config file and profile is stored.
+
+    `profile=None` (use the file's active_profile) gets its own snapshot.
+    """
+    root = Path(os.path.abspath(config_path)).parent
+    name = re.sub(r"[^A-Za-z0-9_.-]", "_", profile) if profile else "_active"
+    return root / SNAPSHOT_DIR / f"config-{name}.bin"
+
+
+def content_hash(raw: bytes) -> str:
+    """Return the hex digest used to validate a snapshot against its source."""
+    return hashlib.sha256(raw).hexdigest()
+
+
+def read_snapshot(config_path: Path, profile: str, stamp: tuple):
+    """
+    Try to serve a resolved config from its on-disk snapshot.
+
+    Returns a tuple of (result, raw):
+    - result: (merged_config: dict, active_profile: str), or None on a miss
+    - raw: the source file bytes if they had to be read, so a miss can reuse them
+
+    A snapshot whose stat stamp matches is trusted without reading the source.
+    If only the stamp differs (e.g. a `touch` or checkout), the content hash
+    decides, and a match refreshes the stamp for next time.
+    """
+    path = snapshot_path(config_path, profile)
+
+    try:
+        payload = marshal.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None, None
+    except Exception:
+        cache_stats["corrupt"] += 1
+        return None, None
+
+    try:
+        valid = (
+            payload["fingerprint"] == _fingerprint()
+            and payload["source"] == os.path.abspath(config_path)
+            and payload["profile"] == profile
+        )
+        result = (payload["config"], payload["active_profile"])
+    except (KeyError, TypeError):
+        cache_stats["corrupt"] += 1
+        return None, None
+
+    if not valid:
+        cache_stats["stale"] += 1
+        return None, None
+
+    if tuple(payload["stamp"]) == stamp:
+        return result, None
+
+    # 🔍 Stat changed: fall back to comparing the content hash
+    try:
+        raw = Path(config_path).read_bytes()
+    except OSError:
+        return None, None
+
+    if content_hash(raw) != payload["hash"]:
+        cache_stats["stale"] += 1
+        return None, raw
+
+    write_snapshot(config_path, profile, stamp, raw, *result)
+    return result, None
+
+
+def write_snapshot(config_path: Path, profile: str, stamp: tuple, raw: bytes,
+                   merged_config: dict, active_profile: str) -> bool:
+    """
+    Atomically write a snapshot of a resolved config.
+
+    Returns False (and leaves no partial file) when the config holds values
+    marshal can't store (e.g. TOML datetimes) or the cache dir isn't writable.
+    """
+    path = snapshot_path(config_path, profile)
+    payload = {
+        "fingerprint": _fingerprint(),
+        "source": os.path.abspath(config_path),
+        "profile": profile,
+        "stamp": list(stamp),
+        "hash": content_hash(raw),
+        "config": merged_config,
+        "active_profile": active_profile,
+    }
+
+    from chroniq.utils import atomic_write
+
+    try:
+        atomic_write(path, marshal.dumps(payload))
+        return True
+    except (ValueError, OSError):
+        return False
+
+
+def clear_snapshots(config_path: Path) -> None:
+    """Delete every profile snapshot belonging to this config file's project."""
+    cache_dir = snapshot_path(config_path).parent
+    for snapshot in cache_dir.glob("config-*.bin"):
+        snapshot.unlink(missing_ok=True)
@@ -0,0 +1,274 @@
+# chroniq/constraints.py
+
+import re
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional
+
+from chroniq.core import Version, prerelease_key
+from chroniq.errors import ChroniqError
+
+# One comparator: optional operator, then a full or partial version (1, 1.4, 1.4.x, *)
+_COMPARATOR_RE = re.compile(
+    r"(\^|~|>=|<=|>|<|=)?\s*"
+    r"(?:v)?(\d+|[xX*])(?:\.(\d+|[xX*]))?(?:\.(\d+|[xX*]))?"
+    r"(?:-([0-9A-Za-z\-.]+))?"
+)
+
+# Lowest possible prerelease: "<2.0.0-0" also shuts out 2.0.0's prereleases
+_MIN_PRERELEASE = "0"
+
+
+class ConstraintError(ChroniqError):
+    """Raised when a version range can't be parsed."""
+
+
+def _key(major: int, minor: int, patch: int, prerelease: str = "") -> tuple:
+    return (major, minor, patch, prerelease_key(prerelease))
+
+
+class Interval(NamedTuple):
+    """
+    A contiguous range of versions, as bounds on their precedence keys.
+
+    None means unbounded on that side.
+    """
+    low: Optional[tuple] = None
+    low_inclusive: bool = True
+    high: Optional[tuple] = None
+    high_inclusive: bool = False
+
+    def contains(self, key: tuple) -> bool:
+        if self.low is not None and (key < self.low or (key == self.low and not self.low_inclusive)):
+            return False
+        if self.high is not None and (key > self.high or (key == self.high and not self.high_inclusive)):
+            return False
+        return True
+
+    def intersect(self, other: "Interval") -> "Interval":
+        low, low_inclusive = self.low, self.low_inclusive
+        if other.low is not None and (low is None or other.low > low or (other.low == low and not other.low_inclusive)):
+            low, low_inclusive = other.low, other.low_inclusive
+
+        high, high_inclusive = self.high, self.high_inclusive
+        if other.high is not None and (high is None or other.high < high or (other.high == high and not other.high_inclusive)):
+            high, high_inclusive = other.high, other.high_inclusive
+        return Interval(low, low_inclusive, high, high_inclusive)
+
+    @property
+    def empty(self) -> bool:
+        if self.low is None or self.high is None:
+            return False
+        return self.low > self.high or (self.low == self.high and not (self.low_inclusive and self.high_inclusive))
+
+
+# Matches nothing (used for >* and <*); compile_constraint drops empty intervals
+_EMPTY = Interval(_key(0, 0, 0, _MIN_PRERELEASE), False, _key(0, 0, 0, _MIN_PRERELEASE), False)
+
+
+def _comparator(text: str) -> Interval:
+    """Compile one comparator (`^1.4`, `>=1.0.0`, `1.2.x`, ...) into an Interval."""
+    match = _COMPARATOR_RE.fullmatch(text)
+    if not match:
+        raise ConstraintError(f"Invalid version constraint: '{text}'")
+
+    op, *parts, prerelease = match.groups()
+    prerelease = prerelease or ""
+    wildcard = [p is None or p in "xX*" for p in parts]
+    # Everything after the first wildcard is a wildcard too (1.x.3 means 1.x)
+    given = wildcard.index(True) if True in wildcard else 3
+    numbers = [int(p) for p in parts[:given]] + [0] * (3 - given)
+    if prerelease and given < 3:
+        raise ConstraintError(f"A prerelease needs a full version: '{text}'")
+
+    if given == 0:
+        # A bare wildcard is every version: ^* ~* >=* <=* =* match all, >* <* nothing
+        return _EMPTY if op in (">", "<") else Interval()
+
+    major, minor, patch = numbers
+    exact = _key(major, minor, patch, prerelease)
+
+    if op in (None, "="):
+        if given == 3:
+            return Interval(exact, True, exact, True)
+        return Interval(exact, True, _next(numbers, given - 1), False)
+
+    if op == "^":
+        # Allow changes that don't touch the first non-zero component of those given
+        first_nonzero = next((i for i, n in enumerate(numbers[:given]) if n), None)
+        if first_nonzero is None:
+            first_nonzero = given - 1
+        return Interval(exact, True, _next(numbers, first_nonzero), False)
+
+    if op == "~":
+        # Patch-level changes if a minor was given, otherwise minor-level
+        return Interval(exact, True, _next(numbers, 1 if given >= 2 else 0), False)
+
+    if op == ">=":
+        return Interval(low=exact, low_inclusive=True)
+    if op == "<":
+        return Interval(high=exact, high_inclusive=False)
+    if op == ">":
+        # >1.4 means above every 1.4.x
+        return Interval(low=exact, low_inclusive=False) if given == 3 else Interval(low=_next(numbers, given - 1))
+    # "<=": <=1.4 includes every 1.4.x
+    return Interval(high=exact, high_inclusive=True) if given == 3 else Interval(high=_next(numbers, given - 1))
+
+
+def _next(numbers: List[int], position: int) -> tuple:
+    """Key of the lowest version after every X.Y.Z sharing numbers[:position + 1]."""
+    bumped = numbers[:position] + [numbers[position] + 1] + [0] * (2 - position)
+    return _key(*bumped, _MIN_PRERELEASE)
+
+
+class Constraint:
+    """
+    A compiled version range: a union of Intervals.
+
+    Syntax (npm/Cargo style):
+        1.4.2  =1.4.2          exactly that version
+        1.4  1.4.x  1.*        any 1.4.z (any 1.y.z)
+        ^1.4  ^0.2.3           compatible: <2.0.0, <0.3.0
+        ~2.3.1  ~2.3  ~2       patch-level (~2: minor-level) changes
+        >=1.0.0,<2.0.0-0       comparators joined by commas or spaces intersect
+        ^1.4 || ^2             alternatives joined by || are unioned
+
+    Upper bounds like <2.0.0-0 exclude 2.0.0's prereleases. Unlike npm,
+    prereleases inside the range always match.
+    """
+
+    def __init__(self, text: str, intervals: List[Interval]):
+        self.text = text
+        self.intervals = intervals
+
+    @classmethod
+    def parse(cls, text: str) -> "Constraint":
+        """Compile a range string (memoised; see compile_constraint)."""
+        return compile_constraint(text)
+
+    def __repr__(self):
+        return f"Constraint('{self.text}')"
+
+    def matches(self, version) -> bool:
+        """True if `version` (a string, SemVer or Version) lies in the range."""
+        if isinstance(version, str):
+            version = Version.parse(version)
+        key = version.sort_key
+        return any(interval.contains(key) for interval in self.intervals)
+
+    __contains__ = matches
+
+    def filter(self, versions: Iterable) -> list:
+        """Linear-scan filter, for small or unsorted inputs."""
+        return [v for v in versions if self.matches(v)]
+
+
+@lru_cache(maxsize=256)
+def compile_constraint(text: str) -> Constraint:
+    """Parse a range string into a Constraint; repeated ranges are compiled once."""
+    if not isinstance(text, str) or not text.strip():
+        raise ConstraintError("Empty version constraint")
+
+    intervals = []
+    for alternative in text.split("||"):
+        # Let "> = 1.0" and ">=1.0" both work, then split on commas/whitespace
+        tokens = re.sub(r"(\^|~|>=|<=|>|<|=)\s+", r"\1", alternative.replace(",", " ")).split()
+        if not tokens:
+            raise ConstraintError(f"Empty alternative in version constraint: '{text}'")
+        interval = Interval()
+        for token in tokens:
+            interval = interval.intersect(_comparator(token))
+        if not interval.empty:
+            intervals.append(interval)
+    return Constraint(text, intervals)
+
+
+class VersionIndex:
+    """
+    Versions sorted by precedence, for range queries by bisection.
+
+    Building is O(n log n) once; each match is O(log n + k) per interval
+    instead of testing every version.
+    """
+
+    def __init__(self, versions: Iterable):
+        unique = {}
+        for version in versions:
+            if isinstance(version, str):
+                version = Version.parse(version)
+            unique.setdefault(version.sort_key, version)
+        self.keys = sorted(unique)
+        self.versions = [unique[key] for key in self.keys]
+
+    def __len__(self):
+        return len(self.versions)
+
+    def match(self, constraint) -> list:
+        """Return the matching versions in ascending precedence."""
+        if isinstance(constraint, str):
+            constraint = compile_constraint(constraint)
+
+        keys, found = self.keys, []
+        for interval in constraint.intervals:
+            if interval.low is None:
+                start = 0
+            elif interval.low_inclusive:
+                start = bisect_left(keys, interval.low)
+            else:
+                start = bisect_right(keys, interval.low)
+
+            if interval.high is None:
+                end = len(keys)
+            elif interval.high_inclusive:
+                end = bisect_right(keys, interval.high)
+            else:
+                end = bisect_left(keys, interval.high)
+            found.append((start, end))
+
+        # Alternatives may overlap: merge the index spans before slicing
+        merged = []
+        for start, end in sorted(found):
+            if start >= end:
+                continue
+            if merged and start <= merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        return [v for start, end in merged for v in self.versions[start:end]]
+
+    def latest(self, constraint) -> Optional[Version]:
+        """Return the highest matching version, or None."""
+        matched = self.match(constraint)
+        return matched[-1] if matched else None
+
+
+def known_versions(root) -> List[Version]:
+    """
+    Every version a project has been at: the history journal (both sides of
+    each bump), the changelog headings and version.txt. Strings that aren't
+    valid versions are skipped.
+    """
+    from pathlib import Path
+
+    from chroniq.changelog import CHANGELOG_FILE
+    from chroniq.changelog_index import ChangelogIndex
+    from chroniq.core import VERSION_FILE
+    from chroniq.history import HISTORY_PATH, VersionHistory
+
+    root = Path(root)
+    raw = []
+    journal = VersionHistory(root / HISTORY_PATH)
+    for record in journal.tail(len(journal)):
+        raw.append(record.old_version)
+        raw.append(record.new_version)
+
+    changelog = root / CHANGELOG_FILE.name
+    if changelog.exists():
+        raw.extend(entry.version for entry in ChangelogIndex.load(changelog).entries)
+
+    try:
+        raw.append((root / VERSION_FILE).read_text(encoding="utf-8").strip())
+    except OSError:
+        pass
+
+    return [v for v in Version.parse_many(raw) if isinstance(v, Version)]
@@ -1,163 +1,492 @@
 import re
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from rich import print
-from rich.console import Console
-import click
 
-from chroniq.utils import emoji  # 🛡️ Custom helper to safely render emojis in all terminals
-from chroniq.logger import activity_log
+from chroniq.errors import InvalidVersionError, MissingVersionFileError, VersionFileError
 
 # 📌 This is the path where Chroniq will store its current version
 VERSION_FILE = Path("version.txt")
 
-console = Console()
+# ⚡ Compiled once at import; fullmatch anchors it, so no ^...$ is needed
+VERSION_RE = re.compile(r"(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-([0-9A-Za-z\-.]+))?(?:\+([0-9A-Za-z\-.]+))?")
 
-class SemVer:
+# Attributes whose change invalidates a version's cached sort key
+_KEY_FIELDS = frozenset(("major", "minor", "patch", "prerelease"))
+
+# A release sorts after every prerelease of the same MAJOR.MINOR.PATCH
+_RELEASE_KEY = (1,)
+
+# Distinct version strings Version.parse keeps interned (least recently used are evicted)
+INTERN_SIZE = 4096
+
+
+def prerelease_key(prerelease: str) -> tuple:
+    """
+    Return the SemVer 2.0 precedence key for a prerelease string.
+
+    Identifiers compare left to right: numeric ones numerically and below
+    alphanumeric ones, which compare as ASCII text; a longer list of equal
+    identifiers wins. No prerelease at all outranks any prerelease.
+    """
+    if not prerelease:
+        return _RELEASE_KEY
+    return (0, tuple(
+        (0, int(part), "") if part.isdigit() and part.isascii() else (1, 0, part)
+        for part in prerelease.split(".")
+    ))
+
+
+_sort_key_of = attrgetter("_sort_key")
+
+
+# Characters allowed in a prerelease identifier (SemVer 2.0: [0-9A-Za-z-])
+_IDENTIFIER_CHARS = frozenset("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz-")
+
+# Default order `chroniq bump promote` walks through before the final release
+PROMOTION_CHAIN = ("alpha", "beta", "rc")
+
+
+def validate_label(label: str) -> str:
+    """
+    Check a prerelease label (`rc`, `beta.2`, `nightly-x`) and return it.
+
+    Each dot-separated identifier must be non-empty and use only [0-9A-Za-z-];
+    anything else raises InvalidVersionError (a ValueError). A single linear
+    pass with no pattern matching, so no label can make it slow.
+    """
+    if not label or not isinstance(label, str):
+        raise InvalidVersionError("Prerelease label must be a non-empty string.")
+    for identifier in label.split("."):
+        if not identifier or not _IDENTIFIER_CHARS.issuperset(identifier):
+            raise InvalidVersionError(f"Invalid prerelease label: '{label}'")
+    return label
+
+
+def split_prerelease(prerelease: str) -> tuple:
+    """
+    Split a prerelease into its label and numeric counter.
+
+        "rc.2" → ("rc", 2)    "beta.1.3" → ("beta.1", 3)    "alpha" → ("alpha", None)
+    """
+    label, dot, tail = prerelease.rpartition(".")
+    if dot and tail.isdigit() and tail.isascii():
+        return label, int(tail)
+    return prerelease, None
+
+
+def next_prerelease(prerelease: str, label: str) -> str:
+    """Return the prerelease after `prerelease` for `label` (alpha.1 → alpha.2, else label.1)."""
+    validate_label(label)
+    current, number = split_prerelease(prerelease)
+    if number is not None and current == label:
+        return f"{label}.{number + 1}"
+    return f"{label}.1"
+
+
+def promote_prerelease(prerelease: str, chain=PROMOTION_CHAIN) -> str:
+    """
+    Return the prerelease one stage further along `chain` (alpha.3 → beta.1).
+
+    Promoting past the last stage returns "" (the final release). Raises
+    ValueError if `prerelease` is empty or its label isn't in the chain.
+    """
+    if not prerelease:
+        raise ValueError("Only a prerelease can be promoted.")
+    chain = [validate_label(label) for label in chain]
+    label = split_prerelease(prerelease)[0]
+    if label not in chain:
+        raise ValueError(f"Prerelease '{prerelease}' isn't in the promotion chain ({' → '.join(chain)}).")
+
+    position = chain.index(label)
+    if position + 1 == len(chain):
+        return ""
+    return f"{chain[position + 1]}.1"
+
+
+def _format(major: int, minor: int, patch: int, prerelease: str, build: str) -> str:
+    text = f"{major}.{minor}.{patch}"
+    if prerelease:
+        text += f"-{prerelease}"
+    if build:
+        text += f"+{build}"
+    return text
+
+
+class _Precedence:
+    """
+    SemVer 2.0 ordering shared by SemVer and Version.
+
+    Both keep a precomputed `_sort_key`; a SemVer and a Version with the same
+    precedence compare and hash equal. Build metadata isn't part of the key,
+    so 1.0.0+build.1 == 1.0.0+build.2, as SemVer 2.0 requires.
+    """
+    __slots__ = ()
+
+    @property
+    def sort_key(self) -> tuple:
+        """
+        Precomputed SemVer 2.0 precedence key.
+
+        Comparisons, hashing, `sorted()` and `max()` all use it, so 1.9.0 <
+        1.10.0 and 1.0.0-alpha < 1.0.0-alpha.1 < 1.0.0-beta < 1.0.0. For very
+        large lists, sort() passes it as the key and skips the
+        per-comparison method calls.
+        """
+        return self._sort_key
+
+    # ⚖️ Rich comparisons read the stored key directly; anything that isn't a
+    # version has no _sort_key and falls through to NotImplemented
+
+    def __eq__(self, other):
+        try:
+            return self._sort_key == other._sort_key
+        except AttributeError:
+            return NotImplemented
+
+    def __lt__(self, other):
+        try:
+            return self._sort_key < other._sort_key
+        except AttributeError:
+            return NotImplemented
+
+    def __le__(self, other):
+        try:
+            return self._sort_key <= other._sort_key
+        except AttributeError:
+            return NotImplemented
+
+    def __gt__(self, other):
+        try:
+            return self._sort_key > other._sort_key
+        except AttributeError:
+            return NotImplemented
+
+    def __ge__(self, other):
+        try:
+            return self._sort_key >= other._sort_key
+        except AttributeError:
+            return NotImplemented
+
+    def __hash__(self):
+        # Don't mutate a SemVer while it's a set member or dict key (Version can't be)
+        return hash(self._sort_key)
+
+    @staticmethod
+    def sort(versions, reverse: bool = False) -> list:
+        """Return `versions` sorted by precedence, using the precomputed keys."""
+        return sorted(versions, key=_sort_key_of, reverse=reverse)
+
+
+class SemVer(_Precedence):
     """
     🔢 Semantic Versioning (SemVer) class to manage versions of the form:
-    MAJOR.MINOR.PATCH[-PRERELEASE]
+    MAJOR.MINOR.PATCH[-PRERELEASE][+BUILD]
 
     ✅ Supports:
     - Breaking changes → MAJOR++
     - Feature additions → MINOR++
     - Bug fixes → PATCH++
     - Optional prerelease tag (e.g. alpha, beta.2, rc.1)
+    - Optional build metadata (e.g. build.912), ignored for precedence
     """
 
-    def __init__(self, major=0, minor=1, patch=0, prerelease=""):
+    def __init__(self, major=0, minor=1, patch=0, prerelease="", build=""):
         """
         📦 Initialize version components. Default starts at 0.1.0
         """
-        self.major = major
-        self.minor = minor
-        self.patch = patch
-        self.prerelease = prerelease  # Optional tag like 'alpha.1'
+        # Written straight into __dict__ so the sort key is built once, not per field
+        fields = self.__dict__
+        fields["major"] = major
+        fields["minor"] = minor
+        fields["patch"] = patch
+        fields["prerelease"] = prerelease  # Optional tag like 'alpha.1'
+        fields["build"] = build  # Optional metadata like 'build.912'
+        fields["_sort_key"] = (major, minor, patch, prerelease_key(prerelease))
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name in _KEY_FIELDS:
+            # 🧹 Bumps mutate in place, so rebuild the precomputed key
+            self.__dict__["_sort_key"] = (self.major, self.minor, self.patch, prerelease_key(self.prerelease))
+
+    def __repr__(self):
+        return f"SemVer('{self}')"
 
     def __str__(self):
         """
         🪞 Return full version string.
-        Example: '1.2.3' or '1.2.3-beta.2'
+        Example: '1.2.3', '1.2.3-beta.2' or '1.2.3-beta.2+build.7'
         """
-        base = f"{self.major}.{self.minor}.{self.patch}"
-        return f"{base}-{self.prerelease}" if self.prerelease else base
+        return _format(self.major, self.minor, self.patch, self.prerelease, self.build)
+
+    # Every bump drops build metadata: it describes one specific build
 
     def bump_patch(self):
         self.patch += 1
         self.prerelease = ""
+        self.build = ""
 
     def bump_minor(self):
         self.minor += 1
         self.patch = 0
         self.prerelease = ""
+        self.build = ""
 
     def bump_major(self):
         self.major += 1
         self.minor = 0
         self.patch = 0
         self.prerelease = ""
+        self.build = ""
 
     def bump_prerelease(self, label: str):
-        if not label or not isinstance(label, str):
-            raise ValueError("Prerelease label must be a non-empty string.")
+        self.prerelease = next_prerelease(self.prerelease, label)
+        self.build = ""
 
-        match = re.fullmatch(rf"({label})\.(\d+)", self.prerelease)
-        if match:
-            current_num = int(match.group(2))
-            self.prerelease = f"{label}.{current_num + 1}"
-        else:
-            self.prerelease = f"{label}.1"
+    def promote(self, chain=PROMOTION_CHAIN):
+        """Move to the next prerelease stage (alpha.3 → beta.1), or to the final release after the last."""
+        self.prerelease = promote_prerelease(self.prerelease, chain)
+        self.build = ""
 
     @classmethod
     def from_string(cls, version_str: str) -> "SemVer":
+        match = VERSION_RE.fullmatch(version_str) if isinstance(version_str, str) else None
+        if match is None:
+            raise cls._invalid(version_str)
+
+        major, minor, patch, prerelease, build = match.groups()
+        return cls(int(major), int(minor), int(patch), prerelease or "", build or "")
+
+    @staticmethod
+    def _invalid(version_str) -> InvalidVersionError:
+        """Build the error for a string that didn't match (only computed on failure)."""
         if not isinstance(version_str, str) or version_str.strip() != version_str:
-            raise ValueError(f"Invalid version format (whitespace): '{version_str}'")
+            return InvalidVersionError(f"Invalid version format (whitespace): '{version_str}'")
+        return InvalidVersionError(f"Invalid version format: '{version_str}'")
 
-        pattern = r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-([0-9A-Za-z\-.]+))?$"
-        match = re.fullmatch(pattern, version_str)
-        if not match:
-            raise ValueError(f"Invalid version format: '{version_str}'")
+    @classmethod
+    def parse_many(cls, values) -> list:
+        """
+        Parse many version strings in one pass.
 
-        major, minor, patch, prerelease = match.groups()
-        return cls(int(major), int(minor), int(patch), prerelease or "")
+        Returns a list aligned with `values`: a SemVer for each valid string and
+        an InvalidVersionError for each invalid one, so one bad tag doesn't stop
+        a scan of thousands.
+        """
+        fullmatch = VERSION_RE.fullmatch
+        results = []
+        append = results.append
+        for value in values:
+            match = fullmatch(value) if isinstance(value, str) else None
+            if match is None:
+                append(cls._invalid(value))
+                continue
+            major, minor, patch, prerelease, build = match.groups()
+            append(cls(int(major), int(minor), int(patch), prerelease or "", build or ""))
+        return results
 
     @classmethod
-    def load(cls, path=VERSION_FILE):
-        if not path.exists():
-            print(f"{emoji('⚠️', '[warn]')} [yellow]No version file found. Creating default version 0.1.0[/yellow]")
-            default_version = cls()
-            default_version.save(path)
-            return default_version
+    def read(cls, path: Path = VERSION_FILE) -> "SemVer":
+        """
+        Read and parse a version file without printing or writing anything.
 
+        Raises MissingVersionFileError if the file doesn't exist and
+        VersionFileError if it can't be read or doesn't hold a valid version.
+        """
+        path = Path(path)
         try:
-            with open(path, 'r', encoding="utf-8") as f:
+            with open(path, "r", encoding="utf-8") as f:
                 version_str = f.read().strip()
-                return cls.from_string(version_str)
-        except Exception as e:
-            print(f"{emoji('❌', '[error]')} [red]Failed to read version file:[/red] {e}")
-            fallback = cls()
-            fallback.save(path)
-            return fallback
+        except FileNotFoundError:
+            raise MissingVersionFileError(f"No version file found at '{path}'", path)
+        except OSError as e:
+            raise VersionFileError(str(e), path)
 
-    def save(self, path: Path = VERSION_FILE):
+        try:
+            return cls.from_string(version_str)
+        except InvalidVersionError as e:
+            raise VersionFileError(str(e), path)
+
+    def write(self, path: Path = VERSION_FILE) -> None:
+        """Write this version to `path` without printing. Raises VersionFileError on failure."""
         try:
             with open(path, "w", encoding="utf-8") as f:
                 f.write(str(self))
-            print(f"{emoji('💾', '[save]')} Version [bold cyan]{self}[/bold cyan] saved to '{path}'")
-        except Exception as e:
-            print(f"{emoji('❌', '[error]')} [red]Failed to save version:[/red] {e}")
+        except OSError as e:
+            raise VersionFileError(str(e), path)
 
+    @classmethod
+    def load(cls, path=VERSION_FILE):
+        """
+        Interactive counterpart of read(), used by the CLI.
 
-def perform_rollback(rollback_version=False, yes=False):
+        A missing or unreadable version file is reported and replaced with
+        the default 0.1.0. Library code should call read() instead.
+        """
+        try:
+            return cls.read(path)
+        except MissingVersionFileError:
+            from chroniq.presentation import notify
+            notify("warn", "No version file found. Creating default version 0.1.0")
+        except VersionFileError as e:
+            from chroniq.presentation import notify
+            notify("error", "Failed to read version file:", e)
+
+        fallback = cls()
+        fallback.save(path)
+        return fallback
+
+    def save(self, path: Path = VERSION_FILE):
+        """Interactive counterpart of write(): reports the result instead of raising."""
+        from chroniq.presentation import notify
+
+        try:
+            self.write(path)
+            notify("save", f"Version [bold cyan]{self}[/bold cyan] saved to '{path}'")
+        except VersionFileError as e:
+            notify("error", "Failed to save version:", e)
+
+
+class Version(_Precedence):
     """
-    ✅ Core rollback logic)
+    Immutable, compact version value: MAJOR.MINOR.PATCH[-PRERELEASE][+BUILD].
 
-    This function handles rollback of version.txt from a .version.bak file
-    and optionally removes the most recent changelog section.
+    Uses __slots__ (no per-instance __dict__) and never changes after
+    construction, so bump methods return new instances and equal versions
+    can be shared. Version.parse interns through a bounded LRU table, so a
+    release history full of repeated strings holds one object per distinct
+    version instead of one per occurrence.
     """
-    version_path = Path("version.txt")
-    backup_path = Path(".version.bak")
+    __slots__ = ("major", "minor", "patch", "prerelease", "build", "_sort_key")
 
-    if not backup_path.exists():
-        console.print(f"{emoji('❌', '[error]')} [red]No backup version found. Cannot rollback.[/red]")
-        return
+    def __init__(self, major: int = 0, minor: int = 1, patch: int = 0, prerelease: str = "", build: str = ""):
+        init = object.__setattr__
+        init(self, "major", major)
+        init(self, "minor", minor)
+        init(self, "patch", patch)
+        init(self, "prerelease", prerelease)
+        init(self, "build", build)
+        init(self, "_sort_key", (major, minor, patch, prerelease_key(prerelease)))
 
-    try:
-        current_version = version_path.read_text(encoding="utf-8").strip()
-        previous_version = backup_path.read_text(encoding="utf-8").strip()
-    except Exception as e:
-        console.print(f"{emoji('❌', '[error]')} [red]Error reading version files:[/red] {e}")
-        return
+    def __setattr__(self, name, value):
+        raise AttributeError("Version is immutable; bump methods return a new Version")
 
-    console.print(f"{emoji('🕒', '[info]')} Current version: [bold yellow]{current_version}[/bold yellow]")
-    console.print(f"{emoji('⏪', '[rollback]')} Will rollback to: [bold green]{previous_version}[/bold green]")
+    __delattr__ = __setattr__
 
-    if not yes and not click.confirm("Are you sure you want to rollback version.txt?", default=False):
-        console.print(f"{emoji('❎', '[cancel]')} [dim]Rollback cancelled.[/dim]")
-        return
+    def __reduce__(self):
+        return (Version, (self.major, self.minor, self.patch, self.prerelease, self.build))
 
-    if not rollback_version:
-        changelog_path = Path("CHANGELOG.md")
-        if not changelog_path.exists():
-            console.print(f"{emoji('⚠️', '[warn]')} [yellow]No CHANGELOG.md found. Skipping changelog rollback.[/yellow]")
-        else:
+    def __str__(self):
+        return _format(self.major, self.minor, self.patch, self.prerelease, self.build)
+
+    def __repr__(self):
+        return f"Version('{self}')"
+
+    @classmethod
+    def from_string(cls, version_str: str) -> "Version":
+        """Parse without interning; raises InvalidVersionError."""
+        match = VERSION_RE.fullmatch(version_str) if isinstance(version_str, str) else None
+        if match is None:
+            raise SemVer._invalid(version_str)
+        major, minor, patch, prerelease, build = match.groups()
+        return cls(int(major), int(minor), int(patch), prerelease or "", build or "")
+
+    @staticmethod
+    def parse(version_str: str) -> "Version":
+        """Parse through the intern table: repeated strings return the same object."""
+        if not isinstance(version_str, str):
+            raise SemVer._invalid(version_str)
+        return _interned(version_str)
+
+    @staticmethod
+    def parse_many(values) -> list:
+        """Interning counterpart of SemVer.parse_many: a Version or InvalidVersionError per item."""
+        results = []
+        append = results.append
+        for value in values:
             try:
-                lines = changelog_path.read_text(encoding="utf-8").splitlines(keepends=True)
-                start = next((i for i, line in enumerate(lines) if line.startswith("## [")), None)
-                if start is not None:
-                    end = next((i for i in range(start + 1, len(lines)) if lines[i].startswith("## [")), len(lines))
-                    removed = lines[start:end]
-                    lines = lines[:start] + lines[end:]
-                    changelog_path.write_text("".join(lines), encoding="utf-8")
-                    activity_log.info(f"Rolled back changelog section: {removed[0].strip()}")
-                    console.print(f"{emoji('🧹', '[cleanup]')} [green]Removed changelog entry:[/green] {removed[0].strip()}")
-                else:
-                    console.print(f"{emoji('❌', '[error]')} [red]No changelog headings found to rollback.[/red]")
-            except Exception as e:
-                console.print(f"{emoji('❌', '[error]')} [red]Failed to rollback changelog:[/red] {e}")
-
-    try:
-        version_path.write_text(previous_version + "\n", encoding="utf-8")
-        activity_log.info(f"Rolled back version.txt from {current_version} to {previous_version}")
-        console.print(f"{emoji('✅', '[done]')} [green]Rollback complete.[/green]")
-    except Exception as e:
-        console.print(f"{emoji('❌', '[error]')} [red]Failed to restore backup:[/red] {e}")
\ No newline at end of file
+                append(Version.parse(value))
+            except InvalidVersionError as e:
+                append(e)
+        return results
+
+    @classmethod
+    def from_semver(cls, version: "SemVer") -> "Version":
+        return cls(version.major, version.minor, version.patch, version.prerelease, version.build)
+
+    def to_semver(self) -> "SemVer":
+        """Return a mutable SemVer copy (for APIs that bump in place)."""
+        return SemVer(self.major, self.minor, self.patch, self.prerelease, self.build)
+
+    def with_build(self, build: str) -> "Version":
+        """Return this version with different build metadata (`""` removes it)."""
+        return Version(self.major, self.minor, self.patch, self.prerelease, validate_label(build) if build else "")
+
+    # 🔁 Bumps return new instances
+
+    def bump_patch(self) -> "Version":
+        return Version(self.major, self.minor, self.patch + 1)
+
+    def bump_minor(self) -> "Version":
+        return Version(self.major, self.minor + 1, 0)
+
+    def bump_major(self) -> "Version":
+        return Version(self.major + 1, 0, 0)
+
+    def bump_prerelease(self, label: str) -> "Version":
+        return Version(self.major, self.minor, self.patch, next_prerelease(self.prerelease, label))
+
+    def promote(self, chain=PROMOTION_CHAIN) -> "Version":
+        return Version(self.major, self.minor, self.patch, promote_prerelease(self.prerelease, chain))
+
+    def bump(self, level: str, pre: str = None, chain=PROMOTION_CHAIN) -> "Version":
+        """
+        Return the version after a `chroniq bump <level>`.
+
+        - "pre" auto-increments the prerelease (default label: alpha)
+        - "promote" moves to the next stage of `chain` (alpha.3 → beta.1), then to the release
+        - patch/minor/major bump normally, then attach `pre` if given
+
+        The one implementation of the bump rules: bumper.apply_bump delegates here.
+        """
+        if level == "pre":
+            return self.bump_prerelease(pre or "alpha")
+        if level == "promote":
+            return self.promote(chain)
+        if level == "patch":
+            bumped = self.bump_patch()
+        elif level == "minor":
+            bumped = self.bump_minor()
+        elif level == "major":
+            bumped = self.bump_major()
+        else:
+            raise ValueError(f"Invalid bump level '{level}' — must be patch, minor, major, pre, or promote.")
+        return Version(bumped.major, bumped.minor, bumped.patch, validate_label(pre)) if pre else bumped
+
+
+@lru_cache(maxsize=INTERN_SIZE)
+def _interned(version_str: str) -> Version:
+    # Exceptions aren't cached, so invalid strings are re-checked every time
+    return Version.from_string(version_str)
+
+
+def intern_stats():
+    """Return the intern table's (hits, misses, maxsize, currsize)."""
+    return _interned.cache_info()
+
+
+def clear_intern_table() -> None:
+    _interned.cache_clear()
+
+
+def perform_rollback(rollback_version=False, yes=False):
+    """
+    ✅ Core rollback logic
+
+    Kept here for backwards compatibility; the implementation lives in
+    chroniq.rollback so both entry points share the streaming changelog parser.
+    """
+    from chroniq.rollback import perform_rollback as _perform_rollback
+
+    return _perform_rollback(rollback_version=rollback_version, yes=yes)
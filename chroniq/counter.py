@@ -0,0 +1,133 @@
+# chroniq/counter.py
+
+import json
+from pathlib import Path
+from typing import Iterator, List
+
+from chroniq.errors import ChroniqError
+from chroniq.locking import locked
+from chroniq.utils import atomic_write
+
+# 🔢 Last number handed out per counter, shared by every job in the checkout
+COUNTER_PATH = Path(".chroniq") / "counters.json"
+
+# Seconds to wait for another process to release the counter lock
+LOCK_TIMEOUT = 30.0
+
+
+class CounterError(ChroniqError):
+    """Raised when numbers can't be reserved (lock timeout, corrupt counter file, exhausted block)."""
+
+
+class Block:
+    """
+    A run of reserved numbers, handed out locally without touching shared state.
+
+        block = reserve(".", "build", count=10)   # e.g. 57..66
+        block.allocate()                          # 57, then 58, ...
+    """
+
+    def __init__(self, name: str, first: int, count: int):
+        self.name = name
+        self.first = first
+        self.count = count
+        self._next = first
+
+    @property
+    def last(self) -> int:
+        return self.first + self.count - 1
+
+    @property
+    def remaining(self) -> int:
+        return self.last - self._next + 1
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self.first, self.last + 1))
+
+    def __contains__(self, number) -> bool:
+        return self.first <= number <= self.last
+
+    def __repr__(self):
+        return f"Block('{self.name}', {self.first}..{self.last})"
+
+    def allocate(self) -> int:
+        """Return the next unused number of the block."""
+        if self._next > self.last:
+            raise CounterError(f"Block {self.first}..{self.last} of '{self.name}' is used up")
+        number = self._next
+        self._next += 1
+        return number
+
+
+def _read_counters(path: Path) -> dict:
+    try:
+        counters = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        raise CounterError(f"Can't read counter file {path}: {e}")
+    if not isinstance(counters, dict):
+        raise CounterError(f"Counter file {path} is not a JSON object")
+    return counters
+
+
+def _write_counters(path: Path, counters: dict) -> None:
+    # Durable before it's visible: a reused number is worse than a skipped one
+    atomic_write(path, json.dumps(counters, indent=2, sort_keys=True), sync=True)
+
+
+def reserve(root: Path = ".", name: str = "build", count: int = 1, timeout: float = LOCK_TIMEOUT) -> Block:
+    """
+    Atomically reserve `count` consecutive numbers of counter `name`.
+
+    Concurrent callers (threads, processes, CI jobs sharing a checkout)
+    serialise on a lock file next to .chroniq/counters.json, so every block
+    is disjoint. Counters start at 1.
+    """
+    if count < 1:
+        raise CounterError("Reserve at least one number")
+
+    path = Path(root) / COUNTER_PATH
+    with locked(path.with_name(path.name + ".lock"), timeout, CounterError):
+        counters = _read_counters(path)
+        last = counters.get(name, 0)
+        if not isinstance(last, int) or last < 0:
+            raise CounterError(f"Counter '{name}' in {path} is not a non-negative integer")
+        counters[name] = last + count
+        _write_counters(path, counters)
+    return Block(name, last + 1, count)
+
+
+def reserve_versions(root: Path, base, count: int = 1, pre: str = None, build: str = None,
+                     timeout: float = LOCK_TIMEOUT) -> List[str]:
+    """
+    Reserve `count` unique versions derived from `base` (a Version).
+
+    With `pre`, numbers go into the prerelease (2.1.0-nightly.57) and count
+    separately for each MAJOR.MINOR.PATCH; otherwise they go into build
+    metadata labelled `build` (2.1.0+build.912) from one project-wide counter.
+    Versions too long for the history journal raise HistoryError.
+    """
+    from chroniq.core import Version, validate_label
+    from chroniq.history import check_version_fits
+
+    if pre and build:
+        raise CounterError("Number either the prerelease or the build metadata, not both")
+
+    label = validate_label(pre or build or "build")
+    name = f"{base.major}.{base.minor}.{base.patch}-{label}" if pre else f"+{label}"
+
+    def versioned(n: int) -> str:
+        if pre:
+            return str(Version(base.major, base.minor, base.patch, f"{label}.{n}"))
+        return str(base.with_build(f"{label}.{n}"))
+
+    # Numbers are never handed back, so reject a label that can't fit before
+    # reserving; the block's last number is its longest version
+    check_version_fits(versioned(count))
+    versions = [versioned(n) for n in reserve(root, name, count, timeout)]
+    check_version_fits(versions[-1])
+    return versions
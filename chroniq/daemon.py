@@ -0,0 +1,206 @@
+# chroniq/daemon.py
+
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+
+# 🔌 Environment variable that overrides the daemon socket location
+SOCKET_ENV = "CHRONIQ_SOCKET"
+
+# Commands the thin client forwards to a running daemon
+FORWARDED_COMMANDS = ("bump", "version", "log", "audit")
+
+
+def socket_path() -> Path:
+    """
+    Return the Unix socket the daemon listens on.
+
+    $CHRONIQ_SOCKET wins; otherwise a per-user socket in $XDG_RUNTIME_DIR
+    (or the temp dir).
+    """
+    override = os.environ.get(SOCKET_ENV)
+    if override:
+        return Path(override)
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "chroniq.sock"
+
+    import tempfile
+    uid = os.getuid() if hasattr(os, "getuid") else "user"
+    return Path(tempfile.gettempdir()) / f"chroniq-{uid}.sock"
+
+
+def execute(argv, cwd: str, stdin: str = "") -> dict:
+    """
+    Run one CLI invocation inside this process and capture its output.
+
+    stdout and stderr are captured separately, like a subprocess's, so
+    the startup banner and error notices never end up in "output".
+
+    Everything Chroniq caches in memory (resolved configs, changelog indexes)
+    is validated by file stats, so state stays warm between requests without
+    going stale when files change underneath the daemon.
+    """
+    from click.testing import CliRunner
+    from chroniq.cli import main
+
+    try:
+        runner = CliRunner(mix_stderr=False)  # Click < 8.2 mixes the streams by default
+    except TypeError:
+        runner = CliRunner()  # Click 8.2+ always keeps them apart
+
+    previous = os.getcwd()
+    try:
+        os.chdir(cwd)
+        result = runner.invoke(main, list(argv), input=stdin, prog_name="chroniq")
+    finally:
+        os.chdir(previous)
+
+    stderr = result.stderr
+    if result.exception is not None and not isinstance(result.exception, SystemExit):
+        stderr += f"Error: {result.exception}\n"
+    return {"exit_code": result.exit_code, "output": result.stdout, "stderr": stderr}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handle one newline-delimited JSON request per connection."""
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            op = request.get("op", "run")
+
+            if op == "ping":
+                response = {"ok": True, "pid": os.getpid(), "uptime": time.monotonic() - self.server.started}
+            elif op == "shutdown":
+                response = {"ok": True}
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+            elif op == "run":
+                # The CLI works relative to the cwd, so requests run one at a time
+                with self.server.lock:
+                    response = execute(request["argv"], request["cwd"], request.get("stdin", ""))
+                self.server.requests += 1
+            else:
+                response = {"ok": False, "error": f"Unknown op '{op}'"}
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class ChroniqServer(socketserver.UnixStreamServer):
+    """Unix socket server that keeps Chroniq's imports and caches warm."""
+
+    def __init__(self, path: Path):
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+        self.requests = 0
+        super().__init__(str(path), _RequestHandler)
+
+
+def _socket_in_use(path: Path) -> bool:
+    """Return True if a live daemon already answers on `path`."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.5)
+            sock.connect(str(path))
+        return True
+    except OSError:
+        return False
+
+
+def create_server(path: Path = None) -> ChroniqServer:
+    """
+    Bind the daemon socket, clearing a stale socket file left by a dead daemon.
+
+    Raises RuntimeError if Unix sockets aren't supported or a daemon is already
+    listening on the socket.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("Unix sockets are not supported on this platform")
+
+    path = Path(path or socket_path())
+    if path.exists():
+        if _socket_in_use(path):
+            raise RuntimeError(f"A Chroniq daemon is already listening on {path}")
+        path.unlink()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    server = ChroniqServer(path)
+    os.chmod(path, 0o600)
+    return server
+
+
+def request(payload: dict, path: Path = None, timeout: float = None):
+    """
+    Send one request to the daemon and return its response.
+
+    Returns None if no daemon is reachable, so callers can fall back to
+    running in-process.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    path = Path(path or socket_path())
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as stream:
+                line = stream.readline()
+    except OSError:
+        return None
+
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def _command_name(argv):
+    """Return the subcommand in argv, skipping the global --config option."""
+    args = iter(argv)
+    for arg in args:
+        if arg == "--config":
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def client_main(argv=None) -> None:
+    """
+    Thin client entry point (`chroniq-client`).
+
+    bump/version/log/audit are forwarded to a running daemon; anything else,
+    or any call when no daemon is reachable, runs in this process instead.
+    Interactive `bump` prompts only work in-process, so a bump from a
+    terminal is never forwarded.
+    """
+    argv = list(sys.argv[1:] if argv is None else argv)
+    command = _command_name(argv)
+
+    if command in FORWARDED_COMMANDS and not (command == "bump" and sys.stdin.isatty()):
+        stdin = sys.stdin.read() if command == "bump" else ""
+        response = request({"op": "run", "argv": argv, "cwd": os.getcwd(), "stdin": stdin})
+        if response is not None and "exit_code" in response:
+            sys.stdout.write(response["output"])
+            sys.stdout.flush()
+            sys.stderr.write(response.get("stderr", ""))
+            sys.stderr.flush()
+            sys.exit(response["exit_code"])
+
+        if stdin:
+            # Replay what we consumed so the in-process prompts still see it
+            import io
+            sys.stdin = io.StringIO(stdin)
+
+    from chroniq.cli import main
+    main(argv, prog_name="chroniq")
@@ -1,43 +1,32 @@
-from chroniq.core import SemVer
-from chroniq.changelog import add_entry
-from chroniq.config import load_config
+from chroniq.project import ChroniqProject
 
-def bump_version(level: str = None, silent: bool = False):
+def bump_version(level: str = None, silent: bool = False, message: str = ""):
     """
     Programmatically bump the project version and optionally update the changelog.
 
     Parameters:
         level (str): One of 'patch', 'minor', or 'major'. If None, uses config default.
-        silent (bool): If True, skips prompts and outputs (used for automation).
-    
+        silent (bool): If True, nothing is printed (used for automation).
+        message (str): Optional changelog entry written with the bump.
+
     Returns:
         str: The new version string after bumping.
+
+    For repeated calls, use chroniq.project.ChroniqProject directly; it keeps
+    config and version state warm between calls.
     """
-    config = load_config()
-    bump_level = (level or config.get("default_bump", "patch")).lower()
+    project = ChroniqProject()
+    bump_level = (level or project.config.get("default_bump", "patch")).lower()
 
     if bump_level not in ("patch", "minor", "major"):
         raise ValueError(f"Invalid bump level: '{bump_level}'. Use 'patch', 'minor', or 'major'.")
 
-    version = SemVer.load()
-
-    if bump_level == "patch":
-        version.bump_patch()
-    elif bump_level == "minor":
-        version.bump_minor()
-    elif bump_level == "major":
-        version.bump_major()
-
-    version.save()
+    version = project.bump(bump_level, message=message)
 
-    # Optionally add changelog entry if not in silent mode
     if not silent:
         print("Version bumped to:", version)
-        if input("Add changelog entry? (y/N): ").lower().startswith("y"):
-            message = input("Describe the change: ")
-            add_entry(str(version), message)
 
-    return str(version)
+    return version
 
 def current_version():
     """
@@ -46,7 +35,7 @@ def current_version():
     Returns:
         str: The version (e.g., "1.2.3")
     """
-    return str(SemVer.load())
+    return ChroniqProject().version
 
 def reset_files():
     """
@@ -12,5 +12,6 @@ DEFAULT_CONFIG = {
     "activity_log": "data/logs/activity.log",
     "require_changelog_heading": False,
     "auto_increment_prerelease": True,
+    "prerelease_chain": ("alpha", "beta", "rc"),
     "active_profile": "default"
 }
\ No newline at end of file
@@ -0,0 +1,183 @@
+# chroniq/depgraph.py
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from chroniq.errors import ChroniqError
+
+# 📦 The dependency graph cache lives at <root>/.chroniq/cache/depgraph.json
+GRAPH_CACHE = Path(".chroniq") / "cache" / "depgraph.json"
+
+GRAPH_FORMAT = 1
+
+
+class GraphError(ChroniqError):
+    """Raised when the workspace dependency graph is invalid."""
+
+
+class DependencyCycleError(GraphError):
+    """Raised when packages depend on each other in a loop."""
+
+    def __init__(self, cycle: List[str]):
+        self.cycle = cycle
+        super().__init__("Dependency cycle: " + " → ".join(cycle))
+
+
+@dataclass
+class DependencyGraph:
+    """
+    Packages of a workspace and the packages each one depends on.
+
+    Declared per package in its .chroniq.toml:
+
+        [package]
+        name = "web"                  # defaults to the directory name
+        depends_on = ["core", "api"]
+    """
+    paths: Dict[str, str] = field(default_factory=dict)         # name → path relative to the root
+    depends: Dict[str, List[str]] = field(default_factory=dict)  # name → names it depends on
+
+    def dependents(self) -> Dict[str, List[str]]:
+        """Return the reverse edges: name → packages that depend on it."""
+        reverse = {name: [] for name in self.paths}
+        for name, deps in self.depends.items():
+            for dep in deps:
+                reverse.setdefault(dep, []).append(name)
+        return reverse
+
+    def resolve(self, ref: str) -> Optional[str]:
+        """Find a package by name or by its path relative to the root."""
+        if ref in self.paths:
+            return ref
+        wanted = Path(ref).as_posix().strip("/")
+        return next((name for name, path in self.paths.items() if path == wanted), None)
+
+    def affected_by(self, name: str) -> set:
+        """Return `name` plus every package that depends on it, directly or not."""
+        reverse = self.dependents()
+        affected, stack = {name}, [name]
+        while stack:
+            for dependent in reverse.get(stack.pop(), []):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    stack.append(dependent)
+        return affected
+
+    def levels(self, names: Iterable[str] = None) -> List[List[str]]:
+        """
+        Order packages (default: all) into topological levels.
+
+        Every package comes after the packages it depends on; packages in the
+        same level don't depend on each other and can be bumped in parallel.
+        Raises DependencyCycleError with the offending path on a cycle.
+        """
+        selected = set(self.paths if names is None else names)
+        pending = {name: {d for d in self.depends.get(name, []) if d in selected} for name in selected}
+
+        levels = []
+        while pending:
+            ready = sorted(name for name, deps in pending.items() if not deps)
+            if not ready:
+                raise DependencyCycleError(self._find_cycle(pending))
+            levels.append(ready)
+            for name in ready:
+                del pending[name]
+            for deps in pending.values():
+                deps.difference_update(ready)
+        return levels
+
+    @staticmethod
+    def _find_cycle(pending: Dict[str, set]) -> List[str]:
+        """Walk unresolved edges until a package repeats; return that loop."""
+        start = min(pending)
+        path, seen = [start], {start: 0}
+        while True:
+            nxt = min(pending[path[-1]])
+            if nxt in seen:
+                return path[seen[nxt]:] + [nxt]
+            seen[nxt] = len(path)
+            path.append(nxt)
+
+
+def read_manifest(package: Path):
+    """Return (name, depends_on) declared in a package's .chroniq.toml."""
+    from chroniq.config import CONFIG_PATH, load_config
+
+    package = Path(package)
+    section = {}
+    manifest = package / CONFIG_PATH
+    if manifest.exists():
+        section = load_config(path=manifest)[0].get("package", {})
+        if not isinstance(section, dict):
+            section = {}
+
+    name = str(section.get("name") or package.resolve().name)
+    depends = section.get("depends_on", [])
+    if isinstance(depends, str):
+        depends = [depends]
+    return name, [str(dep) for dep in depends]
+
+
+def _manifest_stamps(root: Path, packages: List[Path]) -> Dict[str, Optional[list]]:
+    """Stat every package manifest: relative path → [mtime_ns, size] (None if absent)."""
+    from chroniq.config import CONFIG_PATH
+
+    stamps = {}
+    for package in packages:
+        rel = Path(os.path.relpath(package, root)).as_posix()
+        try:
+            st = os.stat(package / CONFIG_PATH)
+            stamps[rel] = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            stamps[rel] = None
+    return stamps
+
+
+def build_graph(root: Path, packages: List[Path]) -> DependencyGraph:
+    """Read every manifest and build the graph, validating names and edges."""
+    graph = DependencyGraph()
+    for package in packages:
+        name, depends = read_manifest(package)
+        rel = Path(os.path.relpath(package, root)).as_posix()
+        if name in graph.paths:
+            raise GraphError(f"Package name '{name}' is used by both {graph.paths[name]} and {rel}")
+        graph.paths[name] = rel
+        graph.depends[name] = depends
+
+    for name, depends in graph.depends.items():
+        for dep in depends:
+            if dep not in graph.paths:
+                raise GraphError(f"Package '{name}' depends on unknown package '{dep}'")
+    return graph
+
+
+def load_graph(root: Path, packages: List[Path]) -> DependencyGraph:
+    """
+    Return the dependency graph, rebuilding it only when a manifest changed.
+
+    The cache is keyed on the set of packages and each manifest's
+    (mtime_ns, size), so an unchanged workspace costs one stat per package.
+    """
+    import json
+    from chroniq.utils import atomic_write
+
+    root = Path(root)
+    cache_path = root / GRAPH_CACHE
+    stamps = _manifest_stamps(root, packages)
+
+    try:
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+        if payload["format"] == GRAPH_FORMAT and payload["manifests"] == stamps:
+            return DependencyGraph(paths=payload["paths"], depends=payload["depends"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    graph = build_graph(root, packages)
+
+    payload = {"format": GRAPH_FORMAT, "manifests": stamps, "paths": graph.paths, "depends": graph.depends}
+    try:
+        atomic_write(cache_path, json.dumps(payload, separators=(",", ":")))
+    except OSError:
+        pass
+    return graph
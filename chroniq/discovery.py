@@ -0,0 +1,150 @@
+# chroniq/discovery.py
+
+import os
+import time
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import List, Sequence
+
+# 📦 The discovery cache lives at <root>/.chroniq/cache/workspace.json
+DISCOVERY_CACHE = Path(".chroniq") / "cache" / "workspace.json"
+
+DISCOVERY_FORMAT = 1
+
+# Files that mark a directory as a Chroniq package
+PACKAGE_MARKERS = ("version.txt", ".chroniq.toml")
+
+# Directory names never descended into (fnmatch patterns); extend them with
+# `[workspace] ignore = ["vendor", ...]` in the root .chroniq.toml
+DEFAULT_IGNORE = (".*", "node_modules", "__pycache__", "venv")
+
+# Directories modified this recently are rescanned next time, because an
+# mtime can't tell apart changes made within the same clock tick
+MTIME_GRACE_NS = 2_000_000_000
+
+
+def workspace_ignore(root: Path) -> List[str]:
+    """Return the default ignore patterns plus any from the root config's [workspace] table."""
+    from chroniq.config import CONFIG_PATH, load_config
+
+    patterns = list(DEFAULT_IGNORE)
+    section = load_config(path=Path(root) / CONFIG_PATH)[0].get("workspace", {})
+    extra = section.get("ignore", []) if isinstance(section, dict) else []
+    if isinstance(extra, str):
+        extra = [extra]
+    patterns.extend(p for p in extra if isinstance(p, str) and p not in patterns)
+    return patterns
+
+
+class WorkspaceScanner:
+    """
+    Find every package directory below a workspace root.
+
+    The first run walks the tree with os.scandir. The result is persisted
+    with each directory's mtime; later runs stat each known directory and
+    only list the ones whose mtime changed (adding or removing an entry
+    always bumps the parent directory's mtime).
+    """
+
+    def __init__(self, root: Path, ignore: Sequence[str] = DEFAULT_IGNORE):
+        self.root = Path(root)
+        self.ignore = list(ignore)
+        self.cache_path = self.root / DISCOVERY_CACHE
+        self.stats = {"dirs": 0, "rescanned": 0}
+
+    def _ignored(self, name: str) -> bool:
+        return any(fnmatchcase(name, pattern) for pattern in self.ignore)
+
+    def _scan_dir(self, path: Path):
+        """List one directory: return (child directory names, is_package)."""
+        children, is_package = [], False
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not self._ignored(entry.name):
+                            children.append(entry.name)
+                    elif entry.name in PACKAGE_MARKERS and entry.is_file():
+                        is_package = True
+                except OSError:
+                    continue
+        return sorted(children), is_package
+
+    def _load_cache(self) -> dict:
+        import json
+
+        try:
+            payload = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            if (payload["format"] == DISCOVERY_FORMAT
+                    and payload["root"] == os.path.abspath(self.root)
+                    and payload["ignore"] == self.ignore):
+                return payload["dirs"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return {}
+
+    def _save_cache(self, dirs: dict) -> None:
+        import json
+        from chroniq.utils import atomic_write
+
+        payload = {
+            "format": DISCOVERY_FORMAT,
+            "root": os.path.abspath(self.root),
+            "ignore": self.ignore,
+            "dirs": dirs,
+        }
+        try:
+            atomic_write(self.cache_path, json.dumps(payload, separators=(",", ":")))
+        except OSError:
+            pass
+
+    def discover(self, use_cache: bool = True) -> List[Path]:
+        """Return the package directories under the root, sorted by relative path."""
+        cached = self._load_cache() if use_cache else {}
+        try:
+            # Create the cache dir up front so saving it doesn't change the root's mtime
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            pass
+        fresh_before = time.time_ns() - MTIME_GRACE_NS
+        dirs = {}
+        stack = ["."]
+
+        while stack:
+            rel = stack.pop()
+            path = self.root / rel
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+
+            entry = cached.get(rel)
+            if entry is not None and entry[0] == mtime:
+                children, is_package = entry[1], entry[2]
+            else:
+                try:
+                    children, is_package = self._scan_dir(path)
+                except OSError:
+                    continue
+                self.stats["rescanned"] += 1
+
+            # A negative mtime never matches, forcing a rescan next run
+            dirs[rel] = [mtime if mtime < fresh_before else -1, children, is_package]
+            stack.extend(child if rel == "." else f"{rel}/{child}" for child in children)
+
+        self.stats["dirs"] = len(dirs)
+        if dirs != cached:
+            self._save_cache(dirs)
+
+        return [self.root / rel for rel in sorted(dirs) if dirs[rel][2]]
+
+
+def discover_packages(root: Path, ignore: Sequence[str] = None, use_cache: bool = True) -> List[Path]:
+    """
+    Return every package directory under `root`, using the discovery cache.
+
+    `ignore` defaults to DEFAULT_IGNORE plus the root config's [workspace] ignore list.
+    """
+    if ignore is None:
+        ignore = workspace_ignore(root)
+    return WorkspaceScanner(root, ignore).discover(use_cache=use_cache)
@@ -0,0 +1,28 @@
+# chroniq/errors.py
+
+# 🧱 Every error Chroniq raises on purpose derives from ChroniqError, so code
+# embedding Chroniq can catch one type. Nothing here prints or imports rich.
+
+
+class ChroniqError(Exception):
+    """Base class for Chroniq's own errors."""
+
+
+class InvalidVersionError(ChroniqError, ValueError):
+    """Raised when a string isn't a valid MAJOR.MINOR.PATCH[-PRERELEASE] version."""
+
+
+class VersionFileError(ChroniqError):
+    """Raised when version.txt can't be read, parsed or written."""
+
+    def __init__(self, message: str, path=None):
+        self.path = path
+        super().__init__(message)
+
+
+class MissingVersionFileError(VersionFileError):
+    """Raised when version.txt doesn't exist."""
+
+
+class ChangelogError(ChroniqError):
+    """Raised when the changelog can't be created, read or written."""
@@ -0,0 +1,214 @@
+# chroniq/history.py
+
+import os
+import struct
+import time
+from bisect import bisect_right
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+from chroniq.errors import ChroniqError
+
+# 📜 Every bump appends one record to <project>/.chroniq/history.bin
+HISTORY_PATH = Path(".chroniq") / "history.bin"
+
+# File header: magic + layout version
+HISTORY_MAGIC = b"CHRQHST1"
+
+# Record layout: timestamp (epoch seconds), old version, new version,
+# changelog offset (file size before the bump's section was appended, or -1)
+VERSION_FIELD = 64
+_RECORD = struct.Struct(f"<q{VERSION_FIELD}s{VERSION_FIELD}sq")
+RECORD_SIZE = _RECORD.size
+
+
+class HistoryError(ChroniqError):
+    """Raised when the history journal is unreadable or a record can't be stored."""
+
+
+class HistoryRecord(NamedTuple):
+    timestamp: int
+    old_version: str
+    new_version: str
+    changelog_offset: int  # -1 when the bump added no changelog section
+
+
+def check_version_fits(version) -> None:
+    """Raise HistoryError if `version` is too long to be recorded in the journal."""
+    size = len(str(version).encode("utf-8"))
+    if size > VERSION_FIELD:
+        raise HistoryError(
+            f"Version '{version}' is {size} bytes; the history journal records at most {VERSION_FIELD}. "
+            "Use a shorter prerelease or build label."
+        )
+
+
+def pack_record(record: HistoryRecord) -> bytes:
+    """Encode a record into its fixed-size binary form."""
+    check_version_fits(record.old_version)
+    check_version_fits(record.new_version)
+    return _RECORD.pack(record.timestamp, record.old_version.encode("utf-8"), record.new_version.encode("utf-8"), record.changelog_offset)
+
+
+def unpack_record(data, offset: int = 0) -> HistoryRecord:
+    """Decode the record starting at `offset` in a bytes-like object."""
+    timestamp, old, new, changelog_offset = _RECORD.unpack_from(data, offset)
+    return HistoryRecord(
+        timestamp,
+        old.rstrip(b"\0").decode("utf-8"),
+        new.rstrip(b"\0").decode("utf-8"),
+        changelog_offset,
+    )
+
+
+class _Timestamps:
+    """Sequence view over record timestamps so `bisect` can search the mmap directly."""
+
+    def __init__(self, buf, count):
+        self._buf = buf
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        return struct.unpack_from("<q", self._buf, len(HISTORY_MAGIC) + i * RECORD_SIZE)[0]
+
+
+class VersionHistory:
+    """
+    Append-only journal of version bumps, stored as fixed-size binary records.
+
+    Records are appended in timestamp order, so lookups by position are a
+    single seek and lookups by time are a bisect over a memory-mapped view;
+    neither depends on how many bumps have been recorded.
+    """
+
+    def __init__(self, path: Path = None):
+        self.path = Path(path or HISTORY_PATH)
+
+    def ensure(self) -> None:
+        """
+        Create an empty journal (header only) if none exists yet, and cut off
+        a torn trailing record so the next append lands on a record boundary.
+        """
+        if not self.path.exists():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "xb") as f:
+                f.write(HISTORY_MAGIC)
+            return
+
+        aligned = len(HISTORY_MAGIC) + len(self) * RECORD_SIZE
+        if os.path.getsize(self.path) > aligned:
+            os.truncate(self.path, aligned)
+
+    def __len__(self):
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return 0
+        # A torn trailing record (crash mid-append) is ignored
+        return max(size - len(HISTORY_MAGIC), 0) // RECORD_SIZE
+
+    def _check_header(self, f) -> None:
+        if f.read(len(HISTORY_MAGIC)) != HISTORY_MAGIC:
+            raise HistoryError(f"{self.path} is not a Chroniq history journal")
+
+    def new_record(self, old_version: str, new_version: str, changelog_offset: int = -1) -> bytes:
+        """
+        Build the bytes for the next record, for staging in a Transaction.
+
+        Timestamps never go backwards, even if the clock does, so the
+        journal stays sorted for bisect.
+        """
+        timestamp = int(time.time())
+        last = self.last()
+        if last is not None:
+            timestamp = max(timestamp, last.timestamp)
+        return pack_record(HistoryRecord(timestamp, str(old_version), str(new_version), changelog_offset))
+
+    def append(self, old_version: str, new_version: str, changelog_offset: int = -1) -> None:
+        """Append a record directly (outside of a Transaction)."""
+        self.ensure()
+        data = self.new_record(old_version, new_version, changelog_offset)
+        with open(self.path, "r+b") as f:
+            self._check_header(f)
+            f.seek(len(HISTORY_MAGIC) + len(self) * RECORD_SIZE)
+            f.write(data)
+            f.truncate()
+
+    def __getitem__(self, i: int) -> HistoryRecord:
+        count = len(self)
+        if i < 0:
+            i += count
+        if not 0 <= i < count:
+            raise IndexError("history record out of range")
+        with open(self.path, "rb") as f:
+            self._check_header(f)
+            f.seek(len(HISTORY_MAGIC) + i * RECORD_SIZE)
+            return unpack_record(f.read(RECORD_SIZE))
+
+    def last(self) -> Optional[HistoryRecord]:
+        """Return the most recent bump, or None."""
+        return self[-1] if len(self) else None
+
+    def tail(self, count: int) -> List[HistoryRecord]:
+        """Return the last `count` records, oldest first, with a single read."""
+        total = len(self)
+        count = min(max(count, 0), total)
+        if not count:
+            return []
+        with open(self.path, "rb") as f:
+            self._check_header(f)
+            f.seek(len(HISTORY_MAGIC) + (total - count) * RECORD_SIZE)
+            data = f.read(count * RECORD_SIZE)
+        return [unpack_record(data, i * RECORD_SIZE) for i in range(count)]
+
+    def version_at(self, timestamp: int) -> Optional[str]:
+        """
+        Return the version in effect at `timestamp` (epoch seconds).
+
+        Before the first recorded bump this is that bump's old version;
+        None means no history has been recorded.
+        """
+        import mmap
+
+        count = len(self)
+        if not count:
+            return None
+
+        with open(self.path, "rb") as f:
+            self._check_header(f)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                i = bisect_right(_Timestamps(buf, count), timestamp)
+                if i == 0:
+                    return unpack_record(buf, len(HISTORY_MAGIC)).old_version
+                return unpack_record(buf, len(HISTORY_MAGIC) + (i - 1) * RECORD_SIZE).new_version
+
+    def pop(self, count: int) -> None:
+        """
+        Drop the last `count` records after they were rolled back.
+
+        Rolled-back bumps are cut off the end of the journal (an O(1)
+        truncate) so the remaining records still describe what happened.
+        """
+        keep = max(len(self) - count, 0)
+        os.truncate(self.path, len(HISTORY_MAGIC) + keep * RECORD_SIZE)
+
+
+def parse_moment(value: str) -> int:
+    """
+    Turn a `--at` value into epoch seconds.
+
+    A bare date (YYYY-MM-DD) means the end of that day in local time; full
+    ISO timestamps are used as given.
+    """
+    from datetime import datetime, timedelta
+
+    try:
+        moment = datetime.fromisoformat(value.strip())
+    except ValueError as e:
+        raise HistoryError(f"Invalid date '{value}' (expected YYYY-MM-DD or an ISO timestamp)") from e
+
+    if len(value.strip()) == 10:
+        moment = moment + timedelta(days=1) - timedelta(seconds=1)
+    return int(moment.timestamp())
@@ -0,0 +1,63 @@
+# chroniq/locking.py
+
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from chroniq.errors import ChroniqError
+
+# 🔒 Advisory locks on separate lock files, shared by the counter and transaction code.
+# A lock belongs to the open file, so it's released if the holding process dies.
+
+
+def try_lock(f) -> bool:
+    """Take an exclusive, non-blocking lock on an open file; False if someone else holds it."""
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        import msvcrt
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    try:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except BlockingIOError:
+        return False
+
+
+@contextmanager
+def locked(path: Path, timeout: float, error=ChroniqError):
+    """
+    Hold an exclusive lock on `path` for the block.
+
+    Raises `error` if it isn't acquired within `timeout` seconds.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.monotonic() + timeout
+    with open(path, "a+b") as f:
+        while not try_lock(f):
+            if time.monotonic() >= deadline:
+                raise error(f"Timed out waiting for the lock on {path}")
+            time.sleep(0.005)
+        # Closing the file releases the lock (flock and msvcrt alike)
+        yield
+
+
+@contextmanager
+def try_locked(path: Path):
+    """
+    Try once to lock `path` for the block; yields whether the lock was taken.
+
+        with try_locked(lock_path) as acquired:
+            if acquired:
+                ...
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as f:
+        yield try_lock(f)
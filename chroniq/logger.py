@@ -1,5 +1,8 @@
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 # === Default log directory and file paths ===
@@ -7,56 +10,197 @@ DEFAULT_LOG_DIR = Path("data/logs")
 SYSTEM_LOG_FILE = DEFAULT_LOG_DIR / "chroniq.log"
 ACTIVITY_LOG_FILE = DEFAULT_LOG_DIR / "activity.log"
 
-def setup_logger(name: str, file_path: Path, level=logging.INFO) -> logging.Logger:
+# === Logging backends (set via `[logging] backend = "..."` in .chroniq.toml) ===
+# off       → no disk logging at all (warnings still reach the console)
+# buffered  → records are held in memory and written in batches / at exit
+# rotating  → records are written through a RotatingFileHandler (default)
+LOG_BACKENDS = ("off", "buffered", "rotating")
+
+DEFAULT_LOG_SETTINGS = {
+    "backend": "rotating",
+    "rotate_size": 1_000_000,
+    "rotate_backups": 5,
+    "buffer_capacity": 256,
+}
+
+_FILE_FORMAT = "[%(asctime)s] %(levelname)s - %(message)s"
+_CONSOLE_FORMAT = "[%(levelname)s] %(message)s"
+
+# 🧵 Shared pipeline state: every chroniq logger feeds one queue that a single
+# background listener drains. Nothing below is built until the first record.
+_queue = queue.SimpleQueue()
+_routes = {}  # logger name → log file path
+_lock = threading.RLock()
+_listener = None
+_settings = None
+_starting = False
+_atexit_registered = False
+
+
+def resolve_log_settings(config: dict) -> dict:
     """
-    Set up and return a rotating logger.
+    Extract logging settings from a merged Chroniq config dict.
 
-    Logging rotation size and backup count are loaded from config
-    using lazy import to avoid circular dependency.
+    Unknown backends fall back to "rotating" and missing keys fall back to
+    DEFAULT_LOG_SETTINGS.
     """
+    settings = dict(DEFAULT_LOG_SETTINGS)
+    section = config.get("logging", {}) if isinstance(config, dict) else {}
+
+    if isinstance(section, dict):
+        settings.update({k: v for k, v in section.items() if k in DEFAULT_LOG_SETTINGS})
 
-    # 🧠 Dynamically load config only inside this function (not at the top)
+    backend = str(settings["backend"]).strip().lower()
+    settings["backend"] = backend if backend in LOG_BACKENDS else DEFAULT_LOG_SETTINGS["backend"]
+    return settings
+
+
+def _load_settings() -> dict:
+    """
+    Read logging settings from .chroniq.toml exactly once per process.
+    """
     try:
         # Lazy import to avoid circular import at module level
         from chroniq.config import load_config
-        _config = load_config()
-        _log_config = _config.get("logging", {})
-        rotate_size = _log_config.get("rotate_size", 1_000_000)
-        rotate_backups = _log_config.get("rotate_backups", 5)
+        config, _ = load_config()
+        return resolve_log_settings(config)
     except Exception:
         # Fallback if config can't be read (bootstrapping or error)
-        rotate_size = 1_000_000
-        rotate_backups = 5
+        return dict(DEFAULT_LOG_SETTINGS)
+
+
+def _build_handlers(settings: dict) -> list:
+    """
+    Create the handlers the background listener dispatches to.
+
+    Runs once, on the first logged record. File handlers use delay=True, so a
+    log file is only opened when a record is actually routed to it.
+    """
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.WARNING)
+    console_handler.setFormatter(logging.Formatter(_CONSOLE_FORMAT))
+    handlers = [console_handler]
+
+    if settings["backend"] == "off":
+        return handlers
+
+    for name, file_path in _routes.items():
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if settings["backend"] == "buffered":
+            target = logging.FileHandler(file_path, mode="a", encoding="utf-8", delay=True)
+            target.setFormatter(logging.Formatter(_FILE_FORMAT))
+            handler = MemoryHandler(
+                capacity=settings["buffer_capacity"],
+                flushLevel=logging.ERROR,
+                target=target,
+                flushOnClose=True
+            )
+        else:
+            handler = RotatingFileHandler(
+                filename=file_path,
+                mode="a",
+                maxBytes=settings["rotate_size"],
+                backupCount=settings["rotate_backups"],
+                encoding="utf-8",
+                delay=True
+            )
+            handler.setFormatter(logging.Formatter(_FILE_FORMAT))
+
+        # 🎯 Route each logger's records to its own file only
+        handler.addFilter(logging.Filter(name))
+        handlers.append(handler)
+
+    return handlers
+
+
+def _ensure_pipeline() -> None:
+    """
+    Start the background listener on first use.
+
+    Records logged while the pipeline is being configured (e.g. a config
+    parse error) are queued and written once the listener starts.
+    """
+    global _listener, _settings, _starting, _atexit_registered
 
+    if _listener is not None:
+        return
+
+    with _lock:
+        if _listener is not None or _starting:
+            return
+        _starting = True
+        try:
+            _settings = _load_settings()
+            _listener = QueueListener(_queue, *_build_handlers(_settings), respect_handler_level=True)
+            _listener.start()
+            if not _atexit_registered:
+                atexit.register(shutdown_logging)
+                _atexit_registered = True
+        finally:
+            _starting = False
+
+
+class _LazyQueueHandler(QueueHandler):
+    """
+    QueueHandler that boots the shared pipeline on the first record it sees.
+    """
+
+    def enqueue(self, record):
+        _ensure_pipeline()
+
+        # 🚫 With the "off" backend only console-level records are worth queueing
+        if _settings is not None and _settings["backend"] == "off" and record.levelno < logging.WARNING:
+            return
+
+        super().enqueue(record)
+
+
+_queue_handler = _LazyQueueHandler(_queue)
+
+
+def shutdown_logging() -> None:
+    """
+    Stop the background listener, flushing queued and buffered records to disk.
+
+    Registered with atexit when the pipeline starts; safe to call more than once.
+    """
+    global _listener
+
+    with _lock:
+        listener, _listener = _listener, None
+
+    if listener is None:
+        return
+
+    listener.stop()
+    for handler in listener.handlers:
+        # Mirror logging.shutdown(): a stream closed under us (e.g. a replaced
+        # sys.stderr at interpreter exit) must not break the remaining handlers
+        try:
+            handler.flush()
+            handler.close()
+        except (OSError, ValueError):
+            pass
+
+
+def setup_logger(name: str, file_path: Path, level=logging.INFO) -> logging.Logger:
+    """
+    Set up and return a logger that writes through the shared queue pipeline.
+
+    This is cheap: no config is parsed and no files are opened until the
+    first record is logged. Backend and rotation settings are read from the
+    `[logging]` table of .chroniq.toml.
+    """
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
     # Avoid adding duplicate handlers
-    if logger.handlers:
+    if _queue_handler in logger.handlers:
         return logger
 
-    # Ensure the log directory exists
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # File handler with rotation
-    file_handler = RotatingFileHandler(
-        filename=file_path,
-        mode="a",
-        maxBytes=rotate_size,
-        backupCount=rotate_backups,
-        encoding="utf-8",
-        delay=False
-    )
-    file_handler.setLevel(level)
-    file_handler.setFormatter(logging.Formatter("[%(asctime)s] %(levelname)s - %(message)s"))
-
-    # Console handler (shows warnings and errors)
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.WARNING)
-    console_handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
-
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    _routes[name] = Path(file_path)
+    logger.addHandler(_queue_handler)
 
     return logger
 
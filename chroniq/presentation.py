@@ -0,0 +1,74 @@
+# chroniq/presentation.py
+
+import sys
+
+from chroniq.utils import emoji
+
+# 🎨 The only place outside the CLI that renders terminal output. Core modules
+# return results or raise chroniq.errors exceptions; this layer (imported
+# lazily) turns them into rich markup for the legacy print-as-you-go helpers.
+
+# kind → (emoji, plain-text fallback, rich style for the message)
+KINDS = {
+    "ok": ("✅", "[ok]", "green"),
+    "info": ("ℹ️", "[info]", "cyan"),
+    "warn": ("⚠️", "[warn]", "yellow"),
+    "skip": ("⚠️", "[skip]", "yellow"),
+    "error": ("❌", "[error]", "red"),
+    "file": ("📄", "[file]", "cyan"),
+    "write": ("📝", "[write]", "green"),
+    "save": ("💾", "[save]", None),
+}
+
+
+def get_console():
+    """Return a rich Console bound to the *current* stdout."""
+    from rich.console import Console
+
+    return Console(file=sys.stdout)
+
+
+def notify(kind: str, message: str, detail=None, console=None) -> None:
+    """
+    Print one status line: an emoji, the message in the kind's colour, then `detail`.
+
+        notify("error", "Failed to read version file:", e)
+    """
+    icon, fallback, style = KINDS[kind]
+    text = f"[{style}]{message}[/{style}]" if style else message
+    if detail is not None:
+        text += f" {detail}"
+    (console or get_console()).print(f"{emoji(icon, fallback)} {text}")
+
+
+def render_audit(report, console=None) -> None:
+    """Print an AuditReport the way `chroniq audit` always has."""
+    console = console or get_console()
+
+    console.print(f"\n{emoji('🕵️‍♂️', '[audit]')} [bold cyan]Chroniq Hyper Audit[/bold cyan]\n{'='*30}")
+    console.print(f"{emoji('⚙️', '[config]')} Using profile: [bold]{report.profile}[/bold]")
+
+    if report.version:
+        console.print(f"{emoji('📦', '[ver]')} Version file found: [bold green]{report.version}[/bold green]")
+    for error in report.errors:
+        console.print(f"{emoji('❌', '[error]')} [red]{error}[/red]")
+    for warning in report.warnings:
+        console.print(f"{emoji('⚠️', '[warn]')} [yellow]{warning}[/yellow]")
+
+    if report.changelog_found and report.current_in_changelog:
+        console.print(f"{emoji('🧾', '[log]')} CHANGELOG contains current version.")
+    if report.strict and report.dated_sections:
+        console.print(f"{emoji('🔍', '[strict]')} [bold]Strict mode enabled[/bold]")
+        console.print(f"{emoji('✅', '[ok]')} Found {report.dated_sections} valid changelog headings.")
+    elif report.strict:
+        console.print(f"{emoji('🔍', '[strict]')} [bold]Strict mode enabled[/bold]")
+
+    if report.log_dir_found:
+        console.print(f"{emoji('📂', '[logdir]')} Log directory OK: {report.log_dir}")
+    else:
+        console.print(f"{emoji('📂', '[logdir]')} [yellow]Log directory not found:[/yellow] {report.log_dir}")
+
+    if not report.strict:
+        console.print(f"{emoji('💡', '[tip]')} [dim]Tip: Enable --strict or set `strict = true` in .chroniq.toml for deeper audits.[/dim]")
+
+    console.print(f"\n{emoji('✅', '[done]')} [green]Audit complete.[/green]\n")
@@ -0,0 +1,259 @@
+# chroniq/project.py
+
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, List, Optional
+from chroniq.errors import ChroniqError
+
+
+class ProjectError(ChroniqError):
+    """Raised when a project operation can't be carried out."""
+
+
+class ChroniqProject:
+    """
+    Programmatic, non-interactive access to one Chroniq project.
+
+    The resolved config, current version and changelog index are held in
+    memory and revalidated with a stat before use, so a long-running process
+    (a release bot, the daemon) can call into the same project thousands of
+    times and only touches disk when something actually changed:
+
+        project = ChroniqProject("path/to/repo")
+        project.bump("minor", message="New export API")
+        project.add_entries(["Faster startup", "Fixed Windows paths"])
+        project.history(limit=5)
+        project.rollback()
+
+    Methods never prompt or print; failures raise ProjectError, with the
+    underlying error (TransactionError, HistoryError, OSError, ...) as its cause.
+    """
+
+    def __init__(self, root: Path = ".", profile: str = None):
+        from chroniq.transaction import recover
+
+        self.root = Path(root)
+        self.profile = profile
+        self._version = None  # ((mtime_ns, size), version string)
+        self._index = None  # (file stamps, VersionIndex)
+        self._lock = threading.RLock()
+
+        # 🩹 Settle a bump that was interrupted before we start trusting the files
+        recover(self.root)
+
+    # 📁 Paths
+
+    @property
+    def version_path(self) -> Path:
+        from chroniq.core import VERSION_FILE
+        return self.root / VERSION_FILE
+
+    @property
+    def changelog_path(self) -> Path:
+        from chroniq.changelog import CHANGELOG_FILE
+        return self.root / CHANGELOG_FILE.name
+
+    @property
+    def history_path(self) -> Path:
+        from chroniq.history import HISTORY_PATH
+        return self.root / HISTORY_PATH
+
+    # 🧠 Warm state
+
+    @property
+    def config(self):
+        """The resolved (read-only) config; reparsed only when .chroniq.toml changes."""
+        return self._load_config()[0]
+
+    @property
+    def active_profile(self) -> str:
+        return self._load_config()[1]
+
+    def _load_config(self):
+        from chroniq.config import CONFIG_PATH, load_config
+        return load_config(profile=self.profile, path=self.root / CONFIG_PATH)
+
+    @property
+    def version(self) -> str:
+        """The current version; version.txt is only re-read when its stat changes."""
+        from chroniq.core import SemVer
+        from chroniq.errors import VersionFileError
+
+        try:
+            st = os.stat(self.version_path)
+        except FileNotFoundError:
+            raise ProjectError(f"No version file at {self.version_path}")
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._version
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        try:
+            version = str(SemVer.read(self.version_path))
+        except VersionFileError as e:
+            raise ProjectError(str(e))
+        self._version = (stamp, version)
+        return version
+
+    @property
+    def changelog(self):
+        """The changelog's section index (memoised per process, stat-validated)."""
+        from chroniq.changelog_index import ChangelogIndex
+
+        if not self.changelog_path.exists():
+            return None
+        return ChangelogIndex.load(self.changelog_path)
+
+    def version_index(self):
+        """
+        A VersionIndex of every version the project has been at.
+
+        Rebuilt only when the history journal, changelog or version.txt
+        changes, so repeated range queries are a bisect each.
+        """
+        from chroniq.constraints import VersionIndex, known_versions
+
+        stamp = tuple(_stat(path) for path in (self.history_path, self.changelog_path, self.version_path))
+        cached = self._index
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        index = VersionIndex(known_versions(self.root))
+        self._index = (stamp, index)
+        return index
+
+    def versions(self, match: str = None) -> List[str]:
+        """Return known versions in ascending precedence, optionally only those matching a range."""
+        from chroniq.constraints import ConstraintError
+
+        index = self.version_index()
+        if match is None:
+            return [str(v) for v in index.versions]
+        try:
+            return [str(v) for v in index.match(match)]
+        except ConstraintError as e:
+            raise ProjectError(str(e))
+
+    # ✍️ Operations
+
+    def bump(self, level: str = None, pre: str = None, message="") -> str:
+        """
+        Bump the version and return the new one.
+
+        `level` defaults to the config's `default_bump`. `message` (a string or
+        a list of entries) adds a changelog section in the same transaction.
+        """
+        from chroniq.bumper import commit_bump, promotion_chain
+        from chroniq.core import Version
+
+        with self._lock, _project_errors():
+            previous = self.version
+            bump_level = (level or self.config.get("default_bump", "patch")).lower()
+            new_version = str(Version.parse(previous).bump(bump_level, pre, promotion_chain(self.config)))
+
+            commit_bump(self.root, previous, new_version, _entries(message))
+            self._version = None
+            return new_version
+
+    def set_version(self, version: str, message="") -> str:
+        """
+        Set the version outright and return it.
+
+        Published like a bump: version.txt, the optional changelog section
+        and a history record go out in one transaction.
+        """
+        from chroniq.bumper import commit_bump
+        from chroniq.core import Version
+
+        with self._lock, _project_errors():
+            previous = self.version
+            new_version = str(Version.parse(str(version)))
+            commit_bump(self.root, previous, new_version, _entries(message))
+            self._version = None
+            return new_version
+
+    def add_entries(self, messages: Iterable[str], version: str = None) -> Optional[str]:
+        """
+        Append one changelog section with a bullet per message.
+
+        Uses the current version unless `version` is given. Blank messages are
+        dropped; with nothing left, nothing is written and None is returned.
+        """
+        from chroniq import changelog
+        from chroniq.transaction import Transaction
+
+        entries = _entries(messages)
+        if not entries:
+            return None
+
+        with self._lock, _project_errors():
+            version = version or self.version
+            txn = Transaction(self.root)
+            changelog.stage_entry(txn, version, entries, self.changelog_path)
+            txn.commit()
+            return version
+
+    def rollback(self, steps: int = 1, changelog: bool = True) -> List[str]:
+        """
+        Undo the last `steps` bumps without prompting; returns the removed changelog headings.
+        """
+        from chroniq.rollback import apply_rollback, plan_rollback
+
+        with self._lock, _project_errors():
+            plan = plan_rollback(self.root, steps)
+            removed = apply_rollback(self.root, plan, changelog=changelog)
+            self._version = None
+            return removed
+
+    def audit(self, strict: bool = False):
+        """Run the audit checks and return an AuditReport instead of printing."""
+        from chroniq.audit import collect_audit
+
+        config, profile = self._load_config()
+        return collect_audit(self.root, config, profile, strict=strict)
+
+    def history(self, limit: int = None):
+        """Return recorded bumps, most recent first (all of them unless `limit` is given)."""
+        from chroniq.history import VersionHistory
+
+        journal = VersionHistory(self.history_path)
+        records = journal.tail(len(journal) if limit is None else limit)
+        return list(reversed(records))
+
+    def version_at(self, moment) -> Optional[str]:
+        """Return the version in effect at `moment` (epoch seconds or a date string)."""
+        from chroniq.history import VersionHistory, parse_moment
+
+        timestamp = moment if isinstance(moment, int) else parse_moment(moment)
+        return VersionHistory(self.history_path).version_at(timestamp)
+
+
+@contextmanager
+def _project_errors():
+    """Re-raise failures from the layers below as ProjectError."""
+    try:
+        yield
+    except ProjectError:
+        raise
+    except (ChroniqError, OSError, ValueError) as e:
+        raise ProjectError(str(e)) from e
+
+
+def _stat(path: Path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _entries(messages) -> List[str]:
+    """Normalise a message or list of messages into non-blank entries."""
+    if not messages:
+        return []
+    if isinstance(messages, str):
+        messages = [messages]
+    return [m.strip() for m in messages if m and m.strip()]
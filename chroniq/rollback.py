@@ -1,41 +1,114 @@
+from dataclasses import dataclass
 from pathlib import Path
+from typing import List
 from chroniq.utils import emoji
-from chroniq.logger import activity_log
-from rich.console import Console
-import click
+from chroniq.changelog import remove_appended_sections, remove_version_section
+from chroniq.errors import ChroniqError
+from chroniq.history import HISTORY_PATH, HistoryRecord, VersionHistory
 
-# Create a rich console for consistent output
-console = Console()
 
-def perform_rollback(rollback_version=False, yes=False):
+class RollbackError(ChroniqError):
+    """Raised when there is nothing (or not enough) to roll back."""
+
+
+@dataclass
+class RollbackPlan:
+    """What a rollback will undo: the history records and the versions on either side."""
+    records: List[HistoryRecord]
+    current_version: str
+    previous_version: str
+
+
+def plan_rollback(root: Path = Path("."), steps: int = 1) -> RollbackPlan:
+    """
+    Work out which bumps a rollback of `steps` undoes, without changing anything.
+
+    Prefers the history journal; .version.bak only covers a single legacy step.
+    Raises RollbackError if the project can't be rolled back that far.
+    """
+    root = Path(root)
+    backup_path = root / ".version.bak"
+
+    try:
+        records = VersionHistory(root / HISTORY_PATH).tail(steps)
+    except Exception as e:
+        raise RollbackError(f"Error reading version history: {e}")
+
+    if records and len(records) < steps:
+        raise RollbackError(f"Only {len(records)} bump(s) recorded. Cannot rollback {steps} steps.")
+
+    if not records and (steps != 1 or not backup_path.exists()):
+        raise RollbackError("No backup version found. Cannot rollback.")
+
+    try:
+        current_version = (root / "version.txt").read_text(encoding="utf-8").strip()
+        if records:
+            previous_version = records[0].old_version
+        else:
+            previous_version = backup_path.read_text(encoding="utf-8").strip()
+    except Exception as e:
+        raise RollbackError(f"Error reading version files: {e}")
+
+    return RollbackPlan(records, current_version, previous_version)
+
+
+def restore_version(root: Path, plan: RollbackPlan) -> None:
+    """Write the previous version back and drop the undone history records."""
+    root = Path(root)
+    (root / "version.txt").write_text(plan.previous_version + "\n", encoding="utf-8")
+    if plan.records:
+        VersionHistory(root / HISTORY_PATH).pop(len(plan.records))
+
+
+def apply_rollback(root: Path, plan: RollbackPlan, changelog: bool = True) -> List[str]:
+    """
+    Carry out a planned rollback without prompts or console output.
+
+    Removes the changelog sections the undone bumps added (unless `changelog`
+    is False), then restores the version. Returns the removed headings.
+    """
+    root = Path(root)
+    removed = []
+    changelog_path = root / "CHANGELOG.md"
+    if changelog and changelog_path.exists():
+        removed = _rollback_changelog(changelog_path, plan.records, plan.current_version)
+    restore_version(root, plan)
+    return removed
+
+
+def perform_rollback(rollback_version=False, yes=False, steps=1):
     """
     ✅ Core rollback logic (Pro Mode)
 
-    This function handles rollback of version.txt from a .version.bak file
-    and optionally removes the most recent changelog section.
+    This function undoes the last `steps` version bumps recorded in the
+    version history journal and optionally removes the changelog sections
+    they added. Projects bumped before the journal existed fall back to a
+    single step from .version.bak.
 
     Parameters:
     - rollback_version (bool): If True, rollback only version.txt.
     - yes (bool): If True, skip confirmation prompts.
+    - steps (int): How many bumps to undo.
     """
-    version_path = Path("version.txt")
-    backup_path = Path(".version.bak")
+    import click
+    from chroniq.logger import activity_log
+    from chroniq.presentation import get_console
 
-    # ⛔ Abort if backup file doesn't exist
-    if not backup_path.exists():
-        console.print(f"{emoji('❌', '[error]')} [red]No backup version found. Cannot rollback.[/red]")
-        return
+    console = get_console()
 
-    # 🧾 Read current and previous versions
     try:
-        current_version = version_path.read_text(encoding="utf-8").strip()
-        previous_version = backup_path.read_text(encoding="utf-8").strip()
-    except Exception as e:
-        console.print(f"{emoji('❌', '[error]')} [red]Error reading version files:[/red] {e}")
+        plan = plan_rollback(Path("."), steps)
+    except RollbackError as e:
+        console.print(f"{emoji('❌', '[error]')} [red]{e}[/red]")
         return
 
+    records = plan.records
+    current_version = plan.current_version
+    previous_version = plan.previous_version
+
     console.print(f"{emoji('🕒', '[info]')} Current version: [bold yellow]{current_version}[/bold yellow]")
-    console.print(f"{emoji('⏪', '[rollback]')} Will rollback to: [bold green]{previous_version}[/bold green]")
+    suffix = f" ({steps} steps)" if steps > 1 else ""
+    console.print(f"{emoji('⏪', '[rollback]')} Will rollback to: [bold green]{previous_version}[/bold green]{suffix}")
 
     # ❓ Confirm rollback unless --yes flag is passed
     if not yes and not click.confirm("Are you sure you want to rollback version.txt?", default=False):
@@ -49,24 +122,43 @@ def perform_rollback(rollback_version=False, yes=False):
             console.print(f"{emoji('⚠️', '[warn]')} [yellow]No CHANGELOG.md found. Skipping changelog rollback.[/yellow]")
         else:
             try:
-                lines = changelog_path.read_text(encoding="utf-8").splitlines(keepends=True)
-                start = next((i for i, line in enumerate(lines) if line.startswith("## [")), None)
-                if start is not None:
-                    end = next((i for i in range(start + 1, len(lines)) if lines[i].startswith("## [")), len(lines))
-                    removed = lines[start:end]
-                    lines = lines[:start] + lines[end:]
-                    changelog_path.write_text("".join(lines), encoding="utf-8")
-                    activity_log.info(f"Rolled back changelog section: {removed[0].strip()}")
-                    console.print(f"{emoji('🧹', '[cleanup]')} [green]Removed changelog entry:[/green] {removed[0].strip()}")
-                else:
-                    console.print(f"{emoji('❌', '[error]')} [red]No changelog headings found to rollback.[/red]")
+                removed = _rollback_changelog(changelog_path, records, current_version)
+                for heading in removed:
+                    activity_log.info(f"Rolled back changelog section: {heading}")
+                    console.print(f"{emoji('🧹', '[cleanup]')} [green]Removed changelog entry:[/green] {heading}")
+                if not removed:
+                    console.print(f"{emoji('⚠️', '[warn]')} [yellow]No changelog section for {current_version} found to rollback.[/yellow]")
             except Exception as e:
                 console.print(f"{emoji('❌', '[error]')} [red]Failed to rollback changelog:[/red] {e}")
 
     # 💾 Restore version file
     try:
-        version_path.write_text(previous_version + "\n", encoding="utf-8")
+        restore_version(Path("."), plan)
         activity_log.info(f"Rolled back version.txt from {current_version} to {previous_version}")
         console.print(f"{emoji('✅', '[done]')} [green]Rollback complete.[/green]")
     except Exception as e:
         console.print(f"{emoji('❌', '[error]')} [red]Failed to restore backup:[/red] {e}")
+
+
+def _rollback_changelog(changelog_path, records, current_version):
+    """
+    Remove the changelog sections added by the bumps being undone.
+
+    Recorded offsets let every section go with one truncate; if the file was
+    edited since, each version's section is looked up and removed instead.
+    """
+    if not records:
+        heading = remove_version_section(changelog_path, current_version)
+        return [heading] if heading else []
+
+    appended = [(r.new_version, r.changelog_offset) for r in records if r.changelog_offset >= 0]
+    removed = remove_appended_sections(changelog_path, appended)
+    if removed is not None:
+        return removed
+
+    removed = []
+    for record in reversed(records):
+        heading = remove_version_section(changelog_path, record.new_version)
+        if heading:
+            removed.append(heading)
+    return removed
@@ -0,0 +1,267 @@
+# chroniq/transaction.py
+
+import os
+from pathlib import Path
+from chroniq.errors import ChroniqError
+
+# 📓 The commit journal lives at <root>/.chroniq/txn.json while a transaction is in flight
+JOURNAL_PATH = Path(".chroniq") / "txn.json"
+
+# Held for the whole of commit(), so recover() never touches a live journal
+LOCK_PATH = Path(".chroniq") / "txn.lock"
+
+# Seconds to wait for another process's commit to finish
+LOCK_TIMEOUT = 30.0
+
+# Journal states
+PREPARED = "prepared"    # staged data is being written; nothing is published yet
+COMMITTED = "committed"  # everything is durable; publishing may be half done
+
+
+class TransactionError(ChroniqError):
+    """Raised when a transaction can't be staged or committed."""
+
+
+def _fsync_dir(path: Path) -> None:
+    """Persist a directory entry change (rename/unlink). No-op where unsupported."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_journal(path: Path, state: str, replaces, appends, sync: bool) -> None:
+    import json
+    from chroniq.utils import atomic_write
+
+    payload = {
+        "state": state,
+        "replace": [[os.path.abspath(target), os.path.abspath(temp)] for target, temp in replaces],
+        "append": [[os.path.abspath(target), size] for target, size in appends],
+    }
+    atomic_write(path, json.dumps(payload), sync=sync)
+
+
+class Transaction:
+    """
+    Group several file writes so they are published together or not at all.
+
+    Whole-file writes are staged to temp files next to their targets and
+    published with os.replace(). Appends go straight to the end of their
+    target (copying a large changelog would be O(file)); the journal records
+    the original size so an unfinished append can be cut back off.
+
+    commit() runs in this order:
+      1. write and fsync a `prepared` journal, then the temp files and the appends
+      2. fsync the staged data in one pass
+      3. rewrite the journal as `committed` and fsync it   ← the commit point
+      4. rename the temp files into place, fsync each touched directory once
+      5. delete the journal
+
+    All five steps run under an exclusive lock on .chroniq/txn.lock, which
+    recover() only takes without waiting: a journal whose lock is held
+    belongs to a commit still in progress and is left alone. A crash
+    before (3) is rolled back by recover(); a crash after it is rolled
+    forward. Example:
+
+        txn = Transaction()
+        txn.write_text("version.txt", "1.2.4")
+        txn.append_bytes("CHANGELOG.md", b"\\n\\n## [1.2.4] ...")
+        txn.commit()
+    """
+
+    def __init__(self, root: Path = Path("."), sync: bool = True):
+        self.root = Path(root)
+        self.journal_path = self.root / JOURNAL_PATH
+        self.sync = sync
+        self._writes = {}    # target → bytes
+        self._appends = {}   # target → [original size, bytes]
+        self._hooks = []
+        self.committed = False
+
+    def write_bytes(self, path, data: bytes) -> None:
+        """Stage a full replacement of `path`."""
+        self._writes[Path(path)] = bytes(data)
+
+    def write_text(self, path, text: str, encoding: str = "utf-8") -> None:
+        """Stage a full replacement of `path` with text."""
+        self.write_bytes(path, text.encode(encoding))
+
+    def append_bytes(self, path, data: bytes) -> int:
+        """
+        Stage an append to `path` and return the offset the data will start at.
+        """
+        path = Path(path)
+        if path in self._writes:
+            raise TransactionError(f"{path} is already staged as a full write")
+
+        if path not in self._appends:
+            try:
+                size = os.path.getsize(path)
+            except OSError as e:
+                raise TransactionError(f"Cannot append to {path}: {e}") from e
+            self._appends[path] = [size, b""]
+
+        size, pending = self._appends[path]
+        offset = size + len(pending)
+        self._appends[path][1] = pending + data
+        return offset
+
+    def on_commit(self, callback) -> None:
+        """Run `callback()` after the transaction has been published."""
+        self._hooks.append(callback)
+
+    def _temp_path(self, target: Path) -> Path:
+        import threading
+
+        return target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.txn")
+
+    def commit(self) -> None:
+        """Publish every staged write. Raises TransactionError on failure."""
+        if self.committed:
+            raise TransactionError("Transaction already committed")
+
+        replaces = [(target, self._temp_path(target)) for target in self._writes]
+        appends = [(target, size) for target, (size, _) in self._appends.items()]
+
+        from chroniq.locking import locked
+
+        try:
+            with locked(self.root / LOCK_PATH, LOCK_TIMEOUT, TransactionError):
+                self._commit(replaces, appends)
+        except OSError as e:
+            raise TransactionError(f"Transaction failed: {e}") from e
+
+        self.committed = True
+        for callback in self._hooks:
+            callback()
+
+    def _commit(self, replaces, appends) -> None:
+        """Steps 1-5 of commit(); runs with the transaction lock held."""
+        # Sizes were taken when the appends were staged; if another commit has
+        # appended since, writing at the old size would overwrite its data
+        for target, size in appends:
+            try:
+                current = os.path.getsize(target)
+            except OSError as e:
+                raise TransactionError(f"Cannot append to {target}: {e}") from e
+            if current != size:
+                raise TransactionError(f"{target} changed since this transaction was staged; nothing was written")
+
+        try:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            # The pre-append sizes must be durable before any append is, or a
+            # power loss could keep appends that recover() can't cut back off
+            _write_journal(self.journal_path, PREPARED, replaces, appends, sync=self.sync)
+            if self.sync:
+                _fsync_dir(self.journal_path.parent)
+
+            # 1️⃣ Write everything first, then 2️⃣ fsync as one group
+            handles = []
+            try:
+                for target, temp in replaces:
+                    f = open(temp, "wb")
+                    handles.append(f)
+                    f.write(self._writes[target])
+                for target, (size, data) in self._appends.items():
+                    f = open(target, "r+b")
+                    handles.append(f)
+                    f.seek(size)
+                    f.write(data)
+                    f.truncate()
+                for f in handles:
+                    f.flush()
+                    if self.sync:
+                        os.fsync(f.fileno())
+            finally:
+                for f in handles:
+                    f.close()
+
+            # 3️⃣ Single commit point
+            _write_journal(self.journal_path, COMMITTED, replaces, appends, sync=self.sync)
+        except OSError as e:
+            self._undo(replaces, appends)
+            raise TransactionError(f"Transaction failed before commit: {e}") from e
+
+        # 4️⃣ Publish; from here on recover() can always finish the job
+        try:
+            for target, temp in replaces:
+                os.replace(temp, target)
+            if self.sync:
+                for directory in {Path(os.path.abspath(t)).parent for t, _ in replaces}:
+                    _fsync_dir(directory)
+            self.journal_path.unlink(missing_ok=True)
+        except OSError as e:
+            raise TransactionError(f"Transaction committed but not fully published (will be recovered): {e}") from e
+
+    def _undo(self, replaces, appends) -> None:
+        """Best-effort rollback of a transaction that failed before its commit point."""
+        _roll_back(replaces, appends)
+        self.journal_path.unlink(missing_ok=True)
+
+
+def _roll_back(replaces, appends) -> None:
+    for _, temp in replaces:
+        Path(temp).unlink(missing_ok=True)
+    for target, size in appends:
+        try:
+            if os.path.getsize(target) > size:
+                os.truncate(target, size)
+        except OSError:
+            pass
+
+
+def recover(root: Path = Path(".")):
+    """
+    Finish or undo a transaction interrupted by a crash.
+
+    Returns "rolled back", "rolled forward" or None when there was nothing
+    to recover, or when another process holding the transaction lock is
+    still committing it. Safe to run repeatedly.
+    """
+    journal_path = Path(root) / JOURNAL_PATH
+    if not journal_path.exists():
+        return None
+
+    from chroniq.locking import try_locked
+
+    try:
+        with try_locked(Path(root) / LOCK_PATH) as acquired:
+            # A live commit owns its journal; only an orphaned one is ours to fix
+            return _recover(journal_path) if acquired else None
+    except OSError:
+        return None
+
+
+def _recover(journal_path: Path):
+    import json
+
+    try:
+        payload = json.loads(journal_path.read_text(encoding="utf-8"))
+        state = payload["state"]
+        replaces = [(Path(target), Path(temp)) for target, temp in payload["replace"]]
+        appends = [(Path(target), size) for target, size in payload["append"]]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError):
+        # An unreadable journal was never committed (the commit write is atomic)
+        journal_path.unlink(missing_ok=True)
+        return None
+
+    if state == COMMITTED:
+        for target, temp in replaces:
+            if temp.exists():
+                os.replace(temp, target)
+        outcome = "rolled forward"
+    else:
+        _roll_back(replaces, appends)
+        outcome = "rolled back"
+
+    journal_path.unlink(missing_ok=True)
+    return outcome
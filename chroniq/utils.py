@@ -1,4 +1,7 @@
+import os
 import sys
+from contextlib import contextmanager
+from pathlib import Path
 
 def supports_unicode():
     """
@@ -29,3 +32,44 @@ def emoji(text, fallback=""):
         str: The emoji if supported, otherwise the fallback
     """
     return text if USE_EMOJIS else fallback
+
+
+@contextmanager
+def atomic_writer(path, sync=False):
+    """
+    Open a temp file next to `path` for binary writing, then publish it with os.replace().
+
+    Readers see either the old file or the complete new one. With `sync`, the
+    data is fsynced before it becomes visible. On error the temp file is
+    removed and the exception propagates.
+
+        with atomic_writer(cache_path) as f:
+            f.write(data)
+    """
+    import threading
+
+    path = Path(path)
+    # Unique per thread too: the workspace pool, the daemon and aio write from threads
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            yield f
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def atomic_write(path, data, sync=False):
+    """
+    Atomically replace `path` with `data` (bytes, or str written as UTF-8).
+
+    Raises OSError if it can't be written; the old file is then untouched.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    with atomic_writer(path, sync=sync) as f:
+        f.write(data)
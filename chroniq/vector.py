@@ -0,0 +1,215 @@
+# chroniq/vector.py
+
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional
+
+from chroniq.core import VERSION_RE, SemVer, Version, prerelease_key
+
+# 🧮 NumPy is optional: without it the same packed keys are plain Python ints
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy isn't installed
+    np = None
+
+HAVE_NUMPY = np is not None
+
+
+def _width(largest: int) -> int:
+    # One value of headroom above the largest, so out-of-range bounds clamp cleanly
+    return max((largest + 1).bit_length(), 1)
+
+
+class VersionArray:
+    """
+    Many versions packed into one sortable integer each, for bulk work.
+
+    Each version becomes MAJOR | MINOR | PATCH | PRERELEASE-RANK packed into
+    a single integer, where the rank is the position of its prerelease among
+    the distinct prereleases in the batch (a release ranks last). Field
+    widths are sized to the batch, so comparing two packed keys is SemVer
+    2.0 precedence, and sort, max, range filters and per-major grouping
+    become integer array operations.
+
+    With NumPy the keys live in a uint64 array; without it (or when a batch
+    needs more than 64 bits) they are a list of Python ints and the same
+    operations run through sorted() and bisect.
+
+        versions = VersionArray(tags)
+        versions.max(), versions.sort()[:10], versions.filter("^2.1")
+        versions.latest_per_major()  # {1: '1.9.3', 2: '2.4.0'}
+    """
+
+    def __init__(self, versions: Iterable, use_numpy: bool = None):
+        majors, minors, patches, prereleases, strings = [], [], [], [], []
+        fullmatch = VERSION_RE.fullmatch
+        for value in versions:
+            if isinstance(value, (SemVer, Version)):
+                parts = (value.major, value.minor, value.patch, value.prerelease)
+            else:
+                match = fullmatch(value) if isinstance(value, str) else None
+                if match is None:
+                    raise SemVer._invalid(value)
+                major, minor, patch, prerelease, _build = match.groups()
+                parts = (int(major), int(minor), int(patch), prerelease or "")
+            majors.append(parts[0])
+            minors.append(parts[1])
+            patches.append(parts[2])
+            prereleases.append(parts[3])
+            strings.append(str(value))
+
+        # Dense prerelease ranks: the distinct prereleases are usually few
+        self._pre_keys = sorted({prerelease_key(p) for p in prereleases})
+        rank_of = {}
+        for p in set(prereleases):
+            rank_of[p] = bisect_left(self._pre_keys, prerelease_key(p))
+        ranks = [rank_of[p] for p in prereleases]
+
+        self._bits = (
+            _width(max(majors, default=0)),
+            _width(max(minors, default=0)),
+            _width(max(patches, default=0)),
+            _width(len(self._pre_keys)),
+        )
+        self._minor_shift = self._bits[2] + self._bits[3]
+        self._major_shift = self._bits[1] + self._minor_shift
+        self._limits = tuple((1 << bits) - 1 for bits in self._bits[:3])
+
+        if use_numpy is None:
+            use_numpy = HAVE_NUMPY
+        if use_numpy and not HAVE_NUMPY:
+            raise RuntimeError("NumPy is not installed")
+        self.uses_numpy = bool(use_numpy) and sum(self._bits) <= 64
+
+        if self.uses_numpy:
+            u64 = np.uint64
+            keys = (np.array(majors, dtype=u64) << u64(self._major_shift))
+            keys |= (np.array(minors, dtype=u64) << u64(self._minor_shift))
+            keys |= (np.array(patches, dtype=u64) << u64(self._bits[3]))
+            keys |= np.array(ranks, dtype=u64)
+            self.keys = keys
+            self._strings = np.array(strings, dtype=object)
+        else:
+            pack = self._pack
+            self.keys = [pack(*fields) for fields in zip(majors, minors, patches, ranks)]
+            self._strings = strings
+        self._order = None
+
+    def __len__(self):
+        return len(self._strings)
+
+    def _pack(self, major: int, minor: int, patch: int, rank: int) -> int:
+        return (major << self._major_shift) | (minor << self._minor_shift) | (patch << self._bits[3]) | rank
+
+    def _bound(self, key: tuple, after: bool) -> int:
+        """
+        Pack a precedence key that may not occur in the batch.
+
+        The result sits just before (or, with `after`, just after) every
+        batch key equal to it, so `packed >= bound` is `version >= key`.
+        """
+        major, minor, patch, pre = key
+        fields = [major, minor, patch]
+        for i, limit in enumerate(self._limits):
+            if fields[i] > limit - 1:
+                # Larger than anything stored: clamp to the field's spare value
+                return self._pack(*fields[:i], limit, *([0] * (3 - i)))
+        rank = (bisect_right if after else bisect_left)(self._pre_keys, pre)
+        return self._pack(*fields, rank)
+
+    def _argsort(self):
+        if self._order is None:
+            if self.uses_numpy:
+                self._order = np.argsort(self.keys, kind="stable")
+            else:
+                keys = self.keys
+                self._order = sorted(range(len(keys)), key=keys.__getitem__)
+        return self._order
+
+    def _take(self, indexes) -> List[str]:
+        if self.uses_numpy:
+            return self._strings[indexes].tolist()
+        strings = self._strings
+        return [strings[i] for i in indexes]
+
+    # 📊 Bulk operations
+
+    def sort(self, reverse: bool = False) -> List[str]:
+        """Return the versions in ascending (or descending) precedence."""
+        order = self._argsort()
+        return self._take(order[::-1] if reverse else order)
+
+    def max(self) -> Optional[str]:
+        """Return the highest-precedence version, or None for an empty batch."""
+        if not len(self):
+            return None
+        if self.uses_numpy:
+            return self._strings[int(np.argmax(self.keys))]
+        keys = self.keys
+        return self._strings[max(range(len(keys)), key=keys.__getitem__)]
+
+    def mask(self, constraint):
+        """Per-version membership of a range (a string or compiled Constraint)."""
+        from chroniq.constraints import compile_constraint
+
+        if isinstance(constraint, str):
+            constraint = compile_constraint(constraint)
+
+        keys = self.keys
+        if self.uses_numpy:
+            selected = np.zeros(len(keys), dtype=bool)
+        else:
+            selected = [False] * len(keys)
+
+        for interval in constraint.intervals:
+            low = high = None
+            if interval.low is not None:
+                low = self._bound(interval.low, after=not interval.low_inclusive)
+            if interval.high is not None:
+                high = self._bound(interval.high, after=interval.high_inclusive)
+
+            if self.uses_numpy:
+                inside = np.ones(len(keys), dtype=bool)
+                if low is not None:
+                    inside &= keys >= np.uint64(low)
+                if high is not None:
+                    inside &= keys < np.uint64(high)
+                selected |= inside
+            else:
+                for i, key in enumerate(keys):
+                    if (low is None or key >= low) and (high is None or key < high):
+                        selected[i] = True
+        return selected
+
+    def filter(self, constraint, sort: bool = True) -> List[str]:
+        """
+        Return the versions in a range; in ascending precedence unless
+        `sort` is False (then in input order).
+        """
+        selected = self.mask(constraint)
+        if self.uses_numpy:
+            if sort:
+                order = self._argsort()
+                return self._strings[order[selected[order]]].tolist()
+            return self._strings[selected].tolist()
+
+        indexes = self._argsort() if sort else range(len(selected))
+        return [self._strings[i] for i in indexes if selected[i]]
+
+    def latest_per_major(self) -> Dict[int, str]:
+        """Return {major: highest version with that major}, in ascending major order."""
+        if not len(self):
+            return {}
+        order = self._argsort()
+        shift = self._major_shift
+
+        if self.uses_numpy:
+            majors = self.keys[order] >> np.uint64(shift)
+            # The last position of each run of equal majors in sorted order
+            last = np.flatnonzero(np.append(majors[1:] != majors[:-1], True))
+            return dict(zip(majors[last].tolist(), self._strings[order[last]].tolist()))
+
+        latest = {}
+        keys, strings = self.keys, self._strings
+        for i in order:
+            latest[keys[i] >> shift] = strings[i]
+        return latest
@@ -0,0 +1,179 @@
+# chroniq/workspace.py
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+
+@dataclass
+class PackageResult:
+    """Outcome of one package's bump in a workspace run."""
+    package: str
+    ok: bool
+    old_version: Optional[str] = None
+    new_version: Optional[str] = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+
+
+@dataclass
+class WorkspaceReport:
+    """Per-package results plus the wall time of the whole run."""
+    results: List[PackageResult] = field(default_factory=list)
+    wall_time: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for r in self.results if r.ok)
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.succeeded
+
+    def to_dict(self) -> dict:
+        return {
+            "packages": [asdict(r) for r in self.results],
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "wall_time": round(self.wall_time, 6),
+        }
+
+
+def package_name(root: Path, package: Path) -> str:
+    """Name a package by its path relative to the workspace root."""
+    relative = os.path.relpath(package, root)
+    return "." if relative == "." else Path(relative).as_posix()
+
+
+def load_package_configs(root: Path, packages: List[Path]) -> dict:
+    """
+    Resolve the config for each package once, up front.
+
+    Packages with their own .chroniq.toml use it; the rest share the
+    workspace root's config. load_config is memoized, so each distinct
+    file is parsed at most once per process.
+    """
+    from chroniq.config import CONFIG_PATH, load_config
+
+    root_config, _ = load_config(path=Path(root) / CONFIG_PATH)
+    configs = {}
+    for package in packages:
+        own = package / CONFIG_PATH
+        configs[package] = load_config(path=own)[0] if own.exists() else root_config
+    return configs
+
+
+def bump_package(package: Path, level: Optional[str], pre: str = None, message: str = "", config=None) -> PackageResult:
+    """
+    Bump one package without any prompts or console output.
+
+    Failures are captured in the returned result instead of raised, so one
+    broken package never stops the rest of the workspace.
+    """
+    from chroniq.bumper import apply_bump, commit_bump, promotion_chain
+    from chroniq.core import SemVer, VERSION_FILE
+    from chroniq.transaction import recover
+
+    start = time.perf_counter()
+    result = PackageResult(package=str(package), ok=False)
+
+    try:
+        # 🩹 Settle any bump of this package that was interrupted earlier
+        recover(package)
+
+        version = SemVer.from_string((package / VERSION_FILE).read_text(encoding="utf-8").strip())
+        result.old_version = str(version)
+
+        bump_level = (level or (config or {}).get("default_bump", "patch")).lower()
+        apply_bump(version, bump_level, pre, promotion_chain(config))
+
+        commit_bump(package, result.old_version, str(version), message.strip())
+        result.new_version = str(version)
+        result.ok = True
+    except FileNotFoundError:
+        result.error = "version.txt not found"
+    except Exception as e:
+        result.error = str(e)
+
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def bump_workspace(root: Path, packages: List[Path], level: Optional[str] = None, pre: str = None,
+                   message: str = "", jobs: int = None) -> WorkspaceReport:
+    """
+    Bump many packages in one process.
+
+    Configs are resolved once on the calling thread; the per-package file I/O
+    (read, stage, fsync, rename) runs on a thread pool. Results come back in
+    the order the packages were given.
+    """
+    root = Path(root)
+    start = time.perf_counter()
+    configs = load_package_configs(root, packages)
+
+    jobs = jobs or min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = [
+            pool.submit(bump_package, package, level, pre, message, configs[package])
+            for package in packages
+        ]
+        results = [future.result() for future in futures]
+
+    for package, result in zip(packages, results):
+        result.package = package_name(root, package)
+
+    return WorkspaceReport(results=results, wall_time=time.perf_counter() - start)
+
+
+def propagate_bump(root: Path, graph, start: str, level: Optional[str] = None, pre: str = None,
+                   message: str = "", jobs: int = None) -> WorkspaceReport:
+    """
+    Bump `start`, then patch-bump every package that depends on it.
+
+    Packages are processed in topological levels; each level runs in
+    parallel on the thread pool once the previous one has finished.
+    Dependents get a changelog line naming the updated dependencies, and
+    are skipped (reported as failed) if one of those dependencies failed.
+    Raises DependencyCycleError before anything is written.
+    """
+    root = Path(root)
+    begin = time.perf_counter()
+    levels = graph.levels(graph.affected_by(start))
+    configs = load_package_configs(root, [root / graph.paths[name] for level_names in levels for name in level_names])
+
+    new_versions, failed, results = {}, set(), []
+    jobs = jobs or min(32, (os.cpu_count() or 1) * 4)
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        for names in levels:
+            futures = {}
+            for name in names:
+                package = root / graph.paths[name]
+                if name == start:
+                    futures[name] = pool.submit(bump_package, package, level, pre, message, configs[package])
+                    continue
+
+                deps = [dep for dep in graph.depends[name] if dep in new_versions or dep in failed]
+                broken = [dep for dep in deps if dep in failed]
+                if broken:
+                    failed.add(name)
+                    results.append(PackageResult(name, ok=False, error=f"skipped: dependency {', '.join(broken)} failed"))
+                    continue
+
+                line = "Updated dependencies: " + ", ".join(f"{dep} {new_versions[dep]}" for dep in deps)
+                futures[name] = pool.submit(bump_package, package, "patch", None, line, configs[package])
+
+            for name, future in futures.items():
+                result = future.result()
+                result.package = name
+                if result.ok:
+                    new_versions[name] = result.new_version
+                else:
+                    failed.add(name)
+                results.append(result)
+
+    return WorkspaceReport(results=results, wall_time=time.perf_counter() - begin)
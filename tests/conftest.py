@@ -0,0 +1,15 @@
+# tests/conftest.py
+
+import pytest
+
+from chroniq import changelog
+from tests.helpers import make_project
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A project directory with version.txt and CHANGELOG.md, used as the cwd."""
+    monkeypatch.chdir(tmp_path)
+    make_project(tmp_path)
+    monkeypatch.setattr(changelog, "CHANGELOG_FILE", tmp_path / "CHANGELOG.md")
+    return tmp_path
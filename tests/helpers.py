@@ -0,0 +1,15 @@
+# tests/helpers.py
+
+HEADER = "# Changelog\n\nAll notable changes to this project will be documented here.\n"
+
+
+def make_project(root, version="1.0.0", released=False):
+    """
+    Write version.txt and CHANGELOG.md under `root`; with `released`, the
+    changelog already has a section for `version`.
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    text = HEADER + (f"\n## [{version}] - 2025-01-01\n- Initial\n" if released else "")
+    (root / "version.txt").write_text(version, encoding="utf-8")
+    (root / "CHANGELOG.md").write_text(text, encoding="utf-8")
+    return root
@@ -0,0 +1,71 @@
+# tests/test_aio.py
+
+import asyncio
+
+import pytest
+
+from chroniq.aio import AsyncChroniq
+from chroniq.project import ProjectError
+from tests.helpers import make_project
+
+
+def test_concurrent_bumps_of_one_project_are_serialised(tmp_path):
+    """
+    Twenty concurrent patch bumps of the same project never lose an update.
+    """
+    root = make_project(tmp_path / "repo", released=True)
+
+    async def scenario():
+        async with AsyncChroniq(max_workers=8) as chroniq:
+            await asyncio.gather(*(chroniq.bump(root, "patch", message=f"Fix {i}") for i in range(20)))
+            return await chroniq.load(root), await chroniq.history(root)
+
+    version, history = asyncio.run(scenario())
+
+    assert version == "1.0.20"
+    assert len(history) == 20
+    assert (root / "CHANGELOG.md").read_text(encoding="utf-8").count("## [") == 21
+
+
+def test_many_projects_with_failures_reported_per_project(tmp_path):
+    """
+    bump_many returns a version or an exception for each project, in order.
+    """
+    roots = [make_project(tmp_path / f"repo{i}", f"0.{i}.0", released=True) for i in range(5)]
+    (roots[2] / "version.txt").write_text("broken", encoding="utf-8")
+
+    async def scenario():
+        async with AsyncChroniq(max_workers=2) as chroniq:
+            return await chroniq.bump_many(roots, "minor")
+
+    results = asyncio.run(scenario())
+
+    assert results[0] == "0.1.0"
+    assert results[4] == "0.5.0"
+    assert isinstance(results[2], ProjectError)
+
+
+def test_save_add_entry_audit_and_rollback(tmp_path):
+    """
+    The remaining async variants round-trip through the same project state.
+    """
+    root = make_project(tmp_path / "repo", released=True)
+
+    async def scenario():
+        async with AsyncChroniq() as chroniq:
+            await chroniq.save(root, "2.0.0")
+            await chroniq.add_entry(root, ["Release notes", "More notes"])
+            report = await chroniq.audit(root)
+            await chroniq.bump(root, "major", message="Breaking")
+            removed = await chroniq.rollback(root)
+            with pytest.raises(ValueError):
+                await chroniq.save(root, "nope")
+            return report, removed, await chroniq.load(root), await chroniq.history(root)
+
+    report, removed, version, history = asyncio.run(scenario())
+
+    assert report.ok and report.current_in_changelog
+    assert removed[0].startswith("## [3.0.0]")
+    assert version == "2.0.0"
+    # save() is journalled like a bump
+    assert [(r.old_version, r.new_version) for r in history] == [("1.0.0", "2.0.0")]
@@ -0,0 +1,97 @@
+# tests/test_batch.py
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from chroniq.batch import BatchError, parse_line
+from chroniq.cli import main
+
+
+def _results(result):
+    return [json.loads(line) for line in result.stdout.splitlines()]
+
+
+def test_parse_line_accepts_plain_and_json_commands():
+    """
+    Plain lines are split like a shell; JSON lines give argv (or cmd) and input.
+    """
+    assert parse_line("# a comment") is None
+    assert parse_line("   ") is None
+    assert parse_line('chroniq bump minor -m "New API"').argv == ["bump", "minor", "-m", "New API"]
+
+    command = parse_line('{"argv": ["bump", "patch"], "input": "Fix\\n"}')
+    assert command.argv == ["bump", "patch"]
+    assert command.input == "Fix\n"
+    assert parse_line('{"cmd": "log --lines 5"}').argv == ["log", "--lines", "5"]
+
+    with pytest.raises(BatchError, match="can't run inside a batch"):
+        parse_line("run other.txt")
+
+
+def test_run_executes_a_release_script_in_one_process(project):
+    """
+    Each command sees the state left by the previous one and gets its own result.
+    """
+    script = "\n".join([
+        "# release step",
+        '{"argv": ["bump", "minor"], "input": "y\\nNew API\\n"}',
+        "version",
+        "log --lines 5",
+    ])
+    result = CliRunner().invoke(main, ["run"], input=script)
+
+    assert result.exit_code == 0, result.output
+    results = _results(result)
+    assert [r["argv"][0] for r in results] == ["bump", "version", "log"]
+    assert all(r["ok"] for r in results)
+    assert "1.1.0" in results[1]["output"]
+    assert all("initialized" not in r["output"] and "initialized" in r["stderr"] for r in results)
+    assert "New API" in results[2]["output"]
+    assert (project / "version.txt").read_text(encoding="utf-8") == "1.1.0"
+
+
+def test_plain_bump_with_message_bumps_and_failures_stop_the_batch(project):
+    """
+    `bump minor -m "..."` needs no input and really bumps; a bump that fails
+    reports a non-zero exit code, so the batch stops there.
+    """
+    result = CliRunner().invoke(main, ["run"], input='bump minor -m "New API"\nlog --lines 5\n')
+
+    assert result.exit_code == 0, result.output
+    assert [r["ok"] for r in _results(result)] == [True, True]
+    assert (project / "version.txt").read_text(encoding="utf-8") == "1.1.0"
+    assert "New API" in (project / "CHANGELOG.md").read_text(encoding="utf-8")
+
+    result = CliRunner().invoke(main, ["run"], input="bump sideways\nbump patch -m Fix\n")
+
+    assert result.exit_code == 1
+    assert [r["exit_code"] for r in _results(result)] == [1]
+    assert (project / "version.txt").read_text(encoding="utf-8") == "1.1.0"
+
+
+def test_run_stops_at_first_failure_unless_keep_going(project):
+    """
+    A failing command ends the batch with exit code 1; --keep-going runs the rest.
+    """
+    script = "{not json\nversion\n"
+
+    stopped = CliRunner().invoke(main, ["run"], input=script)
+    assert stopped.exit_code == 1
+    assert [r["exit_code"] for r in _results(stopped)] == [2]
+
+    kept = CliRunner().invoke(main, ["run", "--keep-going"], input=script)
+    assert kept.exit_code == 1
+    assert [r["ok"] for r in _results(kept)] == [False, True]
+
+
+def test_run_reads_a_script_file(project):
+    """
+    A script path can be given instead of stdin.
+    """
+    (project / "release.chroniq").write_text("version\n", encoding="utf-8")
+    result = CliRunner().invoke(main, ["run", "release.chroniq"])
+
+    assert result.exit_code == 0, result.output
+    assert "1.0.0" in _results(result)[0]["output"]
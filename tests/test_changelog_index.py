@@ -0,0 +1,94 @@
+### tests/test_changelog_index.py
+
+import json
+
+from chroniq import changelog
+from chroniq.changelog_index import ChangelogIndex, index_path, section_digest
+
+SAMPLE = (
+    "# Changelog\n\nAll notable changes to this project will be documented here.\n"
+    "\n\n## [1.0.0] - 2025-04-01\n- First\n"
+    "\n\n## [1.1.0] - 2025-04-02\n- Second\n- Another\n"
+    "\n\n## [1.2.0]\n- Undated\n"
+)
+
+
+def _write(tmp_path, text=SAMPLE):
+    path = tmp_path / "CHANGELOG.md"
+    path.write_bytes(text.encode("utf-8"))
+    return path
+
+
+def test_build_indexes_every_section(tmp_path):
+    """
+    Every `## [version]` heading gets an entry with an exact byte span.
+    """
+    path = _write(tmp_path)
+    index = ChangelogIndex.load(path)
+    data = path.read_bytes()
+
+    assert [e.version for e in index.entries] == ["1.0.0", "1.1.0", "1.2.0"]
+    for entry in index.entries:
+        assert data[entry.offset:].startswith(f"## [{entry.version}]".encode())
+        assert entry.digest == section_digest(data[entry.offset:entry.offset + entry.length])
+    assert index.get("1.1.0").date == "2025-04-02"
+    assert index.get("1.2.0").date is None
+
+
+def test_lookups(tmp_path):
+    """
+    Membership, section retrieval and latest section come straight from the index.
+    """
+    index = ChangelogIndex.load(_write(tmp_path))
+
+    assert index.has_version("1.1.0")
+    assert not index.has_version("1.1")  # no more substring false positives
+    assert "- Another" in index.read_section("1.1.0")
+    assert "1.2.0" not in index.read_section("1.1.0")
+    assert index.latest().version == "1.2.0"
+
+
+def test_sidecar_is_reused_when_fresh(tmp_path, monkeypatch):
+    """
+    A fresh sidecar is loaded without rescanning the changelog.
+    """
+    path = _write(tmp_path)
+    ChangelogIndex.load(path)
+    assert index_path(path).exists()
+
+    def fail_build(*args, **kwargs):
+        raise AssertionError("changelog was rescanned")
+
+    monkeypatch.setattr(ChangelogIndex, "build", classmethod(fail_build))
+    assert ChangelogIndex.load(path).has_version("1.0.0")
+
+
+def test_stale_or_corrupt_sidecar_is_rebuilt(tmp_path):
+    """
+    Edits behind Chroniq's back (or a broken sidecar) trigger a rebuild.
+    """
+    path = _write(tmp_path)
+    ChangelogIndex.load(path)
+
+    with open(path, "ab") as f:
+        f.write(b"\n## [2.0.0] - 2025-05-01\n- Manual edit\n")
+    assert ChangelogIndex.load(path).has_version("2.0.0")
+
+    index_path(path).write_text("{not json", encoding="utf-8")
+    assert ChangelogIndex.load(path).has_version("2.0.0")
+
+
+def test_add_entry_updates_index_incrementally(tmp_path, monkeypatch):
+    """
+    add_entry records the new section without rescanning the file.
+    """
+    path = _write(tmp_path)
+    monkeypatch.setattr(changelog, "CHANGELOG_FILE", path)
+    ChangelogIndex.load(path)
+
+    changelog.add_entry("1.3.0", "Third")
+
+    stored = json.loads(index_path(path).read_text(encoding="utf-8"))
+    rebuilt = ChangelogIndex.build(path)
+    assert [list(e) for e in rebuilt.entries] == stored["sections"]
+    assert ChangelogIndex.load(path).latest().version == "1.3.0"
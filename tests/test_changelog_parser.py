@@ -0,0 +1,60 @@
+# tests/test_changelog_parser.py
+
+import io
+
+from chroniq.changelog import iter_changelog, iter_sections, remove_span
+from chroniq.changelog_index import section_digest
+
+SAMPLE = (
+    "# Changelog\n\nAll notable changes to this project will be documented here.\n"
+    "- not a section bullet\n"
+    "\n\n## [1.0.0] - 2025-04-01\n- First\n"
+    "\n\n## [1.1.0] - 2025-04-02\n- Second ✨\n* Starred\nPlain note\n"
+    "\n\n## [1.2.0]\n- Undated\n"
+)
+
+
+def test_sections_are_parsed_in_order():
+    """
+    Each heading becomes a Section with version, date and body lines; the preamble is skipped.
+    """
+    sections = list(iter_sections(io.BytesIO(SAMPLE.encode("utf-8"))))
+
+    assert [s.version for s in sections] == ["1.0.0", "1.1.0", "1.2.0"]
+    assert [s.date for s in sections] == ["2025-04-01", "2025-04-02", None]
+    assert sections[0].heading == "## [1.0.0] - 2025-04-01"
+    assert sections[1].lines == ["- Second ✨", "* Starred", "Plain note"]
+    assert sections[1].bullets == ["Second ✨", "Starred"]
+
+
+def test_spans_and_digests_match_file_bytes(tmp_path):
+    """
+    Byte spans cover heading → next heading, and digests agree with the index.
+    """
+    path = tmp_path / "CHANGELOG.md"
+    path.write_bytes(SAMPLE.encode("utf-8"))
+    data = path.read_bytes()
+
+    sections = list(iter_changelog(path, with_digest=True))
+
+    assert sections[-1].end == len(data)
+    for prev, nxt in zip(sections, sections[1:]):
+        assert prev.end == nxt.start
+    for section in sections:
+        assert data[section.start:].startswith(f"## [{section.version}]".encode())
+        assert section.digest == section_digest(data[section.start:section.end])
+
+
+def test_remove_span_streams_around_section(tmp_path):
+    """
+    remove_span drops exactly the requested bytes and keeps the rest intact.
+    """
+    path = tmp_path / "CHANGELOG.md"
+    path.write_bytes(SAMPLE.encode("utf-8"))
+
+    middle = list(iter_changelog(path))[1]
+    remove_span(path, middle.start, middle.end)
+
+    assert [s.version for s in iter_changelog(path)] == ["1.0.0", "1.2.0"]
+    assert b"Second" not in path.read_bytes()
+    assert not list(tmp_path.glob("*.tmp"))
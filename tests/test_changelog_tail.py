@@ -0,0 +1,69 @@
+### tests/test_changelog_tail.py
+
+import io
+from click.testing import CliRunner
+
+from chroniq import cli
+from chroniq.changelog import read_lines_reversed, tail_lines, tail_sections
+
+SAMPLE = (
+    "# Changelog\n\n"
+    "## [1.0.0] - 2025-04-01\n- First\n\n"
+    "## [1.1.0] - 2025-04-02\n- Second ✨\n- Fixed things\n\n"
+    "## [1.2.0] - 2025-04-03\n- Third\n"
+)
+
+
+def test_reversed_lines_match_forward_lines_for_any_block_size():
+    """
+    Lines split across block boundaries (including multi-byte UTF-8) are reassembled.
+    """
+    data = SAMPLE.encode("utf-8")
+    expected = list(reversed(data.split(b"\n")))
+    for block_size in (1, 2, 3, 7, 16, 4096):
+        assert list(read_lines_reversed(io.BytesIO(data), block_size)) == expected
+
+
+def test_tail_lines_returns_last_non_empty_lines(tmp_path):
+    """
+    tail_lines skips blank lines, strips CRLF and keeps file order.
+    """
+    path = tmp_path / "CHANGELOG.md"
+    path.write_bytes(SAMPLE.replace("\n", "\r\n").encode("utf-8"))
+
+    assert tail_lines(path, 3) == ["- Fixed things", "## [1.2.0] - 2025-04-03", "- Third"]
+    assert len(tail_lines(path, 1000)) == 8
+    assert tail_lines(path, 0) == []
+
+
+def test_tail_sections_returns_whole_sections(tmp_path):
+    """
+    tail_sections stops after `limit` headings and returns them oldest first.
+    """
+    path = tmp_path / "CHANGELOG.md"
+    path.write_text(SAMPLE, encoding="utf-8")
+
+    sections = tail_sections(path, 2)
+    assert [s.heading for s in sections] == ["## [1.1.0] - 2025-04-02", "## [1.2.0] - 2025-04-03"]
+    assert sections[0].lines == ["- Second ✨", "- Fixed things"]
+    assert len(tail_sections(path, 10)) == 3
+
+    # Byte spans line up with the file contents
+    data = path.read_bytes()
+    assert data[sections[1].start:sections[1].end].decode("utf-8") == "## [1.2.0] - 2025-04-03\n- Third\n"
+    assert data[sections[0].start:sections[0].end].startswith(b"## [1.1.0]")
+    assert sections[0].end == sections[1].start
+
+
+def test_cli_log_sections_mode(tmp_path, monkeypatch):
+    """
+    `chroniq log --sections N` prints the last N version sections.
+    """
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "CHANGELOG.md").write_text(SAMPLE, encoding="utf-8")
+
+    result = CliRunner().invoke(cli.main, ["log", "--sections", "1"])
+    assert result.exit_code == 0
+    assert "## [1.2.0]" in result.output
+    assert "- Third" in result.output
+    assert "1.1.0" not in result.output
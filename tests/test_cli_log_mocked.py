@@ -3,10 +3,8 @@
 import unittest
 import tempfile
 import os
-import io
-from unittest.mock import patch
 from click.testing import CliRunner
-from chroniq.cli import main, console
+from chroniq.cli import main
 
 class TestChroniqLogCommand(unittest.TestCase):
     def setUp(self):
@@ -35,17 +33,17 @@ class TestChroniqLogCommand(unittest.TestCase):
 
     def test_log_outputs_expected_lines(self):
         """
-        Capture Chroniq's CLI log output using a patched console buffer.
+        Capture Chroniq's CLI log output through the CliRunner.
+
+        `log` writes plain click output (no rich console), so the lines land
+        directly in the runner's captured output.
         """
-        # Patch the rich console output to use an in-memory buffer
-        buffer = io.StringIO()
-        with patch("chroniq.cli.console", new_callable=lambda: console.__class__(file=buffer)):
-            runner = CliRunner()
-            result = runner.invoke(main, ["log", "--lines", "3"])
-
-            output = buffer.getvalue()
-
-            # Validate that expected changelog lines were printed
-            self.assertIn("1.0.1", output)
-            self.assertIn("Fixed emoji crash", output)
-            self.assertIn("Added CLI fallback", output)
+        runner = CliRunner()
+        result = runner.invoke(main, ["log", "--lines", "3"])
+
+        output = result.output
+
+        # Validate that expected changelog lines were printed
+        self.assertIn("1.0.1", output)
+        self.assertIn("Fixed emoji crash", output)
+        self.assertIn("Added CLI fallback", output)
@@ -0,0 +1,98 @@
+# tests/test_cli_startup.py
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# Root of the repository so subprocesses can import `chroniq` without installing it
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules that lightweight commands must never pull in
+HEAVY_MODULES = ("rich", "tomli_w", "chroniq.logger", "chroniq.rollback", "chroniq.audit")
+
+# Cumulative import-time budget for `chroniq.cli` in microseconds (as reported by -X importtime)
+IMPORT_BUDGET_US = 120_000
+
+# Script run in a fresh interpreter: invoke a command, then report loaded modules
+PROBE = """
+import json, sys
+from chroniq.cli import main
+try:
+    main(sys.argv[1:], standalone_mode=False)
+finally:
+    sys.stdout.flush()
+heavy = {heavy!r}
+loaded = [m for m in heavy if m in sys.modules]
+sys.stderr.write("LOADED=" + json.dumps(loaded) + "\\n")
+"""
+
+
+def _run_probe(args, cwd):
+    """
+    Run a chroniq command in a fresh interpreter and return (stdout, loaded heavy modules).
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(heavy=HEAVY_MODULES), *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        env={**os.environ, "PYTHONPATH": str(REPO_ROOT), "PYTHONIOENCODING": "utf-8"},
+        check=True,
+    )
+    marker = next(line for line in result.stderr.splitlines() if line.startswith("LOADED="))
+    return result.stdout, json.loads(marker[len("LOADED="):])
+
+
+def test_version_does_not_load_heavy_modules(tmp_path):
+    """
+    `chroniq version` should run without importing rich, tomli_w or the logging stack.
+    """
+    (tmp_path / "version.txt").write_text("4.5.6", encoding="utf-8")
+
+    output, loaded = _run_probe(["version"], tmp_path)
+
+    assert "4.5.6" in output
+    assert loaded == [], f"`version` imported heavy modules: {loaded}"
+
+
+def test_log_does_not_load_heavy_modules(tmp_path):
+    """
+    `chroniq log` should run without importing rich, tomli_w or the logging stack.
+    """
+    (tmp_path / "CHANGELOG.md").write_text(
+        "# Changelog\n\n## [1.0.0] - 2025-04-13\n- First entry\n", encoding="utf-8"
+    )
+
+    output, loaded = _run_probe(["log", "--lines", "2"], tmp_path)
+
+    assert "First entry" in output
+    assert loaded == [], f"`log` imported heavy modules: {loaded}"
+
+
+def test_cli_import_time_within_budget(tmp_path):
+    """
+    Importing `chroniq.cli` should stay within the cold-start import budget.
+
+    Uses the best of a few runs of `python -X importtime` to smooth out noise.
+    """
+    timings = []
+    for _ in range(3):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import chroniq.cli"],
+            cwd=tmp_path,
+            capture_output=True,
+            text=True,
+            env={**os.environ, "PYTHONPATH": str(REPO_ROOT)},
+            check=True,
+        )
+        # Lines look like: "import time:   self [us] | cumulative | name"
+        for line in result.stderr.splitlines():
+            parts = [p.strip() for p in line.split("|")]
+            if len(parts) == 3 and parts[2] == "chroniq.cli":
+                timings.append(int(parts[1]))
+
+    assert timings, "Could not measure chroniq.cli import time"
+    assert min(timings) < IMPORT_BUDGET_US, f"chroniq.cli import took {min(timings)}us (budget {IMPORT_BUDGET_US}us)"
@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from click.testing import CliRunner
+
+from chroniq import config as config_module
+from chroniq.config import load_config, update_config_value, clear_config_cache, thaw_config, FrozenConfig
+from chroniq.cli import main
+
+
+class TestConfigCache(unittest.TestCase):
+    """
+    ✅ Tests for the in-process memoized config loader.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config_path = Path(self.tmp.name) / ".chroniq.toml"
+        self.config_path.write_text('default_bump = "minor"\n\n[logging]\nbackend = "off"\n', encoding="utf-8")
+        clear_config_cache()
+
+    def tearDown(self):
+        clear_config_cache()
+        self.tmp.cleanup()
+
+    def test_repeated_loads_are_memoized(self):
+        """
+        Loading an unchanged file twice should return the very same object.
+        """
+        first = load_config(path=self.config_path)
+        second = load_config(path=self.config_path)
+        self.assertIs(first, second)
+
+    def test_profile_is_part_of_the_key(self):
+        """
+        Different profiles must not share a cache entry.
+        """
+        self.assertIsNot(load_config(path=self.config_path), load_config("dev", path=self.config_path))
+
+    def test_file_change_invalidates(self):
+        """
+        A change in size or mtime should trigger a fresh parse.
+        """
+        config, _ = load_config(path=self.config_path)
+        self.assertEqual(config["default_bump"], "minor")
+
+        self.config_path.write_text('default_bump = "major"\n', encoding="utf-8")
+        st = self.config_path.stat()
+        os.utime(self.config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        config, _ = load_config(path=self.config_path)
+        self.assertEqual(config["default_bump"], "major")
+
+    def test_config_is_read_only(self):
+        """
+        The shared config (and nested tables) must reject mutation.
+        """
+        config, _ = load_config(path=self.config_path)
+        self.assertIsInstance(config, FrozenConfig)
+        with self.assertRaises(TypeError):
+            config["silent"] = True
+        with self.assertRaises(TypeError):
+            config["logging"]["backend"] = "rotating"
+
+        # 🧊 thaw_config hands back a plain, mutable copy
+        copy = thaw_config(config)
+        copy["logging"]["backend"] = "rotating"
+        self.assertEqual(config["logging"]["backend"], "off")
+
+    def test_update_config_value_invalidates(self):
+        """
+        Writing through update_config_value must drop the stale entry,
+        even when the rewrite keeps the same size and mtime.
+        """
+        load_config(path=self.config_path)
+        self.assertTrue(update_config_value("default_bump", "patch", config_path=self.config_path))
+        config, _ = load_config(path=self.config_path)
+        self.assertEqual(config["default_bump"], "patch")
+
+    def test_cli_config_delete_invalidates(self):
+        """
+        `chroniq config delete` must drop the cached entry for the file it rewrote.
+        """
+        load_config(path=self.config_path)
+        result = CliRunner().invoke(main, ["--config", str(self.config_path), "config", "delete", "default_bump", "--yes"])
+        self.assertEqual(result.exit_code, 0, msg=result.output)
+
+        cache_key = (os.path.abspath(self.config_path), None)
+        self.assertNotIn(cache_key, config_module._config_cache)
+
+    def test_clear_config_cache(self):
+        """
+        clear_config_cache() should force the next load to re-parse.
+        """
+        first = load_config(path=self.config_path)
+        clear_config_cache()
+        self.assertIsNot(first, load_config(path=self.config_path))
+
+
+if __name__ == "__main__":
+    unittest.main()
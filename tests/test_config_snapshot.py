@@ -0,0 +1,127 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from click.testing import CliRunner
+
+from chroniq.config import load_config, clear_config_cache, update_config_value
+from chroniq.config_snapshot import cache_stats, snapshot_path
+from chroniq.cli import main
+
+
+class TestConfigSnapshot(unittest.TestCase):
+    """
+    ✅ Tests for the cross-invocation on-disk config snapshots.
+    """
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.config_path = Path(self.tmp.name) / ".chroniq.toml"
+        self.config_path.write_text(
+            'default_bump = "minor"\nactive_profile = "dev"\n\n[profile.dev]\nsilent = true\n',
+            encoding="utf-8"
+        )
+        clear_config_cache()
+        for key in cache_stats:
+            cache_stats[key] = 0
+
+    def tearDown(self):
+        clear_config_cache()
+        self.tmp.cleanup()
+
+    def _fresh_process_load(self, profile=None):
+        """Simulate a new CLI invocation: forget the in-process cache and load again."""
+        clear_config_cache()
+        return load_config(profile, path=self.config_path)
+
+    def test_snapshot_written_and_reused(self):
+        """
+        The first load parses and snapshots; the next "process" is served from disk.
+        """
+        first = self._fresh_process_load()
+        self.assertTrue(snapshot_path(self.config_path).exists())
+        self.assertEqual(cache_stats["misses"], 1)
+
+        second = self._fresh_process_load()
+        self.assertEqual(cache_stats["snapshot_hits"], 1)
+        self.assertEqual(first, second)
+        self.assertEqual(second[0]["silent"], True)
+        self.assertEqual(second[1], "dev")
+
+    def test_snapshots_are_per_profile(self):
+        """
+        Each requested profile gets its own snapshot file.
+        """
+        self._fresh_process_load()
+        self._fresh_process_load("release")
+        self.assertTrue(snapshot_path(self.config_path, "release").exists())
+        self.assertNotEqual(snapshot_path(self.config_path), snapshot_path(self.config_path, "release"))
+
+    def test_touch_with_same_content_is_still_a_hit(self):
+        """
+        A changed stat with identical content is validated by the content hash.
+        """
+        self._fresh_process_load()
+        st = self.config_path.stat()
+        os.utime(self.config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000))
+
+        self._fresh_process_load()
+        self.assertEqual(cache_stats["snapshot_hits"], 1)
+        self.assertEqual(cache_stats["misses"], 1)
+
+    def test_changed_content_falls_back_to_parse(self):
+        """
+        A stale snapshot must never be served after the source changes.
+        """
+        self._fresh_process_load()
+        self.config_path.write_text('default_bump = "major"\n', encoding="utf-8")
+        st = self.config_path.stat()
+        os.utime(self.config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000))
+
+        config, profile = self._fresh_process_load()
+        self.assertEqual(config["default_bump"], "major")
+        self.assertEqual(profile, "default")
+        self.assertEqual(cache_stats["stale"], 1)
+
+    def test_corrupt_snapshot_falls_back_to_parse(self):
+        """
+        Garbage in the snapshot file is ignored and replaced.
+        """
+        self._fresh_process_load()
+        snapshot_path(self.config_path).write_bytes(b"\x00not a snapshot")
+
+        config, _ = self._fresh_process_load()
+        self.assertEqual(config["default_bump"], "minor")
+        self.assertEqual(cache_stats["corrupt"], 1)
+
+    def test_update_config_value_drops_snapshots(self):
+        """
+        Writing the config through Chroniq removes snapshots for that project.
+        """
+        self._fresh_process_load()
+        update_config_value("default_bump", "patch", config_path=self.config_path)
+        self.assertFalse(snapshot_path(self.config_path).exists())
+
+    def test_config_show_reports_cache_stats(self):
+        """
+        `chroniq config-show --cache-stats` prints hit/miss counters.
+        """
+        result = CliRunner().invoke(main, ["config-show", "--cache-stats"])
+        self.assertEqual(result.exit_code, 0, msg=result.output)
+        self.assertIn("snapshot_hits", result.output)
+        self.assertIn("misses", result.output)
+
+    def test_config_show_cache_stats_follow_the_config_option(self):
+        """
+        With --config, config-show loads that file and lists the snapshots next to it.
+        """
+        self._fresh_process_load()
+        result = CliRunner().invoke(main, ["--config", str(self.config_path), "config-show", "--cache-stats"])
+        self.assertEqual(result.exit_code, 0, msg=result.output)
+        self.assertIn("default_bump = minor", result.output)
+        self.assertIn(str(snapshot_path(self.config_path).parent), result.output.replace("\n", ""))
+        self.assertIn(snapshot_path(self.config_path).name, result.output)
+
+
+if __name__ == "__main__":
+    unittest.main()
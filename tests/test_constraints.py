@@ -0,0 +1,101 @@
+# tests/test_constraints.py
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from chroniq.cli import main
+from chroniq.constraints import ConstraintError, Constraint, VersionIndex, compile_constraint
+from chroniq.core import Version
+from chroniq.project import ChroniqProject, ProjectError
+
+VERSIONS = [
+    "0.2.3", "0.2.9", "0.3.0", "0.0.3", "0.0.4",
+    "1.0.0", "1.3.9", "1.4.0", "1.4.2", "1.9.0", "2.0.0-rc.1", "2.0.0",
+    "2.3.0", "2.3.1", "2.3.7", "2.4.0-alpha", "2.4.0", "3.0.0",
+]
+VERSIONS_SORTED = sorted(VERSIONS, key=lambda v: Version.parse(v).sort_key)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("^1.4", ["1.4.0", "1.4.2", "1.9.0"]),
+    ("^0.2.3", ["0.2.3", "0.2.9"]),
+    ("^0.0.3", ["0.0.3"]),
+    ("~2.3.1", ["2.3.1", "2.3.7"]),
+    ("~2.3", ["2.3.0", "2.3.1", "2.3.7"]),
+    (">=1.0.0,<2.0.0-0", ["1.0.0", "1.3.9", "1.4.0", "1.4.2", "1.9.0"]),
+    (">=1.0.0 <2.0.0", ["1.0.0", "1.3.9", "1.4.0", "1.4.2", "1.9.0", "2.0.0-rc.1"]),
+    ("1.4.x", ["1.4.0", "1.4.2"]),
+    ("=2.0.0", ["2.0.0"]),
+    (">2.3", ["2.4.0-alpha", "2.4.0", "3.0.0"]),
+    ("<=0.0", ["0.0.3", "0.0.4"]),
+    ("^0.0.3 || ~2.3.1 || >=3", ["0.0.3", "2.3.1", "2.3.7", "3.0.0"]),
+    (">=2.0.0,<1.0.0", []),
+    ("*", VERSIONS_SORTED),
+    ("^*", VERSIONS_SORTED),
+    ("~*", VERSIONS_SORTED),
+    (">=*", VERSIONS_SORTED),
+    ("<=*", VERSIONS_SORTED),
+    ("=x", VERSIONS_SORTED),
+    (">*", []),
+    ("<*", []),
+    (">* || ^3", ["3.0.0"]),
+])
+def test_ranges_match_by_interval_and_bisect(text, expected):
+    """
+    Caret, tilde, wildcard and comparator ranges select the same versions
+    through the linear matcher and the bisecting index.
+    """
+    constraint = compile_constraint(text)
+    index = VersionIndex(VERSIONS)
+
+    assert [str(v) for v in index.match(constraint)] == expected
+    assert sorted(constraint.filter(VERSIONS), key=lambda v: Version.parse(v).sort_key) == expected
+    assert ("1.4.2" in constraint) == ("1.4.2" in expected)
+
+
+def test_compiled_constraints_are_reused_and_bad_ranges_raise():
+    """
+    Repeated ranges are compiled once; malformed ones raise ConstraintError.
+    """
+    assert Constraint.parse("^1.4") is compile_constraint("^1.4")
+    assert str(VersionIndex(VERSIONS).latest("^1")) == "1.9.0"
+
+    for bad in ["", "^", "1.2.3.4", ">=abc", "1.x-beta", "^1.4 ||"]:
+        with pytest.raises(ConstraintError):
+            compile_constraint(bad)
+
+
+def test_project_versions_and_cli_match(tmp_path, monkeypatch):
+    """
+    The project index covers history, changelog and version.txt, and
+    `chroniq versions --match` prints the matches lowest first.
+    """
+    (tmp_path / "version.txt").write_text("1.0.0", encoding="utf-8")
+    (tmp_path / "CHANGELOG.md").write_text("# Changelog\n\n## [0.9.0] - 2025-01-01\n- Beta\n", encoding="utf-8")
+    project = ChroniqProject(tmp_path)
+    project.bump("minor")
+    project.bump("major")
+
+    assert project.versions() == ["0.9.0", "1.0.0", "1.1.0", "2.0.0"]
+    assert project.versions("^1") == ["1.0.0", "1.1.0"]
+    with pytest.raises(ProjectError):
+        project.versions("^^1")
+
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+    result = runner.invoke(main, ["versions", "--match", ">=1.0.0,<2.0.0-0", "--json"])
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert payload["versions"] == ["1.0.0", "1.1.0"]
+
+    result = runner.invoke(main, ["versions", "--match", "~0.9", "--latest"])
+    assert result.stdout.strip().splitlines()[-1] == "0.9.0"
+
+    result = runner.invoke(main, ["versions", "--match", "nope"])
+    assert result.exit_code == 1
+
+    result = runner.invoke(main, ["versions", "--match", ">*"])
+    assert result.exit_code == 0 and result.exception is None
+    assert "No matching versions" in result.output
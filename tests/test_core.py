@@ -68,4 +68,18 @@ def test_load_save_roundtrip():
         v1.save(path)  # Save version to a temporary file
 
         v2 = SemVer.load(path)  # Load it back
-        assert str(v2) == "2.4.6", "Load/save roundtrip failed"
\ No newline at end of file
+        assert str(v2) == "2.4.6", "Load/save roundtrip failed"
+
+def test_parse_many_reports_errors_per_item():
+    """
+    parse_many returns a SemVer or an InvalidVersionError for every input, in order.
+    """
+    from chroniq.errors import InvalidVersionError
+
+    results = SemVer.parse_many(["1.2.3", " 1.0.0", "2.0.0-rc.1", None, "01.2.3"])
+
+    assert [str(r) for r in results if isinstance(r, SemVer)] == ["1.2.3", "2.0.0-rc.1"]
+    errors = [r for r in results if isinstance(r, InvalidVersionError)]
+    assert len(errors) == 3
+    assert "whitespace" in str(results[1])
+    assert "'01.2.3'" in str(results[4])
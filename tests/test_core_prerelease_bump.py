@@ -38,5 +38,43 @@ class TestPrereleaseBump(unittest.TestCase):
         with self.assertRaises(ValueError):
             v.bump_prerelease("")
 
+    def test_labels_are_literal_not_patterns(self):
+        """
+        Regex metacharacters in a label are rejected instead of changing what matches.
+        """
+        v = SemVer(1, 0, 0, "rcc.1")
+        for label in ["rc+", "(a+)+", "a|b", "beta..1", ".rc"]:
+            with self.assertRaises(ValueError):
+                v.bump_prerelease(label)
+        self.assertEqual(str(v), "1.0.0-rcc.1")
+
+    def test_dotted_labels_increment_the_numeric_tail(self):
+        """
+        Only the last identifier is the counter, so labels may contain dots.
+        """
+        v = SemVer(1, 0, 0, "beta.1.3")
+        v.bump_prerelease("beta.1")
+        self.assertEqual(str(v), "1.0.0-beta.1.4")
+
+    def test_promote_walks_the_chain_to_the_release(self):
+        """
+        promote() moves alpha → beta → rc → final, and accepts a custom chain.
+        """
+        v = SemVer(2, 0, 0, "alpha.3")
+        stages = []
+        for _ in range(3):
+            v.promote()
+            stages.append(str(v))
+        self.assertEqual(stages, ["2.0.0-beta.1", "2.0.0-rc.1", "2.0.0"])
+
+        with self.assertRaises(ValueError):
+            v.promote()  # already a release
+        with self.assertRaises(ValueError):
+            SemVer(2, 0, 0, "nightly.4").promote()
+
+        v = SemVer(2, 0, 0, "dev.2")
+        v.promote(["dev", "preview"])
+        self.assertEqual(str(v), "2.0.0-preview.1")
+
 if __name__ == "__main__":
     unittest.main()
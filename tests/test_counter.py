@@ -0,0 +1,85 @@
+# tests/test_counter.py
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from click.testing import CliRunner
+
+from chroniq.cli import main
+from chroniq.core import Version
+from chroniq.counter import COUNTER_PATH, CounterError, reserve, reserve_versions
+
+
+def _reserve_many(root, rounds):
+    # Runs in a worker process
+    return [list(reserve(root, "build", count=3)) for _ in range(rounds)]
+
+
+def test_concurrent_processes_get_disjoint_blocks(tmp_path):
+    """
+    Blocks reserved from many processes at once never overlap and leave no gaps.
+    """
+    with ProcessPoolExecutor(max_workers=6) as pool:
+        results = list(pool.map(_reserve_many, [tmp_path] * 6, [10] * 6))
+
+    numbers = [n for blocks in results for block in blocks for n in block]
+    assert sorted(numbers) == list(range(1, 6 * 10 * 3 + 1))
+    assert json.loads((tmp_path / COUNTER_PATH).read_text(encoding="utf-8")) == {"build": 180}
+
+
+def test_block_allocates_locally_until_used_up(tmp_path):
+    """
+    A reserved block hands out its numbers in order, then raises CounterError.
+    """
+    reserve(tmp_path, "nightly", count=4)
+    block = reserve(tmp_path, "nightly", count=2)
+    assert (block.first, block.last, len(block), 6 in block) == (5, 6, 2, True)
+
+    assert [block.allocate(), block.allocate()] == [5, 6]
+    assert block.remaining == 0
+    with pytest.raises(CounterError):
+        block.allocate()
+
+    with pytest.raises(CounterError):
+        reserve(tmp_path, "nightly", count=0)
+    (tmp_path / COUNTER_PATH).write_text("not json", encoding="utf-8")
+    with pytest.raises(CounterError):
+        reserve(tmp_path, "nightly")
+
+
+def test_reserve_versions_numbers_prerelease_or_build(tmp_path):
+    """
+    Prerelease numbers count per MAJOR.MINOR.PATCH; build numbers are project-wide.
+    """
+    base = Version.parse("2.1.0-rc.1")
+    assert reserve_versions(tmp_path, base, 2, pre="nightly") == ["2.1.0-nightly.1", "2.1.0-nightly.2"]
+    assert reserve_versions(tmp_path, Version.parse("2.2.0"), 1, pre="nightly") == ["2.2.0-nightly.1"]
+    assert reserve_versions(tmp_path, base, 2) == ["2.1.0-rc.1+build.1", "2.1.0-rc.1+build.2"]
+    assert reserve_versions(tmp_path, Version.parse("3.0.0"), 1) == ["3.0.0+build.3"]
+
+    with pytest.raises(CounterError):
+        reserve_versions(tmp_path, base, 1, pre="nightly", build="ci")
+    with pytest.raises(ValueError):
+        reserve_versions(tmp_path, base, 1, pre="night+ly")
+
+
+def test_cli_next_reserves_without_touching_version_file(tmp_path, monkeypatch):
+    """
+    `chroniq next --count N` prints N fresh versions and leaves version.txt alone.
+    """
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "version.txt").write_text("2.1.0", encoding="utf-8")
+    runner = CliRunner()
+
+    result = runner.invoke(main, ["next", "--count", "2", "--pre", "nightly", "--json"])
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert payload == {"base": "2.1.0", "versions": ["2.1.0-nightly.1", "2.1.0-nightly.2"]}
+
+    result = runner.invoke(main, ["next"])
+    assert result.stdout.strip().splitlines()[-1] == "2.1.0+build.1"
+    assert (tmp_path / "version.txt").read_text(encoding="utf-8") == "2.1.0"
+
+    result = runner.invoke(main, ["next", "--pre", "bad label"])
+    assert result.exit_code == 1
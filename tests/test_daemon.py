@@ -0,0 +1,93 @@
+# tests/test_daemon.py
+
+import os
+import threading
+import uuid
+
+import pytest
+
+from chroniq import daemon
+from chroniq.changelog_index import ChangelogIndex
+from chroniq.daemon import create_server, request
+
+
+@pytest.fixture
+def running_daemon(monkeypatch):
+    """Serve on a short /tmp socket (AF_UNIX paths are length-limited) in a background thread."""
+    path = f"/tmp/chroniq-test-{uuid.uuid4().hex[:8]}.sock"
+    monkeypatch.setenv(daemon.SOCKET_ENV, path)
+
+    server = create_server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    if os.path.exists(path):
+        os.unlink(path)
+
+
+def test_ping_and_forwarded_version(project, running_daemon):
+    """
+    The daemon answers pings and runs commands in the client's directory.
+    """
+    assert request({"op": "ping"})["pid"] == os.getpid()
+
+    response = request({"op": "run", "argv": ["version"], "cwd": str(project)})
+    assert response["exit_code"] == 0
+    assert "1.0.0" in response["output"]
+    # The startup banner goes to stderr, as it would from a subprocess
+    assert "initialized" not in response["output"]
+    assert "initialized" in response["stderr"]
+
+    # State stays valid when files change between requests
+    (project / "version.txt").write_text("2.0.0", encoding="utf-8")
+    response = request({"op": "run", "argv": ["version"], "cwd": str(project)})
+    assert "2.0.0" in response["output"]
+
+
+def test_second_daemon_is_refused(running_daemon):
+    """
+    Starting a daemon on a socket that's already served is an error.
+    """
+    with pytest.raises(RuntimeError, match="already listening"):
+        create_server()
+
+
+def test_client_forwards_to_daemon(project, running_daemon, capsys):
+    """
+    `chroniq-client version` prints the daemon's output and exit code.
+    """
+    with pytest.raises(SystemExit) as excinfo:
+        daemon.client_main(["version"])
+
+    assert excinfo.value.code == 0
+    assert "1.0.0" in capsys.readouterr().out
+    assert running_daemon.requests == 1
+
+
+def test_client_falls_back_without_daemon(project, monkeypatch):
+    """
+    With no daemon listening, the client runs the command in-process.
+    """
+    monkeypatch.setenv(daemon.SOCKET_ENV, f"/tmp/chroniq-missing-{uuid.uuid4().hex[:8]}.sock")
+    calls = []
+    monkeypatch.setattr("chroniq.cli.main", lambda argv, **kw: calls.append(argv))
+
+    daemon.client_main(["--config", "custom.toml", "log"])
+    assert calls == [["--config", "custom.toml", "log"]]
+
+
+def test_changelog_index_is_memoised_until_the_file_changes(project):
+    """
+    Repeated loads in one process return the same index until the changelog changes.
+    """
+    changelog = project / "CHANGELOG.md"
+    first = ChangelogIndex.load(changelog)
+    assert ChangelogIndex.load(changelog) is first
+
+    with changelog.open("a", encoding="utf-8") as f:
+        f.write("\n## [1.0.1] - 2025-02-01\n- Fix\n")
+    reloaded = ChangelogIndex.load(changelog)
+    assert reloaded is not first
+    assert reloaded.has_version("1.0.1")
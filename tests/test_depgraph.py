@@ -0,0 +1,153 @@
+# tests/test_depgraph.py
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from chroniq import depgraph
+from chroniq.cli import main
+from chroniq.depgraph import DependencyCycleError, DependencyGraph, GraphError, build_graph, load_graph
+from chroniq.discovery import discover_packages
+from chroniq.workspace import propagate_bump
+
+
+def _package(root, rel, version="1.0.0", depends=(), name=None):
+    package = root / rel
+    package.mkdir(parents=True)
+    (package / "version.txt").write_text(version, encoding="utf-8")
+    lines = ["[package]"]
+    if name:
+        lines.append(f'name = "{name}"')
+    lines.append("depends_on = [" + ", ".join(f'"{d}"' for d in depends) + "]")
+    (package / ".chroniq.toml").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return package
+
+
+@pytest.fixture
+def monorepo(tmp_path, monkeypatch):
+    """
+    core ← api ← web
+    core ← cli
+    docs (independent)
+    """
+    monkeypatch.chdir(tmp_path)
+    _package(tmp_path, "libs/core")
+    _package(tmp_path, "libs/api", "0.3.0", depends=["core"])
+    _package(tmp_path, "apps/web", "2.0.0", depends=["api", "core"])
+    _package(tmp_path, "apps/cli-tool", "0.1.0", depends=["core"], name="cli")
+    _package(tmp_path, "docs", "0.0.1")
+    return tmp_path
+
+
+def test_levels_follow_dependencies(monorepo):
+    """
+    Packages come after their dependencies; independent ones share a level.
+    """
+    graph = load_graph(monorepo, discover_packages(monorepo))
+
+    assert graph.resolve("apps/cli-tool") == "cli"
+    assert graph.affected_by("core") == {"core", "api", "web", "cli"}
+    assert graph.levels(graph.affected_by("core")) == [["core"], ["api", "cli"], ["web"]]
+    assert graph.levels(graph.affected_by("api")) == [["api"], ["web"]]
+
+
+def test_cycles_are_reported_with_their_path():
+    """
+    A cycle names every package on the loop.
+    """
+    graph = DependencyGraph(
+        paths={"a": "a", "b": "b", "c": "c", "d": "d"},
+        depends={"a": ["c"], "b": ["a"], "c": ["b"], "d": []},
+    )
+    with pytest.raises(DependencyCycleError) as excinfo:
+        graph.levels()
+
+    assert excinfo.value.cycle == ["a", "c", "b", "a"]
+    assert "a → c → b → a" in str(excinfo.value)
+
+
+def test_unknown_dependency_is_rejected(monorepo):
+    """
+    Depending on a package that doesn't exist is an error, not a silent skip.
+    """
+    (monorepo / "docs" / ".chroniq.toml").write_text('[package]\ndepends_on = ["nope"]\n', encoding="utf-8")
+    with pytest.raises(GraphError, match="unknown package 'nope'"):
+        build_graph(monorepo, discover_packages(monorepo))
+
+
+def test_graph_is_cached_until_a_manifest_changes(monorepo, monkeypatch):
+    """
+    An unchanged workspace reuses the cached graph; editing a manifest rebuilds it.
+    """
+    packages = discover_packages(monorepo)
+    load_graph(monorepo, packages)
+
+    calls = []
+    real_build = depgraph.build_graph
+    monkeypatch.setattr(depgraph, "build_graph", lambda *a: calls.append(1) or real_build(*a))
+
+    load_graph(monorepo, packages)
+    assert calls == []
+
+    (monorepo / "docs" / ".chroniq.toml").write_text('[package]\ndepends_on = ["core", "api"]\n', encoding="utf-8")
+    graph = load_graph(monorepo, packages)
+    assert calls == [1]
+    assert "docs" in graph.affected_by("core")
+
+
+def test_propagate_bumps_dependents_in_order(monorepo):
+    """
+    The target gets its bump; every dependent gets a patch bump and a changelog line.
+    """
+    graph = load_graph(monorepo, discover_packages(monorepo))
+    report = propagate_bump(monorepo, graph, "core", level="minor", message="New core API")
+
+    versions = {r.package: r.new_version for r in report.results}
+    assert versions == {"core": "1.1.0", "api": "0.3.1", "cli": "0.1.1", "web": "2.0.1"}
+    assert [r.package for r in report.results][0] == "core"
+    assert [r.package for r in report.results][-1] == "web"
+    assert (monorepo / "docs" / "version.txt").read_text(encoding="utf-8") == "0.0.1"
+
+    web_log = (monorepo / "apps" / "web" / "CHANGELOG.md").read_text(encoding="utf-8")
+    assert "Updated dependencies: api 0.3.1, core 1.1.0" in web_log
+
+
+def test_failed_dependency_skips_dependents(monorepo):
+    """
+    If a package fails to bump, nothing that depends on it is bumped.
+    """
+    (monorepo / "libs" / "api" / "version.txt").write_text("garbage", encoding="utf-8")
+    graph = load_graph(monorepo, discover_packages(monorepo))
+
+    report = propagate_bump(monorepo, graph, "core")
+
+    by_name = {r.package: r for r in report.results}
+    assert by_name["cli"].ok
+    assert not by_name["api"].ok
+    assert by_name["web"].error == "skipped: dependency api failed"
+    assert (monorepo / "apps" / "web" / "version.txt").read_text(encoding="utf-8") == "2.0.0"
+
+
+def test_cli_propagate(monorepo):
+    """
+    `chroniq bump <pkg> --propagate --json` reports the whole cascade.
+    """
+    result = CliRunner().invoke(main, ["bump", "api", "--propagate", "--json"])
+
+    assert result.exit_code == 0, result.output
+    summary = json.loads(result.stdout)
+    assert [(p["package"], p["new_version"]) for p in summary["packages"]] == [("api", "0.3.1"), ("web", "2.0.1")]
+
+
+def test_cli_propagate_reports_cycle(monorepo):
+    """
+    A cycle aborts the propagation before any file is written.
+    """
+    (monorepo / "libs" / "core" / ".chroniq.toml").write_text('[package]\ndepends_on = ["web"]\n', encoding="utf-8")
+
+    result = CliRunner().invoke(main, ["bump", "core", "--propagate"])
+
+    assert result.exit_code == 1
+    assert "Dependency cycle" in result.output
+    assert (monorepo / "libs" / "core" / "version.txt").read_text(encoding="utf-8") == "1.0.0"
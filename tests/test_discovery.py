@@ -0,0 +1,89 @@
+# tests/test_discovery.py
+
+import json
+import os
+
+import pytest
+from click.testing import CliRunner
+
+from chroniq import discovery
+from chroniq.cli import main
+from chroniq.discovery import DISCOVERY_CACHE, WorkspaceScanner, discover_packages
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    """A small monorepo with packages, ignored directories and nested packages."""
+    monkeypatch.chdir(tmp_path)
+    # Treat every directory mtime as settled so the cache is trusted immediately
+    monkeypatch.setattr(discovery, "MTIME_GRACE_NS", -10**18)
+
+    for rel in ["libs/core", "libs/core/plugins/extra", "apps/web"]:
+        (tmp_path / rel).mkdir(parents=True)
+        (tmp_path / rel / "version.txt").write_text("1.0.0", encoding="utf-8")
+    (tmp_path / "apps" / "cli").mkdir()
+    (tmp_path / "apps" / "cli" / ".chroniq.toml").write_text("", encoding="utf-8")
+
+    for ignored in ["node_modules/left-pad", ".git/objects", ".venv/lib", "vendor/thing"]:
+        (tmp_path / ignored).mkdir(parents=True)
+        (tmp_path / ignored / "version.txt").write_text("0.0.1", encoding="utf-8")
+    return tmp_path
+
+
+def _names(root, packages):
+    return [p.relative_to(root).as_posix() for p in packages]
+
+
+def test_scandir_discovery_honours_ignore_patterns(tree):
+    """
+    Marker files are found at any depth; ignored directories are never entered.
+    """
+    packages = WorkspaceScanner(tree, list(discovery.DEFAULT_IGNORE) + ["vendor"]).discover()
+    assert _names(tree, packages) == ["apps/cli", "apps/web", "libs/core", "libs/core/plugins/extra"]
+
+
+def test_config_adds_ignore_patterns(tree):
+    """
+    `[workspace] ignore` in the root config extends the defaults.
+    """
+    assert "vendor/thing" in _names(tree, discover_packages(tree))
+
+    (tree / ".chroniq.toml").write_text('[workspace]\nignore = ["vendor"]\n', encoding="utf-8")
+    assert "vendor/thing" not in _names(tree, discover_packages(tree))
+
+
+def test_cached_run_only_rescans_changed_dirs(tree):
+    """
+    A second run reuses the cache, and only changed directories are listed again.
+    """
+    first = WorkspaceScanner(tree)
+    packages = first.discover()
+    assert (tree / DISCOVERY_CACHE).exists()
+    assert first.stats["rescanned"] == first.stats["dirs"]
+
+    second = WorkspaceScanner(tree)
+    assert second.discover() == packages
+    assert second.stats["rescanned"] == 0
+
+    # Adding a package changes only its parent directory's mtime
+    (tree / "apps" / "api").mkdir()
+    (tree / "apps" / "api" / "version.txt").write_text("0.1.0", encoding="utf-8")
+    os.utime(tree / "apps", ns=(1, 1))
+
+    third = WorkspaceScanner(tree)
+    assert "apps/api" in _names(tree, third.discover())
+    assert third.stats["rescanned"] == 2  # apps/ and the new apps/api/
+
+
+def test_workspace_list_command(tree):
+    """
+    `chroniq workspace list --json` reports each package and its version.
+    """
+    result = CliRunner().invoke(main, ["workspace", "list", "--json"])
+
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.stdout)
+    rows = {row["package"]: row["version"] for row in payload["packages"]}
+    assert rows["libs/core"] == "1.0.0"
+    assert rows["apps/cli"] is None
+    assert "node_modules/left-pad" not in rows
@@ -0,0 +1,195 @@
+# tests/test_history.py
+
+import pytest
+from click.testing import CliRunner
+
+from chroniq import changelog
+from chroniq.cli import main
+from chroniq.history import (
+    HISTORY_MAGIC,
+    HISTORY_PATH,
+    RECORD_SIZE,
+    HistoryError,
+    HistoryRecord,
+    VersionHistory,
+    pack_record,
+    parse_moment,
+)
+from tests.helpers import HEADER
+
+
+def _write_history(path, records):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(HISTORY_MAGIC + b"".join(pack_record(r) for r in records))
+
+
+def test_records_round_trip(tmp_path):
+    """
+    Records are fixed-size and come back exactly as written.
+    """
+    history = VersionHistory(tmp_path / "history.bin")
+    history.append("1.0.0", "1.1.0-beta.1", 42)
+    history.append("1.1.0-beta.1", "1.1.0")
+
+    assert len(history) == 2
+    assert (tmp_path / "history.bin").stat().st_size == len(HISTORY_MAGIC) + 2 * RECORD_SIZE
+    assert history[0][1:] == ("1.0.0", "1.1.0-beta.1", 42)
+    assert history.last()[1:] == ("1.1.0-beta.1", "1.1.0", -1)
+    assert [r.new_version for r in history.tail(5)] == ["1.1.0-beta.1", "1.1.0"]
+
+    with pytest.raises(HistoryError):
+        history.append("1.0.0", "1.0.0-" + "x" * 80)
+
+
+def test_version_at_bisects_timestamps(tmp_path):
+    """
+    `version_at` finds the version in effect at any moment across many records.
+    """
+    path = tmp_path / "history.bin"
+    _write_history(path, [
+        HistoryRecord(1_000 + 10 * i, f"0.0.{i}", f"0.0.{i + 1}", -1) for i in range(10_000)
+    ])
+    history = VersionHistory(path)
+
+    assert history.version_at(0) == "0.0.0"
+    assert history.version_at(1_000) == "0.0.1"
+    assert history.version_at(1_009) == "0.0.1"
+    assert history.version_at(1_000 + 10 * 5_000) == "0.0.5001"
+    assert history.version_at(10**12) == "0.0.10000"
+    assert VersionHistory(tmp_path / "missing.bin").version_at(0) is None
+
+
+def test_torn_record_is_ignored_and_repaired(tmp_path):
+    """
+    A partially written trailing record never shifts later appends.
+    """
+    history = VersionHistory(tmp_path / "history.bin")
+    history.append("1.0.0", "1.0.1")
+    with open(history.path, "ab") as f:
+        f.write(b"\x01\x02\x03")
+
+    assert len(history) == 1
+    history.append("1.0.1", "1.0.2")
+    assert [r.new_version for r in history.tail(2)] == ["1.0.1", "1.0.2"]
+
+
+def test_parse_moment():
+    """
+    A bare date covers the whole day; bad input raises HistoryError.
+    """
+    assert parse_moment("2025-04-20") - parse_moment("2025-04-20T00:00:00") == 86_399
+    with pytest.raises(HistoryError):
+        parse_moment("yesterday")
+
+
+def test_rollback_steps_undoes_several_bumps(project):
+    """
+    `rollback --steps 2` restores the version from two bumps ago and drops both sections.
+    """
+    runner = CliRunner()
+    runner.invoke(main, ["bump", "patch"], input="y\nFirst fix\n")
+    runner.invoke(main, ["bump", "minor"], input="y\nFeature\n")
+    runner.invoke(main, ["bump", "patch"], input="y\nSecond fix\n")
+    assert (project / "version.txt").read_text(encoding="utf-8").strip() == "1.1.1"
+
+    result = runner.invoke(main, ["rollback", "--steps", "2", "--yes"])
+
+    assert result.exit_code == 0, result.output
+    assert (project / "version.txt").read_text(encoding="utf-8").strip() == "1.0.1"
+    text = (project / "CHANGELOG.md").read_text(encoding="utf-8")
+    assert "## [1.0.1]" in text
+    assert "## [1.1.0]" not in text and "## [1.1.1]" not in text
+    assert len(VersionHistory(project / HISTORY_PATH)) == 1
+
+    # Asking for more steps than were recorded leaves everything alone
+    runner.invoke(main, ["rollback", "--steps", "5", "--yes"])
+    assert (project / "version.txt").read_text(encoding="utf-8").strip() == "1.0.1"
+
+
+def test_rollback_keeps_content_written_after_the_bump(project, monkeypatch):
+    """
+    A section added by hand after the bumped one survives `rollback --yes`:
+    the recorded spans no longer reach EOF, so nothing is blindly truncated.
+    """
+    runner = CliRunner()
+    runner.invoke(main, ["bump", "minor"], input="y\nFeature\n")
+    with open(project / "CHANGELOG.md", "a", encoding="utf-8") as f:
+        f.write("\n\n## [Unreleased]\n- Work in progress\n")
+
+    truncated = []
+    real_remove = changelog.remove_appended_sections
+    monkeypatch.setattr("chroniq.rollback.remove_appended_sections",
+                        lambda *a: truncated.append(real_remove(*a)) or truncated[-1])
+
+    result = runner.invoke(main, ["rollback", "--yes"])
+
+    assert result.exit_code == 0, result.output
+    assert truncated == [None]
+    text = (project / "CHANGELOG.md").read_text(encoding="utf-8")
+    assert "## [1.1.0]" not in text
+    assert "## [Unreleased]\n- Work in progress" in text
+    assert (project / "version.txt").read_text(encoding="utf-8").strip() == "1.0.0"
+
+
+def test_rollback_steps_verifies_every_section_digest(project):
+    """
+    An edit inside an earlier recorded section stops the one-shot truncate;
+    the sections are then removed one by one and the edit's neighbours survive.
+    """
+    runner = CliRunner()
+    runner.invoke(main, ["bump", "patch"], input="y\nFirst fix\n")
+    runner.invoke(main, ["bump", "minor"], input="y\nFeature\n")
+
+    record = changelog.read_append_record(project / "CHANGELOG.md")
+    assert [s["version"] for s in record["sections"]] == ["1.0.1", "1.1.0"]
+
+    path = project / "CHANGELOG.md"
+    path.write_text(path.read_text(encoding="utf-8").replace("- First fix", "- First fix (edited)"), encoding="utf-8")
+    assert changelog.remove_appended_sections(
+        path, [("1.0.1", record["sections"][0]["truncate_at"]), ("1.1.0", record["truncate_at"])]) is None
+
+    result = runner.invoke(main, ["rollback", "--steps", "2", "--yes"])
+    assert result.exit_code == 0, result.output
+    text = path.read_text(encoding="utf-8")
+    assert "## [1.0.1]" not in text and "## [1.1.0]" not in text
+    assert text.startswith(HEADER)
+
+
+def test_versions_too_long_for_the_journal_are_refused_up_front(project):
+    """
+    A bump or `next` whose version can't fit a history record fails with a
+    clear message before prompting, writing or reserving anything.
+    """
+    label = "nightly-" + "x" * 60
+    runner = CliRunner()
+
+    result = runner.invoke(main, ["bump", "minor", "--pre", label])
+    assert result.exit_code == 1
+    assert "history journal records at most 64" in result.output
+    assert "changelog entry" not in result.output
+    assert (project / "version.txt").read_text(encoding="utf-8") == "1.0.0"
+    assert not (project / HISTORY_PATH).exists()
+
+    result = runner.invoke(main, ["next", "--pre", label])
+    assert result.exit_code == 1
+    assert "history journal records at most 64" in result.output
+    assert not (project / ".chroniq" / "counters.json").exists()
+
+    with pytest.raises(HistoryError, match="Use a shorter prerelease or build label"):
+        pack_record(HistoryRecord(0, "1.0.0", f"1.1.0-{label}", -1))
+
+
+def test_history_and_version_at_commands(project):
+    """
+    `chroniq history` lists bumps and `chroniq version --at` looks one up by date.
+    """
+    runner = CliRunner()
+    assert "No version history" in runner.invoke(main, ["history"]).output
+
+    runner.invoke(main, ["bump", "major"], input="n\n")
+
+    listing = runner.invoke(main, ["history"]).output
+    assert "1.0.0" in listing and "2.0.0" in listing
+
+    assert "2.0.0" in runner.invoke(main, ["version", "--at", "2999-01-01"]).output
+    assert "1.0.0" in runner.invoke(main, ["version", "--at", "2000-01-01"]).output
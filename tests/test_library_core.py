@@ -0,0 +1,95 @@
+# tests/test_library_core.py
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from chroniq import changelog
+from chroniq.core import SemVer
+from chroniq.errors import ChangelogError, ChroniqError, InvalidVersionError, MissingVersionFileError, VersionFileError
+
+# Root of the repository so subprocesses can import `chroniq` without installing it
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Exercise the library layer in a fresh interpreter, then report whether rich was loaded
+PROBE = """
+import json, sys
+from chroniq import audit, bumper, changelog, changelog_index, config, core, depgraph, discovery, history, rollback, transaction, workspace
+from chroniq.project import ChroniqProject
+
+project = ChroniqProject(".")
+project.bump("minor", message="Library bump")
+project.add_entries(["Second note"])
+report = project.audit(strict=True)
+project.rollback()
+changelog.append_entry(project.version, "Direct append")
+sys.stdout.write(json.dumps({"version": project.version, "ok": report.ok, "rich": "rich" in sys.modules}))
+"""
+
+
+def test_library_layer_never_imports_rich(tmp_path):
+    """
+    Importing the core modules and running project operations stays silent and rich-free.
+    """
+    (tmp_path / "version.txt").write_text("1.0.0", encoding="utf-8")
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        env={**os.environ, "PYTHONPATH": str(REPO_ROOT)},
+        check=True,
+    )
+
+    assert json.loads(result.stdout) == {"version": "1.0.0", "ok": True, "rich": False}
+    assert result.stderr == ""
+
+
+def test_semver_read_and_write_raise_typed_errors(tmp_path):
+    """
+    read() never creates or overwrites the file; failures are ChroniqErrors.
+    """
+    path = tmp_path / "version.txt"
+    with pytest.raises(MissingVersionFileError):
+        SemVer.read(path)
+    assert not path.exists()
+
+    path.write_text("not-a-version", encoding="utf-8")
+    with pytest.raises(VersionFileError, match="Invalid version format"):
+        SemVer.read(path)
+    assert path.read_text(encoding="utf-8") == "not-a-version"
+
+    SemVer(3, 1, 4).write(path)
+    assert str(SemVer.read(path)) == "3.1.4"
+
+    with pytest.raises(VersionFileError):
+        SemVer(1, 0, 0).write(tmp_path / "missing-dir" / "version.txt")
+
+    with pytest.raises(InvalidVersionError) as excinfo:
+        SemVer.from_string("1.2")
+    assert isinstance(excinfo.value, (ValueError, ChroniqError))
+
+
+def test_append_entry_is_silent_and_raises(tmp_path, capsys):
+    """
+    append_entry returns the section offset instead of printing, and raises on bad input.
+    """
+    path = tmp_path / "CHANGELOG.md"
+    assert changelog.create_changelog(path) is True
+    assert changelog.create_changelog(path) is False
+
+    offset = changelog.append_entry("1.0.0", ["First", "Second"], path)
+    assert path.read_bytes()[offset:].startswith(b"## [1.0.0]")
+    assert path.read_text(encoding="utf-8").endswith("- First\n- Second\n")
+
+    with pytest.raises(ChangelogError):
+        changelog.append_entry("1.0.1", "   ", path)
+    with pytest.raises(ChangelogError):
+        changelog.append_entry("1.0.1", "x", tmp_path / "missing-dir" / "CHANGELOG.md")
+
+    assert capsys.readouterr().out == ""
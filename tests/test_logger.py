@@ -0,0 +1,85 @@
+# tests/test_logger.py
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from chroniq.logger import resolve_log_settings, DEFAULT_LOG_SETTINGS
+
+# Root of the repository so subprocesses can import `chroniq` without installing it
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _run(code, cwd):
+    """
+    Run a snippet in a fresh interpreter so the logging pipeline starts from scratch.
+    """
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(REPO_ROOT)},
+        check=True,
+    )
+
+
+def test_resolve_log_settings_defaults():
+    """
+    Missing or unknown logging settings should fall back to the defaults.
+    """
+    assert resolve_log_settings({}) == DEFAULT_LOG_SETTINGS
+    assert resolve_log_settings({"logging": {"backend": "nope"}})["backend"] == "rotating"
+
+
+def test_resolve_log_settings_reads_table():
+    """
+    The [logging] table should override backend and rotation settings.
+    """
+    settings = resolve_log_settings({"logging": {"backend": "OFF", "rotate_size": 10, "rotate_backups": 1}})
+    assert settings["backend"] == "off"
+    assert settings["rotate_size"] == 10
+    assert settings["rotate_backups"] == 1
+
+
+def test_import_has_no_side_effects(tmp_path):
+    """
+    Importing the logger must not parse config, create directories or open files.
+    """
+    _run("import chroniq.logger", tmp_path)
+    assert not (tmp_path / "data").exists()
+
+
+def test_rotating_backend_flushes_at_exit(tmp_path):
+    """
+    Records logged through the queue should be on disk once the process exits.
+    """
+    _run("from chroniq.logger import activity_log; activity_log.info('hello rotating')", tmp_path)
+    content = (tmp_path / "data" / "logs" / "activity.log").read_text(encoding="utf-8")
+    assert "hello rotating" in content
+    assert not (tmp_path / "data" / "logs" / "chroniq.log").exists()
+
+
+def test_buffered_backend_flushes_at_exit(tmp_path):
+    """
+    The buffered backend should hold records in memory and write them at exit.
+    """
+    (tmp_path / ".chroniq.toml").write_text('[logging]\nbackend = "buffered"\n', encoding="utf-8")
+    _run("from chroniq.logger import system_log; system_log.info('hello buffered')", tmp_path)
+    content = (tmp_path / "data" / "logs" / "chroniq.log").read_text(encoding="utf-8")
+    assert "hello buffered" in content
+
+
+def test_off_backend_skips_disk(tmp_path):
+    """
+    With backend = "off" nothing is written to disk, but warnings still reach stderr.
+    """
+    (tmp_path / ".chroniq.toml").write_text('[logging]\nbackend = "off"\n', encoding="utf-8")
+    result = _run(
+        "from chroniq.logger import system_log; system_log.info('quiet'); system_log.warning('loud')",
+        tmp_path,
+    )
+    assert not (tmp_path / "data").exists()
+    assert "loud" in result.stderr
+    assert "quiet" not in result.stderr
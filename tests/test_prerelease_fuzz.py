@@ -0,0 +1,83 @@
+# tests/test_prerelease_fuzz.py
+
+import random
+import string
+import time
+
+from chroniq.core import SemVer, Version, next_prerelease, promote_prerelease, split_prerelease, validate_label
+from chroniq.errors import InvalidVersionError
+
+# Weighted towards the characters that used to be interpolated into a regex
+ALPHABET = string.ascii_letters + string.digits + "-" + "." * 6 + "+*?()[]{}|\\^$" + "a" * 10
+
+
+def random_text(rng, max_length):
+    return "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, max_length)))
+
+
+def test_random_labels_and_prereleases_never_misbehave():
+    """
+    For thousands of random (prerelease, label) pairs, bumping either raises
+    InvalidVersionError or yields a valid version whose counter follows the rules.
+    """
+    rng = random.Random(2024)
+    for _ in range(5000):
+        prerelease, label = random_text(rng, 30), random_text(rng, 12)
+        try:
+            validate_label(label)
+        except InvalidVersionError:
+            try:
+                next_prerelease(prerelease, label)
+            except InvalidVersionError:
+                continue
+            raise AssertionError(f"invalid label {label!r} was accepted")
+
+        result = next_prerelease(prerelease, label)
+        current, number = split_prerelease(prerelease)
+        expected = number + 1 if number is not None and current == label else 1
+        assert result == f"{label}.{expected}"
+        assert str(Version.parse(f"1.0.0-{result}")) == f"1.0.0-{result}"
+
+
+def test_pathological_inputs_run_in_linear_time():
+    """
+    Inputs that make a backtracking regex explode (nested quantifiers against
+    long near-matches) take no longer than ordinary ones.
+    """
+    hostile = [
+        ("a" * 50_000 + "!", "(a+)+"),
+        ("a" * 50_000 + ".1", "a" * 50_000),
+        ("rc" * 25_000 + ".9", "rc+"),
+        ("x." * 25_000 + "1", "x." * 24_999 + "x"),
+    ]
+    for prerelease, label in hostile:
+        start = time.perf_counter()
+        try:
+            next_prerelease(prerelease, label)
+        except InvalidVersionError:
+            pass
+        try:
+            promote_prerelease(prerelease, ("alpha", "beta", "rc"))
+        except ValueError:
+            pass
+        assert time.perf_counter() - start < 0.5
+
+    assert next_prerelease("a" * 50_000 + ".1", "a" * 50_000) == "a" * 50_000 + ".2"
+
+
+def test_bump_pre_through_promotion_round_trip():
+    """
+    Random sequences of pre/promote bumps always produce increasing versions.
+    """
+    rng = random.Random(7)
+    for _ in range(200):
+        version = SemVer(1, 0, 0, "alpha.1")
+        previous = Version.from_semver(version)
+        while version.prerelease:
+            if rng.random() < 0.6:
+                version.bump_prerelease(split_prerelease(version.prerelease)[0])
+            else:
+                version.promote()
+            current = Version.from_semver(version)
+            assert current > previous
+            previous = current
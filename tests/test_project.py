@@ -0,0 +1,137 @@
+# tests/test_project.py
+
+import pytest
+
+from chroniq import dcli
+from chroniq.project import ChroniqProject, ProjectError
+from tests.helpers import make_project
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A ChroniqProject on a released 1.0.0; the cwd is left alone."""
+    return ChroniqProject(make_project(tmp_path, released=True))
+
+
+def test_bump_add_entries_and_history(project):
+    """
+    Bumps and entries go to the project root, never the cwd, and show up in history.
+    """
+    assert project.bump("minor", message="New API") == "1.1.0"
+    assert project.bump() == "1.1.1"
+    assert project.add_entries(["Faster startup", "  ", "Fixed paths"]) == "1.1.1"
+    assert project.add_entries([]) is None
+
+    assert project.version == "1.1.1"
+    assert [(r.old_version, r.new_version) for r in project.history()] == [("1.1.0", "1.1.1"), ("1.0.0", "1.1.0")]
+    assert len(project.history(limit=1)) == 1
+
+    text = (project.root / "CHANGELOG.md").read_text(encoding="utf-8")
+    assert "## [1.1.1]" in text
+    assert text.endswith("- Faster startup\n- Fixed paths\n")
+    assert project.changelog.has_version("1.1.0")
+
+
+def test_version_is_cached_until_the_file_changes(project, monkeypatch):
+    """
+    Repeated reads only stat version.txt; an outside edit is still picked up.
+    """
+    assert project.version == "1.0.0"
+
+    reads = []
+    real_read = type(project.version_path).read_text
+    monkeypatch.setattr(type(project.version_path), "read_text", lambda self, *a, **k: reads.append(self) or real_read(self, *a, **k))
+
+    for _ in range(100):
+        assert project.version == "1.0.0"
+    assert reads == []
+
+    (project.root / "version.txt").write_text("2.0.0-rc.1", encoding="utf-8")
+    assert project.version == "2.0.0-rc.1"
+
+
+def test_rollback_and_audit(project):
+    """
+    rollback() undoes bumps without prompting; audit() returns findings instead of printing.
+    """
+    project.bump("patch", message="Fix")
+    project.bump("patch", message="Another fix")
+
+    assert project.audit().ok
+    removed = project.rollback(steps=2)
+    assert [heading.split(" - ")[0] for heading in removed] == ["## [1.0.2]", "## [1.0.1]"]
+    assert project.version == "1.0.0"
+    assert "1.0.1" not in (project.root / "CHANGELOG.md").read_text(encoding="utf-8")
+
+    with pytest.raises(ProjectError, match="No backup version"):
+        project.rollback()
+
+    (project.root / "version.txt").write_text("9.9.9", encoding="utf-8")
+    report = project.audit()
+    assert report.version == "9.9.9"
+    assert any("9.9.9 not found in changelog" in w for w in report.warnings)
+
+
+def test_invalid_bump_raises(project):
+    """
+    Bad input raises ProjectError and leaves the files alone.
+    """
+    with pytest.raises(ProjectError):
+        project.bump("sideways")
+    with pytest.raises(ProjectError):
+        project.bump("minor", pre="rc+")
+    with pytest.raises(ProjectError):
+        project.bump("promote")  # 1.0.0 is not a prerelease
+    assert project.version == "1.0.0"
+
+
+def test_lower_layer_failures_surface_as_project_error(project, monkeypatch):
+    """
+    Transaction, history-journal and I/O failures are wrapped in ProjectError with the original as the cause.
+    """
+    import chroniq.transaction as transaction
+    from chroniq.locking import locked
+
+    monkeypatch.setattr(transaction, "LOCK_TIMEOUT", 0.05)
+    with locked(project.root / transaction.LOCK_PATH, timeout=1):
+        with pytest.raises(ProjectError, match="Timed out") as excinfo:
+            project.bump("minor")
+        assert isinstance(excinfo.value.__cause__, transaction.TransactionError)
+        with pytest.raises(ProjectError, match="Timed out"):
+            project.add_entries(["Stuck"])
+
+    with pytest.raises(ProjectError, match="at most 64"):
+        project.bump("minor", pre="x" * 70)
+
+    project.bump("patch", message="Fix")
+
+    def disk_full(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("chroniq.rollback.restore_version", disk_full)
+    with pytest.raises(ProjectError, match="disk full") as excinfo:
+        project.rollback()
+    assert isinstance(excinfo.value.__cause__, OSError)
+
+
+def test_promote_follows_the_configured_chain(project):
+    """
+    `prerelease_chain` in .chroniq.toml replaces the default alpha → beta → rc.
+    """
+    (project.root / ".chroniq.toml").write_text('prerelease_chain = ["dev", "rc"]\n', encoding="utf-8")
+
+    assert project.bump("minor", pre="dev.1") == "1.1.0-dev.1"
+    assert project.bump("pre", pre="dev") == "1.1.0-dev.2"
+    assert project.bump("promote") == "1.1.0-rc.1"
+    assert project.bump("promote") == "1.1.0"
+
+
+def test_dcli_bump_version_uses_project_api(project, monkeypatch):
+    """
+    The legacy helper no longer crashes on the config tuple or waits on input().
+    """
+    monkeypatch.chdir(project.root)
+    monkeypatch.setattr("builtins.input", lambda *a: pytest.fail("input() must not be called"))
+
+    assert dcli.bump_version("major", silent=True, message="Breaking") == "2.0.0"
+    assert dcli.current_version() == "2.0.0"
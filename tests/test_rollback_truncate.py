@@ -0,0 +1,90 @@
+# tests/test_rollback_truncate.py
+
+import pytest
+
+from chroniq import changelog
+from chroniq.changelog import remove_version_section
+from chroniq.changelog_index import ChangelogIndex
+from chroniq.rollback import perform_rollback
+
+HEADER = "# Changelog\n\nAll notable changes to this project will be documented here.\n"
+
+
+@pytest.fixture
+def changelog_file(tmp_path, monkeypatch):
+    """A changelog with two appended sections, created from inside tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    path = tmp_path / "CHANGELOG.md"
+    path.write_text(HEADER, encoding="utf-8")
+    monkeypatch.setattr(changelog, "CHANGELOG_FILE", path)
+    changelog.add_entry("1.0.0", "First")
+    changelog.add_entry("1.1.0", "Second")
+    return path
+
+
+def test_truncates_the_appended_section(changelog_file, monkeypatch):
+    """
+    The last bump's section is cut at its recorded offset without rewriting the file.
+    """
+    before = changelog_file.read_bytes()
+    expected = before[:before.index(b"\n\n## [1.1.0]")]
+
+    def no_rewrite(*args, **kwargs):
+        raise AssertionError("changelog was rewritten instead of truncated")
+
+    monkeypatch.setattr(changelog, "remove_span", no_rewrite)
+
+    assert remove_version_section(changelog_file, "1.1.0").startswith("## [1.1.0]")
+    assert changelog_file.read_bytes() == expected
+    # The record now describes the previous append, ready for the next rollback
+    assert changelog.read_append_record(changelog_file)["version"] == "1.0.0"
+
+    # The sidecar index was updated in place and matches a fresh scan
+    index = ChangelogIndex.load(changelog_file)
+    assert index.entries == ChangelogIndex.build(changelog_file).entries
+    assert index.latest().version == "1.0.0"
+
+
+def test_edited_section_falls_back_to_rewrite(changelog_file):
+    """
+    If the section no longer matches its recorded hash, nothing is blindly truncated.
+    """
+    with open(changelog_file, "ab") as f:
+        f.write(b"- Hand-written note\n")
+
+    assert remove_version_section(changelog_file, "1.1.0") is not None
+
+    text = changelog_file.read_text(encoding="utf-8")
+    assert "## [1.1.0]" not in text
+    assert "Hand-written note" not in text
+    assert "## [1.0.0]" in text
+
+
+def test_unrecorded_version_is_found_by_heading(tmp_path):
+    """
+    Sections without an append record are removed by version, wherever they are.
+    """
+    path = tmp_path / "CHANGELOG.md"
+    path.write_text(
+        HEADER + "\n\n## [2.0.0] - 2025-04-01\n- Top\n\n\n## [1.0.0] - 2025-03-01\n- Bottom\n",
+        encoding="utf-8",
+    )
+
+    assert remove_version_section(path, "2.0.0") == "## [2.0.0] - 2025-04-01"
+    assert remove_version_section(path, "9.9.9") is None
+    assert path.read_text(encoding="utf-8") == HEADER + "\n\n## [1.0.0] - 2025-03-01\n- Bottom\n"
+
+
+def test_rollback_removes_latest_not_first(changelog_file):
+    """
+    `perform_rollback` drops the section the last bump appended.
+    """
+    (changelog_file.parent / "version.txt").write_text("1.1.0\n", encoding="utf-8")
+    (changelog_file.parent / ".version.bak").write_text("1.0.0\n", encoding="utf-8")
+
+    perform_rollback(rollback_version=False, yes=True)
+
+    text = changelog_file.read_text(encoding="utf-8")
+    assert "## [1.0.0]" in text
+    assert "## [1.1.0]" not in text
+    assert (changelog_file.parent / "version.txt").read_text(encoding="utf-8").strip() == "1.0.0"
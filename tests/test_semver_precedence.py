@@ -0,0 +1,162 @@
+# tests/test_semver_precedence.py
+
+import random
+
+import pytest
+
+from chroniq.audit import collect_audit
+from chroniq.changelog_index import ChangelogIndex
+from chroniq.core import SemVer
+
+# The precedence example from the SemVer 2.0 spec, plus numeric-vs-text cases
+ORDERED = [
+    "1.0.0-alpha",
+    "1.0.0-alpha.1",
+    "1.0.0-alpha.beta",
+    "1.0.0-beta",
+    "1.0.0-beta.2",
+    "1.0.0-beta.11",
+    "1.0.0-rc.1",
+    "1.0.0",
+    "1.9.0",
+    "1.10.0",
+    "2.0.0",
+]
+
+
+def test_sorting_follows_semver_precedence():
+    """
+    sorted() and SemVer.sort agree with the spec, whatever the input order.
+    """
+    versions = [SemVer.from_string(v) for v in ORDERED]
+    shuffled = versions[:]
+    random.Random(7).shuffle(shuffled)
+
+    assert [str(v) for v in sorted(shuffled)] == ORDERED
+    assert [str(v) for v in SemVer.sort(shuffled)] == ORDERED
+    assert str(max(shuffled)) == "2.0.0"
+    assert SemVer.sort(shuffled, reverse=True)[0] == SemVer(2, 0, 0)
+
+
+def test_equality_hashing_and_mutation():
+    """
+    Equal versions dedupe in sets; bumping in place updates the cached key.
+    """
+    assert len({SemVer.from_string("1.2.3"), SemVer(1, 2, 3), SemVer(1, 2, 4)}) == 2
+    assert SemVer(1, 0, 0) != "1.0.0"
+
+    version = SemVer(1, 9, 0)
+    other = SemVer(1, 10, 0)
+    assert version < other
+    version.bump_minor()
+    version.bump_minor()
+    assert version > other
+    assert version.sort_key == SemVer(1, 11, 0).sort_key
+
+
+def test_changelog_highest_and_audit_use_precedence(tmp_path):
+    """
+    The highest section is picked by precedence, and audit flags sections newer than version.txt.
+    """
+    (tmp_path / "version.txt").write_text("1.9.0", encoding="utf-8")
+    (tmp_path / "CHANGELOG.md").write_text(
+        "# Changelog\n\n## [1.10.0] - 2025-02-01\n- B\n\n## [1.9.0] - 2025-01-01\n- A\n\n## [Unreleased]\n- C\n",
+        encoding="utf-8",
+    )
+
+    assert ChangelogIndex.load(tmp_path / "CHANGELOG.md").highest().version == "1.10.0"
+
+    report = collect_audit(tmp_path, {}, "default")
+    assert report.highest_in_changelog == "1.10.0"
+    assert any("newer than the current version 1.9.0" in w for w in report.warnings)
+
+
+def test_version_is_immutable_and_bumps_return_new_instances():
+    """
+    Version has no __dict__, rejects assignment, and bumping leaves the original alone.
+    """
+    import pytest
+    from chroniq.core import Version
+
+    base = Version.from_string("1.4.2")
+    assert not hasattr(base, "__dict__")
+    with pytest.raises(AttributeError):
+        base.patch = 9
+
+    assert str(base.bump("patch")) == "1.4.3"
+    assert str(base.bump("minor", pre="rc.1")) == "1.5.0-rc.1"
+    assert str(base.bump("pre").bump("pre")) == "1.4.2-alpha.2"
+    assert str(base) == "1.4.2"
+
+    # Same precedence as the mutable type, so the two mix in sorts and sets
+    assert base == SemVer(1, 4, 2) and hash(base) == hash(SemVer(1, 4, 2))
+    assert base.to_semver() < base.bump("major")
+
+
+@pytest.mark.parametrize("start", ["1.4.2-alpha.1", "1.4.2-beta.3+build.7", "0.9.0-rc.2"])
+@pytest.mark.parametrize("level, pre", [
+    ("patch", None), ("minor", "rc.1"), ("major", None), ("pre", None), ("pre", "beta"), ("promote", None),
+])
+def test_apply_bump_follows_version_bump(start, level, pre):
+    """
+    The in-place SemVer bump used by the CLI and workspace gives exactly Version.bump's result.
+    """
+    from chroniq.bumper import apply_bump
+    from chroniq.core import Version
+
+    version = SemVer.from_string(start)
+    assert apply_bump(version, level, pre) is version
+    assert str(version) == str(Version.parse(start).bump(level, pre))
+
+    with pytest.raises(ValueError, match="Invalid bump level"):
+        apply_bump(SemVer.from_string(start), "sideways")
+
+
+def test_version_parse_interns_through_a_bounded_lru():
+    """
+    Repeated strings share one object; the table never grows past its bound.
+    """
+    from chroniq.core import Version, clear_intern_table, intern_stats
+
+    clear_intern_table()
+    assert Version.parse("2.0.0") is Version.parse("2.0.0")
+    assert Version.parse("2.0.0") is not Version.from_string("2.0.0")
+
+    for patch in range(5000):
+        Version.parse(f"9.9.{patch}")
+    hits, misses, maxsize, size = intern_stats()
+    assert size == maxsize
+    assert hits >= 2
+
+    results = Version.parse_many(["1.0.0", "bogus", "1.0.0"])
+    assert results[0] is results[2]
+    assert isinstance(results[1], ValueError)
+
+
+def test_build_metadata_is_parsed_kept_and_ignored_for_precedence():
+    """
+    `+build` metadata round-trips through both classes, doesn't affect
+    ordering, and is dropped by bumps.
+    """
+    import pickle
+
+    from chroniq.core import Version
+
+    semver = SemVer.from_string("2.1.0-rc.1+build.912")
+    assert (semver.prerelease, semver.build, str(semver)) == ("rc.1", "build.912", "2.1.0-rc.1+build.912")
+    assert SemVer.from_string("1.0.0+exp.sha.5114f85").build == "exp.sha.5114f85"
+
+    version = Version.parse("2.1.0+build.912")
+    assert version == Version.parse("2.1.0+build.7") == Version.parse("2.1.0")
+    assert version > Version.parse("2.1.0-rc.1+build.999")
+    assert pickle.loads(pickle.dumps(version)).build == "build.912"
+    assert str(Version.from_semver(semver).to_semver()) == "2.1.0-rc.1+build.912"
+    assert str(version.with_build("ci.3")) == "2.1.0+ci.3"
+
+    assert str(version.bump_patch()) == "2.1.1"
+    semver.bump_prerelease("rc")
+    assert str(semver) == "2.1.0-rc.2"
+
+    for bad in ["1.0.0+", "1.0.0+a+b", "1.0.0+ä", "1.0.0+build 1"]:
+        with pytest.raises(ValueError):
+            SemVer.from_string(bad)
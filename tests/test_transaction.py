@@ -0,0 +1,230 @@
+# tests/test_transaction.py
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from chroniq.changelog_index import ChangelogIndex
+from chroniq.cli import main
+from chroniq.history import HISTORY_PATH, VersionHistory
+from chroniq.locking import locked
+from chroniq.transaction import JOURNAL_PATH, LOCK_PATH, Transaction, TransactionError, recover
+from tests.helpers import HEADER
+
+def test_commit_publishes_all_writes(project):
+    """
+    Staged writes and appends land together, and the journal is cleaned up.
+    """
+    txn = Transaction(project)
+    txn.write_text(project / "version.txt", "1.1.0")
+    offset = txn.append_bytes(project / "CHANGELOG.md", b"\n\n## [1.1.0] - 2025-04-20\n- New\n")
+
+    # Nothing is visible before commit
+    assert (project / "version.txt").read_text(encoding="utf-8") == "1.0.0"
+    assert offset == len(HEADER.encode("utf-8"))
+
+    txn.commit()
+
+    assert (project / "version.txt").read_text(encoding="utf-8") == "1.1.0"
+    assert (project / "CHANGELOG.md").read_text(encoding="utf-8").endswith("- New\n")
+    assert not (project / JOURNAL_PATH).exists()
+    assert not list(project.glob(".*.txn"))
+
+
+def test_failed_commit_leaves_files_untouched(project, monkeypatch):
+    """
+    A failure before the commit point rolls staged appends back.
+    """
+    import chroniq.transaction as transaction
+
+    real_write_journal = transaction._write_journal
+
+    def fail_on_commit(path, state, *args, **kwargs):
+        if state == transaction.COMMITTED:
+            raise OSError("disk full")
+        return real_write_journal(path, state, *args, **kwargs)
+
+    monkeypatch.setattr(transaction, "_write_journal", fail_on_commit)
+
+    txn = Transaction(project)
+    txn.write_text(project / "version.txt", "1.1.0")
+    txn.append_bytes(project / "CHANGELOG.md", b"\n\n## [1.1.0]\n")
+
+    with pytest.raises(TransactionError):
+        txn.commit()
+
+    assert (project / "version.txt").read_text(encoding="utf-8") == "1.0.0"
+    assert (project / "CHANGELOG.md").read_text(encoding="utf-8") == HEADER
+    assert not (project / JOURNAL_PATH).exists()
+
+
+def _crash_journal(project, state, temp_content=b"1.1.0"):
+    """Leave behind what a process killed mid-commit would."""
+    changelog_path = project / "CHANGELOG.md"
+    size = changelog_path.stat().st_size
+    with open(changelog_path, "ab") as f:
+        f.write(b"\n\n## [1.1.0] - 2025-04-20\n- Half-written")
+
+    temp = project / ".version.txt.999.txn"
+    temp.write_bytes(temp_content)
+    journal = project / JOURNAL_PATH
+    journal.parent.mkdir(parents=True, exist_ok=True)
+    journal.write_text(json.dumps({
+        "state": state,
+        "replace": [[str(project / "version.txt"), str(temp)]],
+        "append": [[str(changelog_path), size]],
+    }), encoding="utf-8")
+
+
+def test_prepared_journal_is_durable_before_the_first_append(project, monkeypatch):
+    """
+    The `prepared` journal and its directory are fsynced before any staged byte is written.
+    """
+    import chroniq.transaction as transaction
+
+    events = []
+    real_write_journal = transaction._write_journal
+    real_fsync_dir = transaction._fsync_dir
+    changelog_size = (project / "CHANGELOG.md").stat().st_size
+
+    def record_journal(path, state, *args, sync, **kwargs):
+        events.append((state, sync))
+        return real_write_journal(path, state, *args, sync=sync, **kwargs)
+
+    def record_fsync_dir(path):
+        # Nothing has been appended yet when the journal's directory is synced
+        if not events[1:]:
+            events.append(("dir", (project / "CHANGELOG.md").stat().st_size == changelog_size))
+        return real_fsync_dir(path)
+
+    monkeypatch.setattr(transaction, "_write_journal", record_journal)
+    monkeypatch.setattr(transaction, "_fsync_dir", record_fsync_dir)
+
+    txn = Transaction(project)
+    txn.append_bytes(project / "CHANGELOG.md", b"\n\n## [1.1.0] - 2025-04-20\n- New\n")
+    txn.commit()
+
+    assert events[:3] == [(transaction.PREPARED, True), ("dir", True), (transaction.COMMITTED, True)]
+
+
+def test_recover_rolls_back_uncommitted(project):
+    """
+    A crash before the commit point is undone on the next start.
+    """
+    _crash_journal(project, "prepared")
+
+    assert recover(project) == "rolled back"
+    assert (project / "version.txt").read_text(encoding="utf-8") == "1.0.0"
+    assert (project / "CHANGELOG.md").read_text(encoding="utf-8") == HEADER
+    assert not list(project.glob(".*.txn"))
+    assert recover(project) is None
+
+
+def test_interleaved_appends_never_overwrite_a_committed_one(project):
+    """
+    A transaction staged before another one committed an append to the same
+    file fails instead of writing over the committed data.
+    """
+    first, second = Transaction(project), Transaction(project)
+    first.append_bytes(project / "CHANGELOG.md", b"\n\n## [A]\n")
+    second.append_bytes(project / "CHANGELOG.md", b"\n\n## [B]\n")
+    first.write_text(project / "version.txt", "1.1.0")
+
+    second.commit()
+    with pytest.raises(TransactionError, match="changed since"):
+        first.commit()
+
+    assert (project / "CHANGELOG.md").read_text(encoding="utf-8") == HEADER + "\n\n## [B]\n"
+    assert (project / "version.txt").read_text(encoding="utf-8") == "1.0.0"
+    assert not (project / JOURNAL_PATH).exists()
+    assert not list(project.glob(".*.txn"))
+
+
+def test_a_bump_that_lost_a_race_fails_instead_of_losing_the_winner(project, monkeypatch):
+    """
+    Two bumps that both read 1.0.0 can't both publish: the later commit sees
+    the history journal grew and fails, leaving the winner's bump intact.
+    """
+    from chroniq.bumper import commit_bump
+
+    real_commit = Transaction.commit
+
+    def racing_commit(self):
+        # Another process's bump lands between staging and commit
+        monkeypatch.setattr(Transaction, "commit", real_commit)
+        commit_bump(project, "1.0.0", "1.0.1", "Other fix")
+        real_commit(self)
+
+    monkeypatch.setattr(Transaction, "commit", racing_commit)
+    with pytest.raises(TransactionError, match="changed since"):
+        commit_bump(project, "1.0.0", "1.1.0", "Mine")
+
+    assert (project / "version.txt").read_text(encoding="utf-8") == "1.0.1"
+    assert [r.new_version for r in VersionHistory(project / HISTORY_PATH)] == ["1.0.1"]
+    assert "Mine" not in (project / "CHANGELOG.md").read_text(encoding="utf-8")
+
+
+def test_recover_leaves_a_journal_alone_while_its_commit_holds_the_lock(project, monkeypatch):
+    """
+    recover() doesn't block on, or roll back, a transaction another process is
+    committing, and a second commit waits for the lock instead of sharing the journal.
+    """
+    import chroniq.transaction as transaction
+
+    _crash_journal(project, "prepared")
+    monkeypatch.setattr(transaction, "LOCK_TIMEOUT", 0.05)
+
+    # A second open file description conflicts with this one, like another process would
+    with locked(project / LOCK_PATH, timeout=1):
+        assert recover(project) is None
+        assert (project / JOURNAL_PATH).exists()
+        assert "Half-written" in (project / "CHANGELOG.md").read_text(encoding="utf-8")
+
+        txn = Transaction(project)
+        txn.write_text(project / "version.txt", "1.2.0")
+        with pytest.raises(TransactionError, match="Timed out"):
+            txn.commit()
+
+    assert recover(project) == "rolled back"
+    assert (project / "CHANGELOG.md").read_text(encoding="utf-8") == HEADER
+
+
+def test_recover_rolls_forward_committed(project):
+    """
+    A crash after the commit point is finished on the next start.
+    """
+    _crash_journal(project, "committed")
+
+    assert recover(project) == "rolled forward"
+    assert (project / "version.txt").read_text(encoding="utf-8") == "1.1.0"
+    assert "Half-written" in (project / "CHANGELOG.md").read_text(encoding="utf-8")
+
+
+def test_cli_startup_notices_keep_json_stdout_clean(project):
+    """
+    The banner and the recovery notice go to stderr, so --json output parses as-is.
+    """
+    _crash_journal(project, "prepared")
+
+    result = CliRunner().invoke(main, ["versions", "--json"])
+
+    assert result.exit_code == 0, result.output
+    assert "Recovered an interrupted bump (rolled back)" in result.stderr
+    assert json.loads(result.stdout)["versions"] == ["1.0.0"]
+
+
+def test_bump_writes_version_changelog_and_history(project):
+    """
+    `chroniq bump` commits version, changelog and history record in one transaction.
+    """
+    result = CliRunner().invoke(main, ["bump", "minor"], input="y\nShiny feature\n")
+
+    assert result.exit_code == 0, result.output
+    assert (project / "version.txt").read_text(encoding="utf-8").strip() == "1.1.0"
+    record = VersionHistory(project / HISTORY_PATH).last()
+    assert (record.old_version, record.new_version) == ("1.0.0", "1.1.0")
+    assert record.changelog_offset == len(HEADER.encode("utf-8"))
+    assert "## [1.1.0]" in (project / "CHANGELOG.md").read_text(encoding="utf-8")
+    assert ChangelogIndex.load(project / "CHANGELOG.md").latest().version == "1.1.0"
+    assert not (project / JOURNAL_PATH).exists()
@@ -0,0 +1,53 @@
+# tests/test_utils.py
+
+import pytest
+
+from chroniq.utils import atomic_write, atomic_writer
+
+
+def test_atomic_write_replaces_whole_files_or_nothing(tmp_path):
+    """
+    A write either publishes the complete new content or leaves the old file
+    and no temp file behind; missing parent directories are created.
+    """
+    path = tmp_path / ".chroniq" / "cache" / "state.json"
+    atomic_write(path, '{"n": 1}')
+    atomic_write(path, b'{"n": 2}', sync=True)
+    assert path.read_text(encoding="utf-8") == '{"n": 2}'
+
+    with pytest.raises(RuntimeError):
+        with atomic_writer(path) as f:
+            f.write(b'{"n": 3, "tru')
+            raise RuntimeError("crashed mid-write")
+
+    assert path.read_text(encoding="utf-8") == '{"n": 2}'
+    assert [p.name for p in path.parent.iterdir()] == ["state.json"]
+
+
+def test_threads_writing_one_target_never_share_a_temp_file(tmp_path):
+    """
+    Concurrent writers in one process each publish a complete file; none
+    of them loses its temp file to another thread's cleanup.
+    """
+    import threading
+
+    path = tmp_path / "state.json"
+    errors = []
+
+    def writer(n):
+        try:
+            for _ in range(200):
+                atomic_write(path, f'{{"writer": {n}}}' * 50)
+        except OSError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    text = path.read_text(encoding="utf-8")
+    assert text == text[:len(text) // 50] * 50
+    assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
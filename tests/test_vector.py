@@ -0,0 +1,79 @@
+# tests/test_vector.py
+
+import random
+
+import pytest
+
+from chroniq.constraints import compile_constraint
+from chroniq.core import SemVer, Version
+from chroniq.errors import InvalidVersionError
+from chroniq.vector import HAVE_NUMPY, VersionArray
+
+BACKENDS = [
+    pytest.param(False, id="python"),
+    pytest.param(True, id="numpy", marks=pytest.mark.skipif(not HAVE_NUMPY, reason="NumPy not installed")),
+]
+
+
+def random_versions(count, seed=7):
+    rng = random.Random(seed)
+    labels = ["", "", "", "alpha", "alpha.2", "alpha.10", "beta", "rc.1", "0", "x-y.3"]
+    versions = []
+    for _ in range(count):
+        version = f"{rng.randint(0, 12)}.{rng.randint(0, 30)}.{rng.randint(0, 300)}"
+        label = rng.choice(labels)
+        versions.append(f"{version}-{label}" if label else version)
+    return versions
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_bulk_operations_agree_with_semver_precedence(use_numpy):
+    """
+    sort, max, range filters and latest-per-major match the scalar Version results.
+    """
+    versions = random_versions(2000)
+    array = VersionArray(versions, use_numpy=use_numpy)
+    assert array.uses_numpy is use_numpy
+
+    expected = sorted(versions, key=lambda v: Version.parse(v).sort_key)
+    assert [Version.parse(v).sort_key for v in array.sort()] == [Version.parse(v).sort_key for v in expected]
+    assert array.sort(reverse=True)[0] == array.max() == max(versions, key=lambda v: Version.parse(v).sort_key)
+
+    for text in ["^3.4", "~7.2.100", ">=1.0.0,<2.0.0-0", "<=0.5 || >11.29", ">=4.1.0-alpha.3,<4.1.0", "^99", ">=0.0.0-0"]:
+        constraint = compile_constraint(text)
+        wanted = [v for v in expected if constraint.matches(v)]
+        assert [Version.parse(v).sort_key for v in array.filter(text)] == [Version.parse(v).sort_key for v in wanted]
+        assert array.filter(constraint, sort=False) == [v for v in versions if constraint.matches(v)]
+
+    latest = {}
+    for version in expected:
+        latest[Version.parse(version).major] = version
+    assert {m: Version.parse(v).sort_key for m, v in array.latest_per_major().items()} == \
+        {m: Version.parse(v).sort_key for m, v in latest.items()}
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_mixed_inputs_wide_fields_and_errors(use_numpy):
+    """
+    SemVer/Version objects are accepted, huge components still order correctly,
+    empty batches are fine and invalid strings raise InvalidVersionError.
+    """
+    array = VersionArray([SemVer(1, 2, 3), Version.parse("1.2.3-rc.1"), "20240101.0.0", "1.10.0"], use_numpy=use_numpy)
+    assert array.sort() == ["1.2.3-rc.1", "1.2.3", "1.10.0", "20240101.0.0"]
+    assert array.latest_per_major() == {1: "1.10.0", 20240101: "20240101.0.0"}
+    assert array.filter(">=2.0.0") == ["20240101.0.0"]
+
+    empty = VersionArray([], use_numpy=use_numpy)
+    assert (len(empty), empty.max(), empty.sort(), empty.latest_per_major()) == (0, None, [], {})
+
+    with pytest.raises(InvalidVersionError):
+        VersionArray(["1.0.0", "v2"], use_numpy=use_numpy)
+
+
+def test_batches_too_wide_for_uint64_fall_back_to_python_ints():
+    """
+    When the packed key needs more than 64 bits, the pure-Python backend is used.
+    """
+    array = VersionArray([f"{2**40}.{2**20}.{2**10}", "1.0.0"])
+    assert not array.uses_numpy
+    assert array.max() == f"{2**40}.{2**20}.{2**10}"
@@ -0,0 +1,72 @@
+# tests/test_workspace.py
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from chroniq.cli import main
+from chroniq.history import HISTORY_PATH, VersionHistory
+from chroniq.discovery import discover_packages
+from chroniq.workspace import bump_workspace
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """A workspace with three healthy packages and one with a broken version.txt."""
+    monkeypatch.chdir(tmp_path)
+    for name, version in [("core", "1.0.0"), ("api", "0.4.2"), ("web", "2.1.0-rc.1")]:
+        package = tmp_path / "packages" / name
+        package.mkdir(parents=True)
+        (package / "version.txt").write_text(version, encoding="utf-8")
+
+    broken = tmp_path / "packages" / "broken"
+    broken.mkdir()
+    (broken / "version.txt").write_text("not a version", encoding="utf-8")
+
+    # Hidden directories are never packages
+    (tmp_path / ".venv" / "lib").mkdir(parents=True)
+    (tmp_path / ".venv" / "lib" / "version.txt").write_text("9.9.9", encoding="utf-8")
+    return tmp_path
+
+
+def test_discover_packages_skips_hidden_dirs(workspace):
+    """
+    Every directory with a version.txt is found, except inside hidden directories.
+    """
+    names = [p.name for p in discover_packages(workspace)]
+    assert names == ["api", "broken", "core", "web"]
+
+
+def test_bump_workspace_reports_each_package(workspace):
+    """
+    Packages are bumped independently; one failure doesn't stop the others.
+    """
+    packages = discover_packages(workspace)
+    report = bump_workspace(workspace, packages, level="minor", message="Shared release", jobs=4)
+
+    by_name = {r.package: r for r in report.results}
+    assert by_name["packages/core"].new_version == "1.1.0"
+    assert by_name["packages/api"].new_version == "0.5.0"
+    assert not by_name["packages/broken"].ok
+    assert "Invalid version format" in by_name["packages/broken"].error
+    assert (report.succeeded, report.failed) == (3, 1)
+    assert report.wall_time > 0
+
+    core = workspace / "packages" / "core"
+    assert (core / "version.txt").read_text(encoding="utf-8") == "1.1.0"
+    assert "## [1.1.0]" in (core / "CHANGELOG.md").read_text(encoding="utf-8")
+    assert VersionHistory(core / HISTORY_PATH).last().old_version == "1.0.0"
+
+
+def test_cli_workspace_json_summary(workspace):
+    """
+    `bump --workspace --json` prints a single JSON document and never prompts.
+    """
+    result = CliRunner().invoke(main, ["bump", "patch", "--workspace", "--json", "-p", "packages/core", "-p", "packages/web"])
+
+    assert result.exit_code == 0, result.output
+    summary = json.loads(result.stdout)
+    assert [p["new_version"] for p in summary["packages"]] == ["1.0.1", "2.1.1"]
+    assert summary["succeeded"] == 2 and summary["failed"] == 0
+    assert "wall_time" in summary